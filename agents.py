@@ -1,15 +1,123 @@
+import json
 from crewai import Agent
 from langchain.tools import Tool
-from linkedin_scraper import linkedin_job_search_tool
+from linkedin_scraper import linkedin_job_search_tool, linkedin_batch_search_tool
+from ingest import upsert_jobs, run_coroutine_sync
+from ranking import rank_jobs
+from clustering import cluster_jobs
+from skills import extract_skills, skill_gap
+from resume_cache import process_resume
+
+def _parse_job_data(job_data):
+    """Agents may hand over the jobs as a JSON string, a single job or a list; returns a list or None"""
+    if isinstance(job_data, str):
+        try:
+            job_data = json.loads(job_data)
+        except ValueError:
+            return None
+    if isinstance(job_data, dict):
+        job_data = [job_data]
+    return job_data if isinstance(job_data, list) else None
 
-# Placeholder tools for other agents
 def database_store_tool(job_data):
-    """Placeholder tool for storing jobs in database"""
-    return {"status": "success", "message": "Jobs stored in database (placeholder)"}
+    """Store scraped jobs in the database (bulk upsert, deduplicated by job URL)"""
+    job_data = _parse_job_data(job_data)
+    if job_data is None:
+        return {"status": "error", "message": "Job data must be a job dict or a list of job dicts"}
+    counts = run_coroutine_sync(lambda session_factory: upsert_jobs(job_data, session_factory))
+    return {
+        "status": "success",
+        "message": f"Stored {counts['inserted']} new and {counts['updated']} updated jobs in the database",
+        **counts
+    }
+
+def resume_optimize_tool(resume_path, job_data, top_k=10):
+    """Rank jobs by relevance to the resume (TF-IDF, no LLM call per job) with shared terms and skill gaps"""
+    jobs = _parse_job_data(job_data)
+    if jobs is None:
+        return {"status": "error", "message": "Job data must be a job dict or a list of job dicts"}
+    try:
+        # Parsed once per distinct resume content
+        resume = process_resume(resume_path)
+    except (OSError, ValueError, RuntimeError) as e:
+        return {"status": "error", "message": f"Could not read resume: {str(e)}"}
+    ranked = rank_jobs(resume["text"], jobs, top_k)
+    resume_skills = resume["skills"]
+    return {
+        "status": "success",
+        "message": f"Ranked {len(jobs)} jobs against the resume; the top {len(ranked)} are listed best first",
+        "matches": [
+            {
+                "title": match["job"].get("title"),
+                "company": match["job"].get("company"),
+                "url": match["job"].get("url"),
+                "score": round(match["score"], 4),
+                "matched_terms": match["matched_terms"],
+                # Stored jobs carry their skills; freshly scraped ones are scanned once here
+                "skill_gap": skill_gap(
+                    match["job"].get("skills") or extract_skills(
+                        f"{match['job'].get('title') or ''} {match['job'].get('description') or ''}"
+                    ),
+                    resume_skills
+                )
+            }
+            for match in ranked
+        ]
+    }
 
-def resume_optimize_tool(resume_path, job_data):
-    """Placeholder tool for resume optimization"""
-    return {"status": "success", "message": "Resume optimized (placeholder)"}
+def resume_optimize_request_tool(request):
+    """Single-input form of resume_optimize_tool for agents: {"resume_path", "job_data", "top_k"} as JSON or a dict"""
+    if isinstance(request, str):
+        try:
+            request = json.loads(request)
+        except ValueError:
+            request = None
+    if not isinstance(request, dict) or not request.get("resume_path"):
+        return {"status": "error", "message": "Request must be a JSON object with resume_path, job_data and optional top_k"}
+    try:
+        top_k = int(request.get("top_k") or 10)
+    except (TypeError, ValueError):
+        return {"status": "error", "message": "top_k must be a number"}
+    return resume_optimize_tool(request["resume_path"], request.get("job_data"), top_k)
+
+def batch_job_search_tool(searches):
+    """Run several (title, location, experience) searches in parallel; results are merged and tagged by search"""
+    if isinstance(searches, str):
+        try:
+            searches = json.loads(searches)
+        except ValueError:
+            return {"status": "error", "message": "Searches must be a list of {job_title, location, experience_level}"}
+    if isinstance(searches, dict):
+        searches = [searches]
+    jobs = linkedin_batch_search_tool(searches)
+    return {"status": "success", "message": f"Found {len(jobs)} unique jobs across {len(searches)} searches", "jobs": jobs}
+
+def job_cluster_tool(job_data):
+    """Group jobs into categories, each with a requirements profile, so resumes are optimized per category"""
+    jobs = _parse_job_data(job_data)
+    if jobs is None:
+        return {"status": "error", "message": "Job data must be a job dict or a list of job dicts"}
+    clusters = cluster_jobs(jobs)
+    return {
+        "status": "success",
+        "message": f"Grouped {len(jobs)} jobs into {len(clusters)} categories",
+        "clusters": [
+            {
+                "category": cluster["label"],
+                "requirements_profile": cluster["profile"],
+                "size": cluster["size"],
+                "representative_job": {
+                    "title": cluster["representative"].get("title"),
+                    "company": cluster["representative"].get("company"),
+                    "url": cluster["representative"].get("url")
+                },
+                "job_urls": [job.get("url") for job in cluster["jobs"]]
+            }
+            for cluster in clusters
+        ]
+    }
+
+# Placeholder tools for other agents
 
 def referral_scan_tool(job_data):
     """Placeholder tool for scanning referral network"""
@@ -22,6 +130,12 @@ linkedin_tool = Tool(
     func=linkedin_job_search_tool
 )
 
+batch_search_tool = Tool(
+    name="linkedin_batch_job_search",
+    description="Search LinkedIn for many job title / location / experience level combinations at once",
+    func=batch_job_search_tool
+)
+
 database_tool = Tool(
     name="database_store",
     description="Store job postings in the database",
@@ -30,8 +144,17 @@ database_tool = Tool(
 
 resume_tool = Tool(
     name="resume_optimize",
-    description="Optimize resume for specific job postings",
-    func=resume_optimize_tool
+    description=(
+        "Rank job postings by relevance to a resume and list the terms each shares with it. "
+        'Input: a JSON object {"resume_path": "...", "job_data": [job, ...], "top_k": 10}'
+    ),
+    func=resume_optimize_request_tool
+)
+
+cluster_tool = Tool(
+    name="job_cluster",
+    description="Group job postings into categories, each with a requirements profile and a representative job",
+    func=job_cluster_tool
 )
 
 referral_tool = Tool(
@@ -43,7 +166,7 @@ referral_tool = Tool(
 # Agent 1: Job Search
 class JobSearchAgent:
     def __init__(self):
-        self.tools = [linkedin_tool]
+        self.tools = [linkedin_tool, batch_search_tool]
         self.agent = Agent(
             role="Job Search Specialist",
             goal="Find relevant job postings on LinkedIn based on user criteria",
@@ -73,7 +196,7 @@ class DatabaseAgent:
 # Agent 3: Resume Optimization
 class ResumeOptimizationAgent:
     def __init__(self):
-        self.tools = [resume_tool]
+        self.tools = [cluster_tool, resume_tool]
         self.agent = Agent(
             role="Resume Optimizer",
             goal="Rewrite resumes to align with job listings and store them.",
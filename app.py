@@ -5,14 +5,37 @@ import json
 from dotenv import load_dotenv
 from crew import JobHunterCrew
 from utils import save_uploaded_file
-from linkedin_scraper import linkedin_job_search_tool
+from db import init_db
+from job_stream import aiter_linkedin_jobs
+from job_query import query_jobs
+from fulltext import search_job_descriptions
+from saved_searches import get_saved_search, is_fresh, list_saved_searches, save_search, saved_search_results
 import asyncio
+import time
+from concurrent.futures import ThreadPoolExecutor
 from chainlit import Action
 
 load_dotenv()
 
+# Scrapes run on a bounded pool so they never block the event loop and a burst
+# of chat sessions cannot launch an unbounded number of browsers
+SEARCH_EXECUTOR = ThreadPoolExecutor(
+    max_workers=int(os.getenv("SEARCH_WORKERS", "2")),
+    thread_name_prefix="job-search"
+)
+# Minimum seconds between progress / partial-results message updates
+PROGRESS_UPDATE_INTERVAL = 0.5
+
+_db_ready = False
+
 @cl.on_chat_start
 async def start():
+    # Create the tables once per process so scraped jobs can be stored
+    global _db_ready
+    if not _db_ready:
+        await init_db()
+        _db_ready = True
+
     # Check if we've already shown the welcome message
     if not cl.user_session.get("welcome_shown"):
         jobs_per_page = cl.user_session.get("jobs_per_page", 10)
@@ -24,7 +47,9 @@ async def start():
 Let me set up LinkedIn authentication for better job search results...
 
 **Jobs per page:** {jobs_per_page} (change anytime by sending 'jobs per page: N')
-**Sort by:** {sort_field} ({sort_dir}) (change anytime by sending 'sort by <field> [asc|desc]')"""
+**Sort by:** {sort_field} ({sort_dir}) (change anytime by sending 'sort by <field> [asc|desc]')
+**Stored jobs:** send 'stored jobs [keywords] [at <company>]' to browse jobs from earlier searches, or 'search jobs: kubernetes AND rust' to search their descriptions
+**Saved searches:** every search is saved and kept fresh in the background (`python scheduler.py run`) until it goes unused for a while; repeat it to see what's new, or send 'saved searches' to list them"""
         await cl.Message(content=welcome_message).send()
         
         # Check if LinkedIn cookies exist
@@ -46,7 +71,7 @@ Let me set up LinkedIn authentication for better job search results...
         await cl.Message(content="📝 **How to use:** Enter your job search criteria (e.g., 'Software Engineer, San Francisco, CA, Senior, Tech Company')").send()
         cl.user_session.set("welcome_shown", True)
 
-async def render_jobs_table(jobs):
+def build_jobs_table(jobs):
     headers = [
         "Job Title",
         "Company",
@@ -60,7 +85,81 @@ async def render_jobs_table(jobs):
         location = job['location']
         posted = job['posted_time']
         table_md += f"| {title_link} | {company} | {location} | {posted} |\n"
-    await cl.Message(content=table_md).send()
+    return table_md
+
+async def render_jobs_table(jobs):
+    await cl.Message(content=build_jobs_table(jobs)).send()
+
+async def show_stored_jobs(cursor=None, **filters):
+    """Render one page of jobs from the database in the session's sort order"""
+    query = {
+        "sort": cl.user_session.get("sort_field", "posted_time"),
+        "direction": cl.user_session.get("sort_dir", "asc"),
+        "limit": cl.user_session.get("jobs_per_page", 10),
+        **filters
+    }
+    try:
+        page = await query_jobs(cursor=cursor, **query)
+    except ValueError:
+        # The sort order changed since the last page: start over
+        page = await query_jobs(**query)
+    cl.user_session.set("stored_jobs_query", filters)
+    cl.user_session.set("stored_jobs_cursor", page["next_cursor"])
+    if not page["jobs"]:
+        await cl.Message(content="❌ No stored jobs match.").send()
+        return
+    await render_jobs_table(page["jobs"])
+    if page["next_cursor"]:
+        await cl.Message(content="➡️ Send 'more' for the next page.").send()
+
+async def show_saved_search(search):
+    """Answer a saved search from the database, flagging jobs found since the last visit"""
+    results = await saved_search_results(search["id"], limit=cl.user_session.get("jobs_per_page", 10))
+    jobs = [dict(job, title=f"🆕 {job['title']}") if job["new"] else job for job in results["jobs"]]
+    refreshed = search["last_run_at"].strftime("%Y-%m-%d %H:%M UTC")
+    if not jobs:
+        await cl.Message(content=f"❌ No jobs found for this saved search yet (last refreshed {refreshed}).").send()
+        return
+    await cl.Message(
+        content=f"✅ {results['new_count']} new jobs since your last visit (saved search, last refreshed {refreshed}):"
+    ).send()
+    await render_jobs_table(jobs)
+
+async def run_search_with_progress(progress_msg, max_jobs, **search_kwargs):
+    """Run a job search off the event loop and stream its jobs into the chat.
+
+    Jobs arrive through aiter_linkedin_jobs as soon as they are scraped; the
+    progress message is updated and a partial results table is rendered as
+    they come in, both throttled to PROGRESS_UPDATE_INTERVAL.
+    """
+    streamed = []
+    partial_msg = None
+    last_update = 0.0
+
+    async def show_progress(force=False):
+        nonlocal partial_msg, last_update
+        now = time.monotonic()
+        if not streamed or (not force and now - last_update < PROGRESS_UPDATE_INTERVAL):
+            return
+        last_update = now
+        percent = min(99, len(streamed) * 100 // max(1, max_jobs))
+        progress_msg.content = f"⏳ Searching for jobs... [{percent}%] ({len(streamed)} found so far)"
+        await progress_msg.update()
+        table_md = "**Results so far:**\n\n" + build_jobs_table(streamed)
+        if partial_msg is None:
+            partial_msg = await cl.Message(content=table_md).send()
+        else:
+            partial_msg.content = table_md
+            await partial_msg.update()
+
+    async for job in aiter_linkedin_jobs(max_jobs=max_jobs, executor=SEARCH_EXECUTOR, **search_kwargs):
+        streamed.append(job)
+        await show_progress()
+    await show_progress(force=True)
+
+    progress_msg.content = f"✅ Search complete [100%] ({len(streamed)} jobs)"
+    await progress_msg.update()
+    return streamed
 
 @cl.on_message
 async def main(message: cl.Message):
@@ -92,6 +191,44 @@ async def main(message: cl.Message):
         else:
             await cl.Message(content="❌ Usage: sort by <field> [asc|desc]").send()
         return
+    # Browse jobs stored by earlier searches: 'stored jobs [title keywords] [at <company>]'
+    if message.content.lower().startswith("stored jobs"):
+        keywords, _, company = message.content[len("stored jobs"):].partition(" at ")
+        await show_stored_jobs(keywords=keywords.strip() or None, company=company.strip() or None)
+        return
+    if message.content.strip().lower() == "more" and cl.user_session.get("stored_jobs_cursor"):
+        await show_stored_jobs(cursor=cl.user_session.get("stored_jobs_cursor"),
+                               **cl.user_session.get("stored_jobs_query", {}))
+        return
+    if message.content.strip().lower() == "saved searches":
+        searches = await list_saved_searches()
+        if not searches:
+            await cl.Message(content="ℹ️ No saved searches yet. Every search you run is saved.").send()
+            return
+        lines = []
+        for search in searches:
+            schedule = f"every {search['interval_minutes']} min" if search["enabled"] else "expired, search again to resume"
+            refreshed = search["last_run_at"].strftime("%Y-%m-%d %H:%M") if search["last_run_at"] else "not yet"
+            lines.append(f"- **{search['job_title']}** ({search['location'] or 'any location'}): {schedule}, last refreshed {refreshed}")
+        await cl.Message(content="📌 **Saved searches:**\n" + "\n".join(lines)).send()
+        return
+    # Full-text search over stored descriptions, no browser: 'search jobs: kubernetes AND rust'
+    if message.content.lower().startswith("search jobs:"):
+        query = message.content.split(":", 1)[1].strip()
+        try:
+            jobs = await search_job_descriptions(query, limit=cl.user_session.get("jobs_per_page", 10))
+        except ValueError as e:
+            await cl.Message(content=f"❌ {str(e)}. Try e.g. 'search jobs: kubernetes AND rust'").send()
+            return
+        if not jobs:
+            await cl.Message(content=f"❌ No stored jobs match '{query}'.").send()
+            return
+        await cl.Message(content=f"✅ Best {len(jobs)} stored jobs for '{query}':").send()
+        await render_jobs_table(jobs)
+        snippets = "\n".join(f"- **{job['title']}**: {job['snippet']}" for job in jobs if job["snippet"])
+        if snippets:
+            await cl.Message(content=snippets).send()
+        return
     # Get the job search criteria from user input
     job_criteria = message.content
     
@@ -141,6 +278,17 @@ async def main(message: cl.Message):
         
         # Debug: Show parsed values
         await cl.Message(content=f"[DEBUG] Parsed job_title: '{job_title}', location: '{location}', experience_level: '{experience_level}'").send()
+
+        # Searches the scheduler keeps fresh are answered from the database, without scraping;
+        # disabled or overdue ones (e.g. the scheduler is not running) are scraped live
+        saved = await get_saved_search(job_title, location, experience_level)
+        if saved and is_fresh(saved):
+            progress_msg.content = "✅ Answered from your saved search"
+            await progress_msg.update()
+            await show_saved_search(saved)
+            return
+        # (Re)saved so the scheduler keeps it fresh; searches nobody repeats expire (see scheduler.py)
+        await save_search(job_title, location, experience_level)
         
         # Use the new job search tool
         jobs_per_page = cl.user_session.get("jobs_per_page", 10)
@@ -162,12 +310,14 @@ async def main(message: cl.Message):
         if experience_levels:
             query_options['filters'] = {'experience': experience_levels}
         
-        jobs = linkedin_job_search_tool(
+        jobs = await run_search_with_progress(
+            progress_msg,
+            jobs_per_page,
             job_title=job_title,
             location=location,
             experience_level=experience_level,
-            max_jobs=jobs_per_page,
-            li_at_cookie=li_at_cookie
+            li_at_cookie=li_at_cookie,
+            store=True
         )
         # Sort jobs before displaying
         reverse = sort_dir == "desc"
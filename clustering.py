@@ -0,0 +1,116 @@
+import logging
+import numpy as np
+from ranking import JobRanker
+
+logger = logging.getLogger(__name__)
+
+def _kmeans_plus_plus(matrix, k, rng):
+    """Spread initial centroids out: each next seed is drawn in proportion to its cosine distance"""
+    n = matrix.shape[0]
+    chosen = [rng.randint(n)]
+    distance = 1.0 - (matrix @ matrix[chosen[0]].T).toarray().ravel()
+    for _ in range(1, k):
+        weights = np.clip(distance, 0, None)
+        total = weights.sum()
+        index = rng.choice(n, p=weights / total) if total > 0 else rng.randint(n)
+        chosen.append(index)
+        distance = np.minimum(distance, 1.0 - (matrix @ matrix[index].T).toarray().ravel())
+    return matrix[chosen].toarray()
+
+def _normalize_rows(centroids):
+    norms = np.linalg.norm(centroids, axis=1, keepdims=True)
+    norms[norms == 0] = 1.0
+    return centroids / norms
+
+def minibatch_kmeans(matrix, k, batch_size=256, iterations=50, seed=0):
+    """Spherical mini-batch k-means over L2-normalized sparse rows.
+
+    Each iteration assigns a random batch to its most similar centroid and
+    moves those centroids towards their points with a per-centroid learning
+    rate (1 / points seen), so the cost per iteration does not grow with
+    the corpus. Returns (labels for every row, unit-length centroids).
+    """
+    rng = np.random.RandomState(seed)
+    n = matrix.shape[0]
+    centroids = _kmeans_plus_plus(matrix, k, rng)
+    counts = np.zeros(k)
+    for _ in range(iterations):
+        batch = rng.choice(n, size=min(batch_size, n), replace=False)
+        rows = matrix[batch]
+        labels = np.asarray((rows @ centroids.T).argmax(axis=1)).ravel()
+        for cluster in np.unique(labels):
+            members = rows[labels == cluster]
+            counts[cluster] += members.shape[0]
+            rate = members.shape[0] / counts[cluster]
+            centroids[cluster] = (1 - rate) * centroids[cluster] + rate * np.asarray(members.mean(axis=0)).ravel()
+        centroids = _normalize_rows(centroids)
+    labels = np.asarray((matrix @ centroids.T).argmax(axis=1)).ravel()
+    return labels, centroids
+
+def silhouette(matrix, labels, sample_size=1000, seed=0):
+    """Mean silhouette (cosine distance) over a sample of rows; higher means better separated clusters"""
+    rng = np.random.RandomState(seed)
+    n = matrix.shape[0]
+    sample = rng.choice(n, size=min(sample_size, n), replace=False)
+    rows, sample_labels = matrix[sample], labels[sample]
+    distance = 1.0 - (rows @ rows.T).toarray()
+    clusters = np.unique(sample_labels)
+    if len(clusters) < 2:
+        return -1.0
+    # Mean distance from every sampled row to every cluster
+    mean_distance = np.stack([distance[:, sample_labels == c].mean(axis=1) for c in clusters], axis=1)
+    own = np.searchsorted(clusters, sample_labels)
+    sizes = np.array([(sample_labels == c).sum() for c in clusters])
+    # a: mean distance to the other members of its own cluster (excluding itself)
+    a = mean_distance[np.arange(len(sample)), own] * sizes[own] / np.maximum(sizes[own] - 1, 1)
+    mean_distance[np.arange(len(sample)), own] = np.inf
+    b = mean_distance.min(axis=1)
+    scores = np.where(sizes[own] > 1, (b - a) / np.maximum(np.maximum(a, b), 1e-12), 0.0)
+    return float(scores.mean())
+
+def cluster_jobs(jobs, k=None, max_k=12, profile_terms=15, seed=0):
+    """Group jobs into categories with a requirements profile each.
+
+    Jobs are vectorized with TF-IDF (see ranking.JobRanker) and clustered
+    with spherical mini-batch k-means. Without an explicit k, every k from
+    2 to max_k is tried and the one with the best sampled silhouette wins.
+
+    Returns clusters largest first: [{"label", "profile", "representative",
+    "jobs", "size"}], where profile lists the terms weighing most in the
+    cluster's centroid and representative is the job closest to it.
+    """
+    ranker = JobRanker()
+    ranker.add_jobs(jobs)
+    jobs = ranker.jobs
+    if not jobs:
+        return []
+    matrix, terms = ranker.tfidf()
+    if len(jobs) < 3 or k == 1:
+        labels = np.zeros(len(jobs), dtype=int)
+        centroids = _normalize_rows(np.asarray(matrix.mean(axis=0)))
+    else:
+        candidates = [k] if k else range(2, min(max_k, len(jobs) - 1) + 1)
+        best = None
+        for candidate in candidates:
+            labels, centroids = minibatch_kmeans(matrix, candidate, seed=seed)
+            score = silhouette(matrix, labels, seed=seed) if len(candidates) > 1 else 0.0
+            if best is None or score > best[0]:
+                best = (score, labels, centroids)
+        score, labels, centroids = best
+        logger.info(f"[Cluster] {len(jobs)} jobs into {len(centroids)} clusters (silhouette {score:.3f})")
+
+    clusters = []
+    for cluster in np.unique(labels):
+        members = np.flatnonzero(labels == cluster)
+        centroid = centroids[cluster]
+        top_terms = [terms[i] for i in np.argsort(-centroid)[:profile_terms] if centroid[i] > 0]
+        representative = members[np.argmax(matrix[members] @ centroid)]
+        clusters.append({
+            "label": ", ".join(top_terms[:3]),
+            "profile": top_terms,
+            "representative": jobs[representative],
+            "jobs": [jobs[i] for i in members],
+            "size": len(members)
+        })
+    clusters.sort(key=lambda c: c["size"], reverse=True)
+    return clusters
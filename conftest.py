@@ -0,0 +1,26 @@
+import asyncio
+import pytest
+from sqlalchemy.ext.asyncio import create_async_engine, AsyncSession
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import NullPool
+import crawl_state
+from models import Base
+
+@pytest.fixture
+def session_factory(tmp_path, monkeypatch):
+    """Session factory on a fresh SQLite file with every table, and a crawl state file of its own.
+
+    NullPool: each test drives the engine from several asyncio.run loops,
+    and an aiosqlite connection must not outlive the loop that opened it.
+    """
+    monkeypatch.setenv("CRAWL_STATE_PATH", str(tmp_path / "crawl_state.sqlite3"))
+    monkeypatch.setattr(crawl_state, "_default_state", None)
+    engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path / 'jobs.db'}", poolclass=NullPool)
+
+    async def create_tables():
+        async with engine.begin() as conn:
+            await conn.run_sync(Base.metadata.create_all)
+
+    asyncio.run(create_tables())
+    yield sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+    asyncio.run(engine.dispose())
@@ -0,0 +1,275 @@
+import hashlib
+import json
+import logging
+import math
+import os
+import re
+import sqlite3
+import threading
+import time
+from datetime import datetime, timedelta
+import numpy as np
+from search_cache import normalize_query
+
+# How many of the newest job ids a watermark remembers
+WATERMARK_IDS = 100
+
+def job_key(url):
+    """Stable identity of a posting: LinkedIn's numeric job id when the URL has one, else the URL without tracking parameters"""
+    if not url:
+        return None
+    match = re.search(r"currentJobId=(\d+)", url) or re.search(r"(\d{6,})/?$", url.split("?")[0])
+    return f"linkedin:{match.group(1)}" if match else url.split("?")[0].rstrip("/")
+
+class BloomFilter:
+    """Fixed-size Bloom filter over strings, stored as a bit array.
+
+    Sized for `capacity` keys at `error_rate` false positives. Two filters
+    of the same size merge with a bitwise OR, which is how copies held by
+    different processes are combined on save.
+    """
+    def __init__(self, capacity=1_000_000, error_rate=0.001):
+        self.capacity = capacity
+        self.error_rate = error_rate
+        self.size = max(8, int(math.ceil(-capacity * math.log(error_rate) / math.log(2) ** 2)))
+        self.hashes = max(1, round(self.size / capacity * math.log(2)))
+        self.bits = bytearray((self.size + 7) // 8)
+
+    def _positions(self, key):
+        # Double hashing: k positions from the two halves of one 128-bit digest
+        digest = hashlib.blake2b(key.encode("utf-8"), digest_size=16).digest()
+        h1, h2 = int.from_bytes(digest[:8], "little"), int.from_bytes(digest[8:], "little") | 1
+        return [(h1 + i * h2) % self.size for i in range(self.hashes)]
+
+    def add(self, key):
+        """Add a key; returns False if it was (probably) already present"""
+        bits = self.bits
+        present = True
+        for position in self._positions(key):
+            mask = 1 << (position & 7)
+            if not bits[position >> 3] & mask:
+                present = False
+                bits[position >> 3] |= mask
+        return not present
+
+    def __contains__(self, key):
+        bits = self.bits
+        return all(bits[position >> 3] & (1 << (position & 7)) for position in self._positions(key))
+
+    def merge(self, other_bits):
+        """OR in another filter's bits (bytes of the same length)"""
+        view = np.frombuffer(self.bits, dtype=np.uint8)
+        np.bitwise_or(view, np.frombuffer(other_bits, dtype=np.uint8), out=view)
+
+class CrawlState:
+    """What incremental crawls have already seen, in a SQLite file shared by all processes.
+
+    Two things are kept: a Bloom filter of every job ingested into the
+    database (mark_seen, called by ingest.upsert_jobs) and, per normalized
+    query, a watermark with the newest posted date and the ids of the
+    newest jobs the last crawl saw. Each process works on an in-memory
+    copy of the filter and ORs it into the stored one on flush(), so
+    concurrent writers never lose each other's keys.
+    """
+    def __init__(self, path="crawl_state.sqlite3", capacity=1_000_000, error_rate=0.001):
+        self.path = path
+        self.logger = logging.getLogger(__name__)
+        self._lock = threading.Lock()
+        self._filter = BloomFilter(capacity, error_rate)
+        self._version = None
+        self._dirty = False
+        self._added = 0
+        conn = sqlite3.connect(path, timeout=30)
+        try:
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS seen_filter (id INTEGER PRIMARY KEY CHECK (id = 1), "
+                "size INTEGER NOT NULL, hashes INTEGER NOT NULL, bits BLOB NOT NULL, keys INTEGER NOT NULL, version INTEGER NOT NULL)"
+            )
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS watermarks (query_key TEXT PRIMARY KEY, newest_posted TEXT, "
+                "recent_ids TEXT NOT NULL, updated_at REAL NOT NULL)"
+            )
+            conn.commit()
+        finally:
+            conn.close()
+        self.refresh()
+
+    def _connect(self):
+        return sqlite3.connect(self.path, timeout=30, isolation_level=None)
+
+    def _load_row(self, conn):
+        row = conn.execute("SELECT size, hashes, bits, keys, version FROM seen_filter WHERE id = 1").fetchone()
+        if row and (row[0], row[1]) != (self._filter.size, self._filter.hashes):
+            # Sized differently (capacity changed): start a new filter rather than misread the old one
+            self.logger.warning("[CrawlState] Stored seen-URL filter has a different size; starting a new one")
+            return None
+        return row
+
+    def refresh(self):
+        """Pick up keys other processes have flushed since this copy was loaded"""
+        conn = self._connect()
+        try:
+            row = self._load_row(conn)
+        finally:
+            conn.close()
+        if row and row[4] != self._version:
+            with self._lock:
+                self._filter.merge(row[2])
+                self._version = row[4]
+
+    def is_seen(self, url):
+        key = job_key(url)
+        return bool(key) and key in self._filter
+
+    def mark_seen(self, urls):
+        with self._lock:
+            for url in urls:
+                key = job_key(url)
+                if key and self._filter.add(key):
+                    self._added += 1
+                    self._dirty = True
+
+    def flush(self):
+        """OR this process's filter into the stored one"""
+        with self._lock:
+            if not self._dirty:
+                return
+            conn = self._connect()
+            try:
+                conn.execute("BEGIN IMMEDIATE")
+                row = self._load_row(conn)
+                keys = self._added
+                if row:
+                    self._filter.merge(row[2])
+                    keys += row[3]
+                version = (row[4] if row else 0) + 1
+                conn.execute(
+                    "INSERT OR REPLACE INTO seen_filter (id, size, hashes, bits, keys, version) VALUES (1, ?, ?, ?, ?, ?)",
+                    (self._filter.size, self._filter.hashes, bytes(self._filter.bits), keys, version)
+                )
+                conn.execute("COMMIT")
+            except BaseException:
+                conn.execute("ROLLBACK")
+                raise
+            finally:
+                conn.close()
+            self._version = version
+            self._dirty = False
+            self._added = 0
+        if keys > self._filter.capacity:
+            self.logger.warning(
+                f"[CrawlState] {keys} URLs in a filter sized for {self._filter.capacity}; false positives will rise"
+            )
+
+    def watermark(self, query_key):
+        """{"newest_posted": datetime or None, "recent_ids": set} for a query, or None before its first crawl"""
+        conn = self._connect()
+        try:
+            row = conn.execute(
+                "SELECT newest_posted, recent_ids FROM watermarks WHERE query_key = ?", (query_key,)
+            ).fetchone()
+        finally:
+            conn.close()
+        if row is None:
+            return None
+        return {
+            "newest_posted": datetime.fromisoformat(row[0]) if row[0] else None,
+            "recent_ids": set(json.loads(row[1]))
+        }
+
+    def save_watermark(self, query_key, newest_posted, recent_ids):
+        conn = self._connect()
+        try:
+            conn.execute(
+                "INSERT OR REPLACE INTO watermarks (query_key, newest_posted, recent_ids, updated_at) VALUES (?, ?, ?, ?)",
+                (query_key, newest_posted.isoformat() if newest_posted else None, json.dumps(recent_ids), time.time())
+            )
+        finally:
+            conn.close()
+
+    def incremental(self, query_key):
+        """Tracker for one incremental crawl of a query (see IncrementalCrawl)"""
+        self.refresh()
+        return IncrementalCrawl(self, query_key)
+
+class IncrementalCrawl:
+    """Decides, page by page, what an incremental crawl keeps and when it stops.
+
+    Pages must come newest first (sort by date). A job is skipped when it
+    is in the seen-URL filter or among the watermark's newest ids; the crawl
+    should stop after a page that contained such a job, or one posted
+    before the watermark's newest date (with a day of slack for relative
+    dates like "2 days ago"). Skipped jobs are kept in `known` (they are
+    already stored, so callers can still link them to the search).
+    Only jobs handed back to the caller, new or known, move the watermark:
+    finish() records them; an engine that had to stop early sets
+    `interrupted`, and the watermark then stays put.
+    """
+    def __init__(self, state, query_key):
+        self.state = state
+        self.query_key = query_key
+        self.previous = state.watermark(query_key)
+        self.observed = []
+        self.known = []
+        self.interrupted = False
+
+    def filter_page(self, page, limit=None):
+        """(jobs not seen before, whether the crawl should stop)
+
+        With `limit` (how many more jobs the caller wants) at most that many
+        new jobs are returned; the rest of the page is left unrecorded, so the
+        next crawl still picks it up, and the crawl should stop.
+        """
+        from ingest import parse_posted_date  # ingest imports this module
+        recent_ids = self.previous["recent_ids"] if self.previous else set()
+        cutoff = self.previous["newest_posted"] - timedelta(days=1) if self.previous and self.previous["newest_posted"] else None
+        new_jobs = []
+        reached = False
+        for job in page:
+            key = job_key(job.get("url"))
+            posted = parse_posted_date(job.get("posted_time"))
+            if key and (key in recent_ids or self.state.is_seen(job.get("url"))):
+                reached = True
+                self.observed.append((key, posted))
+                self.known.append(job)
+                continue
+            if limit is not None and len(new_jobs) >= limit:
+                reached = True
+                break
+            if cutoff and posted and posted < cutoff:
+                reached = True
+            self.observed.append((key, posted))
+            new_jobs.append(job)
+        return new_jobs, reached
+
+    def finish(self):
+        if self.interrupted:
+            self.state.logger.info(f"[Incremental] {self.query_key}: crawl interrupted, watermark unchanged")
+            return
+        keys = [key for key, _ in self.observed if key]
+        dates = [posted for _, posted in self.observed if posted]
+        if self.previous:
+            if self.previous["newest_posted"]:
+                dates.append(self.previous["newest_posted"])
+            # Keep older ids too, in case the newest postings are taken down before the next crawl
+            keys += [key for key in self.previous["recent_ids"] if key not in keys]
+        self.state.save_watermark(self.query_key, max(dates) if dates else None, keys[:WATERMARK_IDS])
+        self.state.logger.info(
+            f"[Incremental] {self.query_key}: {len(self.observed) - len(self.known)} new, {len(self.known)} already seen"
+        )
+
+_default_state = None
+_default_state_lock = threading.Lock()
+
+def get_crawl_state():
+    """Process-wide crawl state, stored in CRAWL_STATE_PATH (default crawl_state.sqlite3)"""
+    global _default_state
+    with _default_state_lock:
+        if _default_state is None:
+            _default_state = CrawlState(os.getenv("CRAWL_STATE_PATH", "crawl_state.sqlite3"))
+        return _default_state
+
+def incremental_crawl(job_title, location=None, experience_level=None):
+    """Tracker for an incremental crawl of a search, keyed by its normalized query (shared by every engine)"""
+    return get_crawl_state().incremental(normalize_query(job_title, location, experience_level, namespace="incremental"))
@@ -49,18 +49,20 @@ class JobHunterCrew:
             ),
             Task(
                 description=f"""
-                Analyze the job postings and optimize the resume for better alignment.
+                First group the job postings into categories with the job_cluster tool.
+                Then optimize the resume once per category (not once per job), using the
+                category's requirements profile and representative job.
                 Focus on:
-                - Matching keywords from job descriptions
+                - Matching keywords from the requirements profile
                 - Highlighting relevant experience
                 - Tailoring skills and achievements
                 
                 Resume path: {resume_path if resume_path else 'No resume provided'}
                 
-                Create optimized versions of the resume for each job category found.
+                Create one optimized version of the resume for each category and list the jobs it applies to.
                 """,
                 agent=self.resume_agent.agent,
-                expected_output="Optimized resume versions tailored to the job opportunities found"
+                expected_output="One optimized resume version per job category, with the jobs each category covers"
             ),
             Task(
                 description="""
@@ -1,4 +1,6 @@
+import logging
 import os
+from sqlalchemy import delete, func, inspect, select, text, tuple_, update
 from sqlalchemy.ext.asyncio import create_async_engine, AsyncSession
 from sqlalchemy.orm import sessionmaker
 from dotenv import load_dotenv
@@ -6,11 +8,76 @@ from models import Base
 
 load_dotenv()
 
-DATABASE_URL = os.getenv("DATABASE_URL")
+# Falls back to a local SQLite file when no database is configured
+DATABASE_URL = os.getenv("DATABASE_URL", "sqlite+aiosqlite:///job_hunter.db")
 
 engine = create_async_engine(DATABASE_URL, echo=True, future=True)
 AsyncSessionLocal = sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
 
-async def init_db():
-    async with engine.begin() as conn:
-        await conn.run_sync(Base.metadata.create_all) 
\ No newline at end of file
+def create_session_factory(**engine_kwargs):
+    """Session factory on a separate engine, for code running on its own event loop"""
+    own_engine = create_async_engine(DATABASE_URL, future=True, **engine_kwargs)
+    return sessionmaker(own_engine, class_=AsyncSession, expire_on_commit=False)
+
+async def init_db(bind=None):
+    """Create missing tables, columns and indexes on `bind` (default the app's engine)"""
+    from fulltext import create_fulltext_index  # fulltext imports this module
+    async with (bind or engine).begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+        # create_all skips tables that already exist, so add columns and indexes introduced since
+        await conn.run_sync(_add_missing_columns)
+        await conn.run_sync(_create_missing_indexes)
+        await conn.run_sync(create_fulltext_index)
+
+def _add_missing_columns(connection):
+    inspector = inspect(connection)
+    for table in Base.metadata.sorted_tables:
+        existing = {column["name"] for column in inspector.get_columns(table.name)}
+        for column in table.columns:
+            if column.name not in existing:
+                column_type = column.type.compile(dialect=connection.dialect)
+                connection.execute(text(f"ALTER TABLE {table.name} ADD COLUMN {column.name} {column_type}"))
+
+def _create_missing_indexes(connection):
+    for table in Base.metadata.sorted_tables:
+        existing = {index["name"] for index in inspect(connection).get_indexes(table.name)}
+        for index in table.indexes:
+            if index.name in existing:
+                continue
+            if index.unique:
+                # Tables from before the index may hold duplicates, which would make it fail
+                _merge_duplicate_rows(connection, table, list(index.columns))
+            index.create(connection)
+
+def _merge_duplicate_rows(connection, table, columns):
+    """Keep the oldest row (lowest id) per value of `columns`, pointing every reference to the others at it"""
+    keepers = (
+        select(*columns, func.min(table.c.id).label("keep_id"))
+        .group_by(*columns).having(func.count() > 1).subquery()
+    )
+    pairs = connection.execute(
+        select(table.c.id, keepers.c.keep_id)
+        .join(keepers, tuple_(*columns) == tuple_(*(keepers.c[column.name] for column in columns)))
+        .where(table.c.id != keepers.c.keep_id)
+    ).all()
+    if not pairs:
+        return
+    references = [
+        (foreign_key.parent.table, foreign_key.parent)
+        for other in Base.metadata.sorted_tables for foreign_key in other.foreign_keys
+        if foreign_key.column is table.c.id
+    ]
+    for duplicate_id, keep_id in pairs:
+        for referencing, column in references:
+            if column.primary_key:
+                # A link row the kept row already has would collide once repointed: drop it
+                others = [key for key in referencing.primary_key.columns if key is not column]
+                linked = select(*others).where(column == keep_id)
+                connection.execute(delete(referencing).where(column == duplicate_id, tuple_(*others).in_(linked)))
+            connection.execute(update(referencing).where(column == duplicate_id).values({column.name: keep_id}))
+        connection.execute(delete(table).where(table.c.id == duplicate_id))
+    if "canonical_id" in table.c:
+        # A duplicate that pointed at the row it was merged into
+        connection.execute(update(table).where(table.c.canonical_id == table.c.id).values(canonical_id=None))
+    names = ", ".join(column.name for column in columns)
+    logging.getLogger(__name__).warning(f"[DB] Merged {len(pairs)} duplicate {table.name} rows by {names}")
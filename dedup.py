@@ -0,0 +1,234 @@
+import hashlib
+import logging
+import re
+import threading
+from datetime import timedelta
+import numpy as np
+from sqlalchemy import or_, select, update
+from models import Job
+
+logger = logging.getLogger(__name__)
+
+_MERSENNE_PRIME = (1 << 61) - 1
+_MAX_HASH = (1 << 32) - 1
+# Descriptions shorter than this many words are fingerprinted by title and company alone
+MIN_DESCRIPTION_WORDS = 20
+# Re-scraped rows are re-read from slightly before the last updated_at seen (clock resolution, late commits)
+UPDATE_SLACK = timedelta(seconds=5)
+
+def normalize_text(value):
+    return " ".join(re.findall(r"[a-z0-9+#]+", (value or "").lower()))
+
+def _shingles(text, size=3):
+    words = text.split()
+    if len(words) <= size:
+        return {text} if text else set()
+    return {" ".join(words[i:i + size]) for i in range(len(words) - size + 1)}
+
+def _title_key(job):
+    return f"{normalize_text(job.get('company'))}|{normalize_text(job.get('title'))}"
+
+class MinHasher:
+    """MinHash signatures: num_perm random hash permutations over 32-bit shingle hashes"""
+    def __init__(self, num_perm=128, seed=1):
+        rng = np.random.RandomState(seed)
+        # a < 2^31 keeps a * hash + b inside uint64
+        self._a = rng.randint(1, 1 << 31, size=num_perm, dtype=np.uint64)
+        self._b = rng.randint(0, 1 << 31, size=num_perm, dtype=np.uint64)
+        self.num_perm = num_perm
+
+    def signature(self, shingles):
+        hashes = np.fromiter(
+            (int.from_bytes(hashlib.blake2b(s.encode(), digest_size=4).digest(), "little") for s in shingles),
+            dtype=np.uint64, count=len(shingles)
+        )
+        permuted = (np.outer(hashes, self._a) + self._b) % _MERSENNE_PRIME & _MAX_HASH
+        return permuted.min(axis=0).astype(np.uint32)
+
+class NearDuplicateIndex:
+    """Finds reposts of the same role under new URLs, locations or sources.
+
+    Jobs with a description are fingerprinted with MinHash over word
+    3-shingles of their normalized title, company and description, and
+    indexed with LSH banding (bands x rows == num_perm), so a lookup only
+    compares against jobs sharing a band instead of the whole index.
+    Candidates count as duplicates when they have the same company and an
+    estimated Jaccard similarity of at least `threshold`. Jobs without a
+    usable description (e.g. from the public search) match on normalized
+    company and title.
+    """
+    def __init__(self, threshold=0.8, num_perm=128, bands=32, seed=1):
+        if num_perm % bands:
+            raise ValueError("num_perm must be a multiple of bands")
+        self.threshold = threshold
+        self.bands = bands
+        self.rows = num_perm // bands
+        self.hasher = MinHasher(num_perm, seed)
+        self._buckets = [{} for _ in range(bands)]
+        self._signatures = {}
+        self._companies = {}
+        self._titles = {}
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self._companies)
+
+    def __contains__(self, key):
+        return key in self._companies
+
+    def signature(self, job):
+        """MinHash of the job's text, or None when it is too short to fingerprint"""
+        description = normalize_text(job.get("description"))
+        if len(description.split()) < MIN_DESCRIPTION_WORDS:
+            return None
+        text = f"{normalize_text(job.get('title'))} {normalize_text(job.get('company'))} {description}"
+        return self.hasher.signature(_shingles(text))
+
+    def _band_keys(self, signature):
+        for band in range(self.bands):
+            yield band, signature[band * self.rows:(band + 1) * self.rows].tobytes()
+
+    def _find(self, job, signature):
+        company = normalize_text(job.get("company"))
+        if signature is not None:
+            candidates = set()
+            for band, key in self._band_keys(signature):
+                candidates.update(self._buckets[band].get(key, ()))
+            best, best_score = None, self.threshold
+            for candidate in candidates:
+                if self._companies[candidate] != company:
+                    continue
+                score = float(np.mean(self._signatures[candidate] == signature))
+                if score >= best_score:
+                    best, best_score = candidate, score
+            if best is not None:
+                return best
+        # A listing without a description (public search) is the same role under the same title
+        candidate = self._titles.get(_title_key(job))
+        if candidate is not None and (signature is None or candidate not in self._signatures):
+            return candidate
+        return None
+
+    def add(self, key, job, signature=None):
+        """Index a job under `key` unless it duplicates one already indexed.
+
+        Returns the key of the canonical job it duplicates, or None if the job
+        is new (and now canonical itself). Adding a key again only indexes a
+        fingerprint it did not have yet (its description arrived later).
+        """
+        if signature is None:
+            signature = self.signature(job)
+        with self._lock:
+            if key in self._companies:
+                if signature is not None and key not in self._signatures:
+                    self._index_signature(key, signature)
+                return None
+            canonical = self._find(job, signature)
+            if canonical is not None:
+                return canonical
+            self._companies[key] = normalize_text(job.get("company"))
+            self._titles.setdefault(_title_key(job), key)
+            if signature is not None:
+                self._index_signature(key, signature)
+            return None
+
+    def _index_signature(self, key, signature):
+        self._signatures[key] = signature
+        for band, band_key in self._band_keys(signature):
+            self._buckets[band].setdefault(band_key, []).append(key)
+
+def dedupe_jobs(jobs, index=None):
+    """Collapse near-duplicate job dicts into their first occurrence.
+
+    Canonical jobs keep their fields, fill in a missing description from
+    their duplicates, and list the duplicates' URLs under "duplicate_urls"
+    and locations under "locations".
+    """
+    index = index or NearDuplicateIndex()
+    canonical = {}
+    for position, job in enumerate(jobs):
+        original = index.add(position, job)
+        if original is None:
+            canonical[position] = dict(job, duplicate_urls=[], locations=[job.get("location")])
+            continue
+        kept = canonical[original]
+        kept["duplicate_urls"].append(job.get("url"))
+        if job.get("location") not in kept["locations"]:
+            kept["locations"].append(job.get("location"))
+        if not kept.get("description") and job.get("description"):
+            kept["description"] = job["description"]
+    if len(canonical) < len(jobs):
+        logger.info(f"[Dedup] Collapsed {len(jobs)} jobs into {len(canonical)}")
+    return list(canonical.values())
+
+class _StoredIndex:
+    """A NearDuplicateIndex over stored jobs and how far into the jobs table it has read"""
+    def __init__(self):
+        self.index = NearDuplicateIndex()
+        self.max_id = 0
+        self.max_updated = None
+
+_stored_indexes = {}
+_stored_indexes_lock = threading.Lock()
+
+async def _stored_index(session, exclude=()):
+    """Process-wide index over the canonical jobs of the session's database.
+
+    Loaded on first use, then brought up to date on every call with the
+    rows inserted (id beyond the last one read) or re-scraped (updated_at
+    beyond the last one read) since, by this process or any other. Jobs in
+    `exclude` (inserted by the current transaction) are left out.
+    """
+    url = str(session.bind.url)
+    with _stored_indexes_lock:
+        stored = _stored_indexes.setdefault(url, _StoredIndex())
+    # Concurrent refreshes only repeat work: add() ignores jobs already indexed
+    if stored.max_updated is None:
+        updated = Job.updated_at.isnot(None)
+    else:
+        updated = Job.updated_at >= stored.max_updated - UPDATE_SLACK
+    changed = or_(Job.id > stored.max_id, updated)
+    result = await session.execute(
+        select(Job.id, Job.title, Job.company, Job.description, Job.fingerprint, Job.updated_at)
+        .where(Job.canonical_id.is_(None), changed).order_by(Job.id)
+    )
+    loaded = 0
+    for job_id, title, company, description, fingerprint, updated_at in result:
+        if updated_at is not None and (stored.max_updated is None or updated_at > stored.max_updated):
+            stored.max_updated = updated_at
+        if job_id in exclude:
+            continue
+        stored.max_id = max(stored.max_id, job_id)
+        job = {"title": title, "company": company, "description": description}
+        # A re-scrape may have replaced the description without refreshing the stored fingerprint
+        signature = np.frombuffer(fingerprint, dtype=np.uint32) if fingerprint and job_id not in stored.index else None
+        stored.index.add(job_id, job, signature)
+        loaded += 1
+    if loaded:
+        logger.debug(f"[Dedup] Indexed {loaded} stored jobs (now {len(stored.index)})")
+    return stored.index
+
+def reset_stored_index(session):
+    """Drop the loaded index, e.g. after a rollback left it ahead of the database"""
+    with _stored_indexes_lock:
+        _stored_indexes.pop(str(session.bind.url), None)
+
+async def mark_duplicates(session, jobs_by_id):
+    """Set canonical_id (and fingerprint) on newly inserted jobs; returns how many were duplicates.
+
+    jobs_by_id maps new job ids to their scraped dicts. Runs inside the
+    caller's transaction (see ingest.upsert_jobs).
+    """
+    index = await _stored_index(session, exclude=jobs_by_id)
+    rows = []
+    for job_id, job in sorted(jobs_by_id.items()):
+        signature = index.signature(job)
+        canonical_id = index.add(job_id, job, signature)
+        rows.append({
+            "id": job_id,
+            "canonical_id": canonical_id if canonical_id != job_id else None,
+            "fingerprint": signature.tobytes() if signature is not None else None
+        })
+    if rows:
+        await session.execute(update(Job), rows)  # Bulk UPDATE by primary key
+    return sum(1 for row in rows if row["canonical_id"] is not None)
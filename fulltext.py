@@ -0,0 +1,166 @@
+import re
+from sqlalchemy import text
+from db import AsyncSessionLocal
+
+OPERATORS = ("AND", "OR", "NOT")
+
+# SQLite: an external-content FTS5 table over jobs, kept in sync by triggers
+SQLITE_FTS_DDL = [
+    """
+    CREATE VIRTUAL TABLE jobs_fts USING fts5(
+        title, company, description,
+        content='jobs', content_rowid='id', tokenize='porter unicode61'
+    )
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS jobs_fts_insert AFTER INSERT ON jobs BEGIN
+        INSERT INTO jobs_fts(rowid, title, company, description)
+        VALUES (new.id, new.title, new.company, new.description);
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS jobs_fts_delete AFTER DELETE ON jobs BEGIN
+        INSERT INTO jobs_fts(jobs_fts, rowid, title, company, description)
+        VALUES ('delete', old.id, old.title, old.company, old.description);
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS jobs_fts_update AFTER UPDATE OF title, company, description ON jobs BEGIN
+        INSERT INTO jobs_fts(jobs_fts, rowid, title, company, description)
+        VALUES ('delete', old.id, old.title, old.company, old.description);
+        INSERT INTO jobs_fts(rowid, title, company, description)
+        VALUES (new.id, new.title, new.company, new.description);
+    END
+    """,
+    # Index the jobs stored before the FTS table existed
+    "INSERT INTO jobs_fts(jobs_fts) VALUES ('rebuild')"
+]
+
+# Postgres: a generated tsvector column (maintained by the database on every write) with a GIN index
+POSTGRES_FTS_DDL = [
+    """
+    ALTER TABLE jobs ADD COLUMN IF NOT EXISTS search_vector tsvector GENERATED ALWAYS AS (
+        setweight(to_tsvector('english', coalesce(title, '')), 'A') ||
+        setweight(to_tsvector('english', coalesce(company, '')), 'B') ||
+        setweight(to_tsvector('english', coalesce(description, '')), 'C')
+    ) STORED
+    """,
+    "CREATE INDEX IF NOT EXISTS ix_jobs_search_vector ON jobs USING GIN (search_vector)"
+]
+
+def create_fulltext_index(connection):
+    """Create the full-text index for the connection's dialect (run from db.init_db)"""
+    dialect_name = connection.dialect.name
+    if dialect_name == "sqlite":
+        exists = connection.execute(
+            text("SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'jobs_fts'")
+        ).first()
+        if exists:
+            return
+        for statement in SQLITE_FTS_DDL:
+            connection.execute(text(statement))
+    elif dialect_name == "postgresql":
+        for statement in POSTGRES_FTS_DDL:
+            connection.execute(text(statement))
+
+def parse_query(query):
+    """Split a search like 'kubernetes AND "site reliability" NOT java*' into clauses.
+
+    Returns [(operator, words, prefix)], the first operator being None.
+    Adjacent terms are joined with AND; a quoted string or a term such as
+    "node.js" becomes a phrase; a trailing * makes a prefix search.
+    """
+    clauses = []
+    operator = None
+    for token in re.findall(r'"[^"]*"|[^\s"()]+', query):
+        if token.upper() in OPERATORS and not token.startswith('"'):
+            if clauses:
+                operator = token.upper()
+            elif token.upper() == "NOT":
+                raise ValueError("A search cannot start with NOT")
+            continue
+        words = re.findall(r"\w+", token.lower())
+        if not words:
+            continue
+        prefix = token.endswith("*") and not token.startswith('"')
+        clauses.append((operator if clauses else None, words, prefix))
+        operator = "AND"
+    if not clauses:
+        raise ValueError("Empty search")
+    return clauses
+
+def to_fts5_query(clauses):
+    parts = []
+    for operator, words, prefix in clauses:
+        if operator:
+            parts.append(operator)
+        parts.append('"' + " ".join(words) + '"' + ("*" if prefix else ""))
+    return " ".join(parts)
+
+def to_tsquery(clauses):
+    symbols = {"AND": "&", "OR": "|", "NOT": "& !"}
+    parts = []
+    for operator, words, prefix in clauses:
+        if operator:
+            parts.append(symbols[operator])
+        terms = [word + (":*" if prefix and i == len(words) - 1 else "") for i, word in enumerate(words)]
+        parts.append(terms[0] if len(terms) == 1 else "(" + " <-> ".join(terms) + ")")
+    return " ".join(parts)
+
+def _search_statement(dialect_name):
+    if dialect_name == "sqlite":
+        # bm25() is lower for better matches; title and company matches weigh more than the description
+        return text("""
+            SELECT j.id, j.title, j.company, j.location, j.job_url, j.posted_date,
+                   -bm25(jobs_fts, 10.0, 5.0, 1.0) AS rank,
+                   snippet(jobs_fts, 2, '**', '**', '…', 16) AS snippet
+            FROM jobs_fts JOIN jobs j ON j.id = jobs_fts.rowid
+            WHERE jobs_fts MATCH :query AND j.canonical_id IS NULL
+            ORDER BY bm25(jobs_fts, 10.0, 5.0, 1.0)
+            LIMIT :limit
+        """)
+    if dialect_name == "postgresql":
+        return text("""
+            SELECT id, title, company, location, job_url, posted_date, rank,
+                   ts_headline('english', description, query,
+                               'StartSel=**, StopSel=**, MaxFragments=1, MaxWords=16') AS snippet
+            FROM (
+                SELECT j.*, q.query, ts_rank_cd(j.search_vector, q.query) AS rank
+                FROM jobs j, to_tsquery('english', :query) AS q(query)
+                WHERE j.search_vector @@ q.query AND j.canonical_id IS NULL
+                ORDER BY rank DESC
+                LIMIT :limit
+            ) ranked
+            ORDER BY rank DESC
+        """)
+    raise ValueError(f"Full-text search is not supported on {dialect_name}")
+
+async def search_job_descriptions(query, limit=20, session_factory=AsyncSessionLocal):
+    """Ranked full-text search over stored jobs (title, company and description).
+
+    Supports AND / OR / NOT, "quoted phrases" and prefix* terms, e.g.
+    'kubernetes AND rust' or '"platform engineer" NOT java'. Results are
+    ordered by BM25 on SQLite (FTS5) and ts_rank_cd on Postgres, best first,
+    as job dicts with an extra "rank" and a highlighted "snippet". Reposts
+    collapsed into a canonical job (see dedup.py) are left out.
+    Raises ValueError for an empty or malformed query.
+    """
+    clauses = parse_query(query)
+    async with session_factory() as session:
+        dialect_name = session.bind.dialect.name
+        search = to_tsquery(clauses) if dialect_name == "postgresql" else to_fts5_query(clauses)
+        result = await session.execute(_search_statement(dialect_name), {"query": search, "limit": limit})
+        rows = result.mappings().all()
+    return [
+        {
+            "id": row["id"],
+            "title": row["title"],
+            "company": row["company"],
+            "location": row["location"],
+            "url": row["job_url"],
+            "posted_time": str(row["posted_date"] or "")[:10],
+            "rank": row["rank"],
+            "snippet": row["snippet"]
+        }
+        for row in rows
+    ]
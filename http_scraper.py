@@ -0,0 +1,224 @@
+import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from bs4 import BeautifulSoup
+from rate_limit import EMPTY, NO_RESULTS, RATE_LIMITED, SUCCESS, get_rate_limiter
+
+# Prefer lxml for parsing speed when it is installed
+try:
+    import lxml  # noqa: F401
+    HTML_PARSER = "lxml"
+except ImportError:
+    HTML_PARSER = "html.parser"
+
+GUEST_SEARCH_URL = "https://www.linkedin.com/jobs-guest/jobs/api/seeMoreJobPostings/search"
+# LinkedIn stops serving search results past this offset
+MAX_RESULTS_START = 1000
+USER_AGENT = "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36"
+
+# Same selector lists as LinkedInJobScraper._extract_job_data_public, with the
+# guest API's base-search-card classes tried first
+CARD_SELECTORS = [".base-card", ".job-search-card", ".job-card-container", ".job-card", "[data-job-id]"]
+TITLE_SELECTORS = [".base-search-card__title", ".job-search-card__title", ".job-card__title", "h3", "h4"]
+COMPANY_SELECTORS = [".base-search-card__subtitle", ".job-search-card__subtitle", ".job-card__company", ".company-name"]
+LOCATION_SELECTORS = [".job-search-card__location", ".job-card__location", ".location"]
+LINK_SELECTORS = ["a.base-card__full-link", "a.job-search-card__title", "a"]
+TIME_SELECTORS = ["time", ".job-search-card__listdate"]
+
+# Statuses LinkedIn answers with when it throttles a client (999 is its own "request denied")
+THROTTLED_STATUSES = (429, 999)
+
+# Markers of a page that only renders its job list client-side
+JS_SHELL_MARKERS = ["authwall", "Please enable JavaScript", "<noscript>"]
+
+_session = None
+_session_lock = threading.Lock()
+
+def get_session(pool_size=10):
+    """Shared requests.Session with a keep-alive connection pool and retries"""
+    global _session
+    with _session_lock:
+        if _session is None:
+            session = requests.Session()
+            retry = Retry(total=3, backoff_factor=1.0, status_forcelist=[500, 502, 503, 504], allowed_methods=["GET"])
+            adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size, max_retries=retry)
+            session.mount("https://", adapter)
+            session.headers.update({
+                "User-Agent": USER_AGENT,
+                "Accept-Language": "en-US,en;q=0.9",
+            })
+            _session = session
+        return _session
+
+def _first_text(card, selectors):
+    for selector in selectors:
+        element = card.select_one(selector)
+        if element:
+            text = element.get_text(" ", strip=True)
+            if text:
+                return text
+    return None
+
+def _first_href(card, selectors):
+    for selector in selectors:
+        element = card.select_one(selector)
+        if element and element.get("href"):
+            # Drop tracking parameters so the same posting always has the same URL
+            return element["href"].split("?")[0]
+    return ""
+
+def parse_job_cards(html, source="LinkedIn (Public)"):
+    """Parse job cards from a LinkedIn search results page or guest API fragment"""
+    soup = BeautifulSoup(html, HTML_PARSER)
+    cards = []
+    for selector in CARD_SELECTORS:
+        cards = soup.select(selector)
+        if cards:
+            break
+
+    jobs = []
+    for card in cards:
+        title = _first_text(card, TITLE_SELECTORS)
+        if not title:
+            continue
+        jobs.append({
+            "title": title,
+            "company": _first_text(card, COMPANY_SELECTORS) or "Unknown Company",
+            "location": _first_text(card, LOCATION_SELECTORS) or "Unknown Location",
+            "url": _first_href(card, LINK_SELECTORS),
+            "posted_time": _first_text(card, TIME_SELECTORS) or "Unknown",
+            "source": source
+        })
+    return jobs
+
+def _retry_after(response):
+    try:
+        return float(response.headers.get("Retry-After", ""))
+    except ValueError:
+        return None
+
+def looks_blocked(response):
+    """True if an empty answer is not a plain (possibly empty) card list: redirected, or a whole HTML page"""
+    return bool(response.history) or "<html" in response.text[:1000].lower()
+
+def requires_javascript(html):
+    """True if the page is a client-rendered shell or auth wall rather than job cards"""
+    return any(marker in html for marker in JS_SHELL_MARKERS)
+
+class LinkedInHTTPScraper:
+    """Browser-free public job search over LinkedIn's guest endpoints"""
+    def __init__(self, session=None, timeout=15, limiter=None):
+        self.session = session or get_session()
+        self.timeout = timeout
+        # rate_limit.RateLimiter every request takes a permit from and reports back to
+        self.limiter = limiter or get_rate_limiter()
+        self.logger = logging.getLogger(__name__)
+
+    def fetch_page(self, job_title, location=None, experience_code=None, start=0, limiter=None, recent_first=False):
+        """Fetch one page of results; returns the job list or None if a browser is needed.
+
+        Raises rate_limit.CircuitOpenError while LinkedIn traffic is paused.
+        """
+        limiter = limiter or self.limiter
+        params = {"keywords": job_title, "start": start}
+        if location:
+            params["location"] = location
+        if experience_code:
+            params["f_E"] = experience_code
+        if recent_first:
+            params["sortBy"] = "DD"
+        limiter.acquire("guest search page")
+        response = self.session.get(GUEST_SEARCH_URL, params=params, timeout=self.timeout)
+        if response.status_code in THROTTLED_STATUSES:
+            limiter.record(RATE_LIMITED, _retry_after(response))
+        if response.status_code != 200:
+            self.logger.warning(f"[HTTP] Guest search returned status {response.status_code}")
+            return None
+        jobs = parse_job_cards(response.text)
+        if not jobs and requires_javascript(response.text):
+            self.logger.info("[HTTP] Page requires JavaScript")
+            return None
+        if jobs or start:
+            limiter.record(SUCCESS)  # An empty later page is just the end of the results
+        else:
+            # An empty first page only counts against the breaker if it does not look like a zero-result search
+            limiter.record(EMPTY if looks_blocked(response) else NO_RESULTS)
+        return jobs
+
+    def search(self, job_title, location=None, max_jobs=10, experience_code=None, incremental=None):
+        """Search public jobs without a browser.
+
+        Returns a list of job dicts, or None when the results can only be
+        read with JavaScript and the caller should fall back to Selenium.
+        """
+        return self.crawl(job_title, location, max_jobs, experience_code, concurrency=1, incremental=incremental)
+
+    def _fetch_paced(self, limiter, job_title, location, experience_code, start, recent_first=False):
+        try:
+            return self.fetch_page(job_title, location, experience_code, start, limiter, recent_first)
+        except requests.RequestException as e:
+            self.logger.warning(f"[HTTP] Guest search failed at start={start}: {str(e)}")
+            return None
+
+    def crawl(self, job_title, location=None, max_jobs=100, experience_code=None, concurrency=4, limiter=None,
+              incremental=None):
+        """Walk the result offsets (start=0, N, 2N, ...) until max_jobs unique jobs are collected.
+
+        The first page is fetched alone to learn the page size; after that
+        `concurrency` pages are fetched at a time, each taking a permit from
+        `limiter` (a rate_limit.RateLimiter, default this scraper's) first.
+        Stops at the first page that is empty or only repeats jobs already seen.
+        With `incremental` (a crawl_state.IncrementalCrawl) results come newest
+        first, known jobs are left out and the crawl stops at the first page
+        that reaches them.
+        Returns None if the very first page needs JavaScript.
+        """
+        jobs = []
+        seen_urls = set()
+        recent_first = incremental is not None
+
+        def add_page(page):
+            """Add a page's jobs; returns False once the crawl should stop"""
+            fresh = [job for job in page if not job["url"] or job["url"] not in seen_urls]
+            if not fresh:
+                return False  # Past the end of the results (LinkedIn repeats the last page)
+            reached = False
+            if incremental:
+                fresh, reached = incremental.filter_page(fresh, max_jobs - len(jobs))
+            for job in fresh:
+                seen_urls.add(job["url"])
+                jobs.append(job)
+            return not reached
+
+        first_page = self._fetch_paced(limiter, job_title, location, experience_code, 0, recent_first)
+        if first_page is None:
+            return None
+        if not add_page(first_page):
+            return jobs[:max_jobs]
+        page_size = len(first_page)
+        start = page_size
+
+        with ThreadPoolExecutor(max_workers=concurrency) as executor:
+            while len(jobs) < max_jobs and start < MAX_RESULTS_START:
+                offsets = [start + i * page_size for i in range(concurrency)]
+                offsets = [offset for offset in offsets if offset < MAX_RESULTS_START]
+                start = offsets[-1] + page_size
+                futures = [
+                    executor.submit(self._fetch_paced, limiter, job_title, location, experience_code, offset, recent_first)
+                    for offset in offsets
+                ]
+                # Consume pages in offset order so the job order matches LinkedIn's ranking
+                exhausted = False
+                for future in futures:
+                    page = future.result()
+                    if not page or not add_page(page):
+                        exhausted = True
+                        break
+                if exhausted:
+                    break
+
+        self.logger.info(f"[HTTP] Found {len(jobs)} jobs without a browser")
+        return jobs[:max_jobs]
@@ -0,0 +1,197 @@
+import asyncio
+import logging
+import re
+import sqlite3
+import threading
+from datetime import datetime, timedelta
+from sqlalchemy import case, func
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from crawl_state import get_crawl_state
+from db import AsyncSessionLocal, create_session_factory
+from dedup import mark_duplicates, reset_stored_index
+from resume_cache import process_resume
+from skills import extract_skills
+from models import Job, OptimizedResume
+
+logger = logging.getLogger(__name__)
+
+# Columns overwritten when a job with a known URL is scraped again
+UPSERT_COLUMNS = ["title", "company", "location", "description", "source", "posted_date", "skills"]
+
+RELATIVE_DATE_UNITS = {
+    "minute": timedelta(minutes=1),
+    "hour": timedelta(hours=1),
+    "day": timedelta(days=1),
+    "week": timedelta(weeks=1),
+    "month": timedelta(days=30),
+    "year": timedelta(days=365)
+}
+
+def parse_posted_date(posted_time, now=None):
+    """Turn a scraped posted time ("2024-01-31", "3 days ago", "Just now") into a datetime"""
+    if not posted_time or not isinstance(posted_time, str):
+        return None
+    now = now or datetime.utcnow()
+    text = posted_time.strip().lower()
+    try:
+        return datetime.fromisoformat(text[:19])
+    except ValueError:
+        pass
+    if text in ("just now", "today") or "moments ago" in text:
+        return now
+    match = re.search(r"(\d+)\s+(minute|hour|day|week|month|year)s?\s+ago", text)
+    if match:
+        return now - int(match.group(1)) * RELATIVE_DATE_UNITS[match.group(2)]
+    return None
+
+def _clip(value, column):
+    """Truncate a string to the column's declared length"""
+    length = getattr(Job.__table__.c[column].type, "length", None)
+    return value[:length] if value and length else value
+
+def job_row(job):
+    """Map a scraped job dict to a row for the jobs table"""
+    description = job.get("description") or ""
+    return {
+        "title": _clip(job.get("title") or "Unknown Title", "title"),
+        "company": _clip(job.get("company") or "Unknown Company", "company"),
+        "location": _clip(job.get("location") or "Unknown Location", "location"),
+        "description": description,
+        "job_url": _clip(job.get("url") or job.get("job_url"), "job_url"),
+        "source": _clip(job.get("source"), "source"),
+        "posted_date": job.get("posted_date") or parse_posted_date(job.get("posted_time")),
+        # Extracted once here so gap reports never rescan the description
+        "skills": job.get("skills") or extract_skills(f"{job.get('title') or ''} {description}")
+    }
+
+def _upsert_statement(dialect_name, rows):
+    """Single INSERT ... ON CONFLICT (job_url) DO UPDATE for a batch of rows"""
+    if dialect_name == "postgresql":
+        insert = pg_insert
+    elif dialect_name == "sqlite":
+        insert = sqlite_insert
+    else:
+        raise ValueError(f"Bulk upsert is not supported on {dialect_name}")
+    stmt = insert(Job).values(rows)
+    update = {column: stmt.excluded[column] for column in UPSERT_COLUMNS}
+    # A re-scrape without these fields (e.g. from the public path) must not wipe them
+    update["description"] = func.coalesce(func.nullif(stmt.excluded.description, ""), Job.description)
+    update["posted_date"] = func.coalesce(stmt.excluded.posted_date, Job.posted_date)
+    update["skills"] = case(
+        (func.nullif(stmt.excluded.description, "").is_(None), Job.skills), else_=stmt.excluded.skills
+    )
+    update["source"] = func.coalesce(stmt.excluded.source, Job.source)
+    update["updated_at"] = func.now()
+    # updated_at is only set by the conflict branch, so it tells inserts and updates apart
+    return stmt.on_conflict_do_update(index_elements=[Job.job_url], set_=update).returning(
+        Job.id, Job.updated_at, Job.job_url
+    )
+
+def _record_seen(urls):
+    try:
+        crawl_state = get_crawl_state()
+        crawl_state.mark_seen(urls)
+        crawl_state.flush()
+    except sqlite3.Error as e:
+        logger.warning(f"[DB] Could not record ingested URLs for incremental crawls: {str(e)}")
+
+async def upsert_jobs(jobs, session_factory=AsyncSessionLocal, batch_size=500, dedupe=True):
+    """Bulk-upsert scraped job dicts into the jobs table, deduplicated by URL.
+
+    Each batch is written with one statement. With dedupe, newly inserted
+    jobs that repost a stored job under another URL get its id as their
+    canonical_id (see dedup.py). Returns {"inserted": n, "updated": m,
+    "skipped": k, "duplicates": d} (skipped jobs have no URL).
+    """
+    rows = {}
+    skipped = 0
+    for job in jobs:
+        row = job_row(job)
+        if not row["job_url"]:
+            skipped += 1
+            continue
+        # A statement may not touch the same row twice: merge copies, latest values winning
+        previous = rows.get(row["job_url"])
+        if previous:
+            row = {**previous, **{key: value for key, value in row.items() if value}}
+        rows[row["job_url"]] = row
+    rows = list(rows.values())
+
+    by_url = {row["job_url"]: row for row in rows}
+    new_jobs = {}
+    updated = duplicates = 0
+    async with session_factory() as session:
+        dialect_name = session.bind.dialect.name
+        for start in range(0, len(rows), batch_size):
+            result = await session.execute(_upsert_statement(dialect_name, rows[start:start + batch_size]))
+            for job_id, updated_at, job_url in result.all():
+                if updated_at is None:
+                    new_jobs[job_id] = by_url[job_url]
+                else:
+                    updated += 1
+        if dedupe and new_jobs:
+            try:
+                duplicates = await mark_duplicates(session, new_jobs)
+                await session.commit()
+            except Exception:
+                reset_stored_index(session)
+                raise
+        else:
+            await session.commit()
+    # Incremental crawls skip anything ingested, by any process; the filter write is file I/O, kept off the loop
+    await asyncio.to_thread(_record_seen, list(by_url))
+    inserted = len(new_jobs)
+    logger.info(f"[DB] Upserted {len(rows)} jobs: {inserted} inserted ({duplicates} near-duplicates), {updated} updated")
+    return {"inserted": inserted, "updated": updated, "skipped": skipped, "duplicates": duplicates}
+
+async def save_optimized_resume(job_id, original_resume_path, optimized_resume_path, optimization_notes=None,
+                                session_factory=AsyncSessionLocal):
+    """Store an optimized resume for a job, with the skills it mentions; returns its id"""
+    # The resume cache parses each distinct file once; the parse is file I/O, kept off the loop
+    resume = await asyncio.to_thread(process_resume, optimized_resume_path)
+    async with session_factory() as session:
+        optimized = OptimizedResume(
+            job_id=job_id,
+            original_resume_path=original_resume_path,
+            optimized_resume_path=optimized_resume_path,
+            optimization_notes=optimization_notes,
+            skills=resume["skills"]
+        )
+        session.add(optimized)
+        await session.commit()
+        return optimized.id
+
+class _SyncRunner:
+    """Event loop on a daemon thread for synchronous callers, with a DB engine used only on that loop.
+
+    Pooled async connections (asyncpg in particular) belong to the loop
+    that opened them, so neither a fresh asyncio.run per call nor the
+    app's engine would do.
+    """
+    def __init__(self):
+        self.loop = asyncio.new_event_loop()
+        self.session_factory = create_session_factory()
+        threading.Thread(target=self.loop.run_forever, name="ingest-sync", daemon=True).start()
+
+    def run(self, coro):
+        return asyncio.run_coroutine_threadsafe(coro, self.loop).result()
+
+_sync_runner = None
+_sync_runner_lock = threading.Lock()
+
+def _get_sync_runner():
+    global _sync_runner
+    with _sync_runner_lock:
+        if _sync_runner is None:
+            _sync_runner = _SyncRunner()
+        return _sync_runner
+
+def run_coroutine_sync(make_coro):
+    """Run make_coro(session_factory) to completion from synchronous code, even inside a running loop.
+
+    The coroutine runs on one persistent background loop and gets that
+    loop's session factory, e.g. run_coroutine_sync(lambda sf: upsert_jobs(jobs, sf)).
+    """
+    runner = _get_sync_runner()
+    return runner.run(make_coro(runner.session_factory))
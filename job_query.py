@@ -0,0 +1,126 @@
+import base64
+import json
+from datetime import datetime
+from sqlalchemy import select, tuple_
+from db import AsyncSessionLocal
+from models import Job
+
+# Sort fields offered by app.py, each backed by a (column, id) index
+SORT_COLUMNS = {
+    "title": Job.title,
+    "company": Job.company,
+    "location": Job.location,
+    "posted": Job.posted_date,
+    "posted_time": Job.posted_date
+}
+
+def encode_cursor(sort, direction, value, job_id, nulls=False):
+    """Opaque cursor pointing just after the last job of a page"""
+    if isinstance(value, datetime):
+        value = value.isoformat()
+    payload = json.dumps({"s": sort, "d": direction, "v": value, "id": job_id, "n": nulls})
+    return base64.urlsafe_b64encode(payload.encode()).decode()
+
+def decode_cursor(cursor, sort, direction):
+    try:
+        payload = json.loads(base64.urlsafe_b64decode(cursor.encode()))
+    except (ValueError, AttributeError):
+        raise ValueError("Invalid cursor")
+    if payload.get("s") != sort or payload.get("d") != direction:
+        raise ValueError("Cursor was created for a different sort order")
+    value = payload["v"]
+    if value is not None and SORT_COLUMNS[sort] is Job.posted_date:
+        value = datetime.fromisoformat(value)
+    return value, payload["id"], payload["n"]
+
+def job_dict(job):
+    """Stored job in the shape the scraper returns (see app.build_jobs_table)"""
+    return {
+        "id": job.id,
+        "title": job.title,
+        "company": job.company,
+        "location": job.location,
+        "description": job.description,
+        "url": job.job_url,
+        "source": job.source,
+        "skills": job.skills or [],
+        "posted_time": job.posted_date.date().isoformat() if job.posted_date else ""
+    }
+
+def _filtered(company=None, location=None, keywords=None, posted_after=None, posted_before=None,
+              include_duplicates=False):
+    stmt = select(Job)
+    if not include_duplicates:
+        stmt = stmt.where(Job.canonical_id.is_(None))
+    if company:
+        stmt = stmt.where(Job.company == company)
+    if location:
+        stmt = stmt.where(Job.location == location)
+    for keyword in (keywords or "").split():
+        stmt = stmt.where(Job.title.ilike(f"%{keyword}%"))
+    if posted_after:
+        stmt = stmt.where(Job.posted_date >= posted_after)
+    if posted_before:
+        stmt = stmt.where(Job.posted_date < posted_before)
+    return stmt
+
+async def query_jobs(company=None, location=None, keywords=None, posted_after=None, posted_before=None,
+                     sort="posted", direction="desc", limit=25, cursor=None, include_duplicates=False,
+                     session_factory=AsyncSessionLocal):
+    """One page of stored jobs, filtered and sorted, paged with keyset cursors.
+
+    Args:
+        company, location: exact matches
+        keywords: whitespace-separated words that must all appear in the title
+        posted_after, posted_before: datetime bounds on the posted date
+        sort: "title", "company", "location" or "posted"; ties are broken by id
+        direction: "asc" or "desc"
+        cursor: next_cursor of the previous page, None for the first page
+        include_duplicates: also return reposts collapsed into a canonical job (see dedup.py)
+
+    Returns:
+        {"jobs": [job dicts], "next_cursor": str or None}
+
+    Every page is a range scan on a (sort column, id) index that starts after
+    the previous page's last row, so page 500 costs the same as page 1. Jobs
+    without a posted date come last in both directions.
+    """
+    if sort not in SORT_COLUMNS:
+        raise ValueError(f"Invalid sort field: {sort}")
+    if direction not in ("asc", "desc"):
+        raise ValueError(f"Invalid sort direction: {direction}")
+    column = SORT_COLUMNS[sort]
+    descending = direction == "desc"
+    base = _filtered(company, location, keywords, posted_after, posted_before, include_duplicates)
+
+    after_value = after_id = None
+    in_nulls = False
+    if cursor:
+        after_value, after_id, in_nulls = decode_cursor(cursor, sort, direction)
+
+    async with session_factory() as session:
+        jobs = []
+        if not in_nulls:
+            stmt = base.where(column.isnot(None))
+            if after_id is not None:
+                key, after = tuple_(column, Job.id), tuple_(after_value, after_id)
+                stmt = stmt.where(key < after if descending else key > after)
+            order = (column.desc(), Job.id.desc()) if descending else (column.asc(), Job.id.asc())
+            result = await session.execute(stmt.order_by(*order).limit(limit + 1))
+            jobs = list(result.scalars())
+        if len(jobs) <= limit and column.nullable:
+            # The non-NULL range is exhausted: continue with the jobs lacking a value
+            stmt = base.where(column.is_(None))
+            if in_nulls and after_id is not None:
+                stmt = stmt.where(Job.id < after_id if descending else Job.id > after_id)
+            order = Job.id.desc() if descending else Job.id.asc()
+            result = await session.execute(stmt.order_by(order).limit(limit + 1 - len(jobs)))
+            jobs.extend(result.scalars())
+
+    next_cursor = None
+    if len(jobs) > limit:
+        jobs = jobs[:limit]
+        last = jobs[-1]
+        value = getattr(last, column.key)
+        next_cursor = encode_cursor(sort, direction, value, last.id, nulls=value is None)
+    return {"jobs": [job_dict(job) for job in jobs], "next_cursor": next_cursor}
@@ -0,0 +1,106 @@
+import asyncio
+import queue
+import threading
+from linkedin_scraper import linkedin_job_search_tool, CrawlLimitReached
+
+class _StreamEnd:
+    """Marks the end of a stream, carrying the scraper's exception if it failed"""
+    def __init__(self, error=None):
+        self.error = error
+
+class JobStream:
+    """
+    Iterator over jobs from linkedin_job_search_tool, yielded as soon as they are scraped.
+
+    The scrape runs on `executor` (or a daemon thread) and hands jobs over
+    through a queue of buffer_size entries; when the consumer falls behind
+    the queue fills up and the scraper blocks (backpressure). close() may be
+    called from any thread and cancels the scrape at the next job it emits.
+    """
+    def __init__(self, search_kwargs, buffer_size=16, executor=None):
+        self._jobs = queue.Queue(maxsize=buffer_size)
+        self._stop = threading.Event()
+        self._search_kwargs = search_kwargs
+        if executor:
+            executor.submit(self._run)
+        else:
+            threading.Thread(target=self._run, name="job-stream", daemon=True).start()
+
+    def _put(self, item):
+        # Never block forever on a consumer that has gone away
+        while not self._stop.is_set():
+            try:
+                self._jobs.put(item, timeout=0.5)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    def _on_job(self, job):
+        if not self._put(job):
+            raise CrawlLimitReached()
+
+    def _run(self):
+        error = None
+        try:
+            linkedin_job_search_tool(on_job=self._on_job, **self._search_kwargs)
+        except Exception as e:
+            error = e
+        end = _StreamEnd(error)
+        if not self._put(end):
+            # Closed: still wake up a consumer blocked on an empty queue
+            try:
+                self._jobs.put_nowait(end)
+            except queue.Full:
+                pass
+
+    def __iter__(self):
+        return self
+
+    def __next__(self):
+        if self._stop.is_set():
+            raise StopIteration
+        item = self._jobs.get()
+        if isinstance(item, _StreamEnd):
+            self._stop.set()
+            if item.error:
+                raise item.error
+            raise StopIteration
+        return item
+
+    def close(self):
+        """Stop consuming; the scraper stops at its next job"""
+        self._stop.set()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+def iter_linkedin_jobs(job_title, location=None, experience_level=None, max_jobs=10, li_at_cookie=None,
+                       concurrency=1, buffer_size=16, executor=None, store=False):
+    """Streaming variant of linkedin_job_search_tool (see JobStream); use as a context manager to cancel early"""
+    search_kwargs = {
+        "job_title": job_title,
+        "location": location,
+        "experience_level": experience_level,
+        "max_jobs": max_jobs,
+        "li_at_cookie": li_at_cookie,
+        "concurrency": concurrency,
+        "store": store
+    }
+    return JobStream(search_kwargs, buffer_size, executor)
+
+async def aiter_linkedin_jobs(job_title, location=None, experience_level=None, max_jobs=10, li_at_cookie=None,
+                              concurrency=1, buffer_size=16, executor=None, store=False):
+    """Async iterator over iter_linkedin_jobs, for use from an event loop (e.g. Chainlit handlers)"""
+    loop = asyncio.get_running_loop()
+    with iter_linkedin_jobs(job_title, location, experience_level, max_jobs, li_at_cookie,
+                            concurrency, buffer_size, executor, store) as stream:
+        while True:
+            # Waiting for the next job happens off the loop; each hop is one job
+            job = await loop.run_in_executor(None, next, stream, None)
+            if job is None:
+                return
+            yield job
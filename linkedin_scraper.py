@@ -1,29 +1,298 @@
 import time
 import json
-import requests
 from selenium import webdriver
 from selenium.webdriver.common.by import By
-from selenium.webdriver.common.keys import Keys
 from selenium.webdriver.support.ui import WebDriverWait
-from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.chrome.options import Options
 from selenium.common.exceptions import TimeoutException, NoSuchElementException
 from webdriver_manager.chrome import ChromeDriverManager
 from selenium.webdriver.chrome.service import Service
 import logging
 import os
-import random
+import math
+import threading
+from contextlib import contextmanager
+from selenium.common.exceptions import WebDriverException
+from http_scraper import LinkedInHTTPScraper, MAX_RESULTS_START
+from rate_limit import AUTH_WALL, EMPTY, NO_RESULTS, RATE_LIMITED, SUCCESS, CircuitOpenError, get_browser_admission, get_rate_limiter
+from single_flight import SingleFlight
+from dedup import NearDuplicateIndex
+from write_behind import get_job_writer
+from search_cache import get_search_cache, normalize_query
+from crawl_state import IncrementalCrawl, incremental_crawl
+from concurrent.futures import ThreadPoolExecutor
 from linkedin_jobs_scraper import LinkedinScraper
 from linkedin_jobs_scraper.query import Query, QueryOptions, QueryFilters
-from linkedin_jobs_scraper.filters import ExperienceLevelFilters
+from linkedin_jobs_scraper.filters import ExperienceLevelFilters, RelevanceFilters
 from linkedin_jobs_scraper.events import Events
 
+# Card and field selectors for the authenticated layout (see _extract_job_data)
+JOB_CARD_SELECTOR = ".job-card-job-posting-card-wrapper__entity-lockup"
+JOB_CARD_FIELDS = {
+    "title": [".job-search-card__title"],
+    "company": [".job-search-card__subtitle"],
+    "location": [".job-search-card__location"],
+    "url": ["a.job-search-card__title"],
+    "posted_time": [".job-search-card__listdate"]
+}
+
+# Field selectors for the public layouts (see _extract_job_data_public)
+PUBLIC_JOB_CARD_FIELDS = {
+    "title": [".job-search-card__title", ".job-card__title", "h3", "h4"],
+    "company": [".job-search-card__subtitle", ".job-card__company", ".company-name"],
+    "location": [".job-search-card__location", ".job-card__location", ".location"],
+    "url": ["a"],
+    "posted_time": []
+}
+
+# Jobs per results page in the browser UI (the step between start= offsets)
+RESULTS_PAGE_SIZE = 25
+
+# Seconds ChromeDriverPool.checkout waits for a busy pool before giving up
+CHECKOUT_TIMEOUT = 300
+
+AUTH_WALL_SELECTOR = ".auth-wall, .login-prompt, .sign-in-prompt"
+
+# Where LinkedIn redirects a browser it is blocking instead of showing results
+BLOCKED_URL_MARKERS = ["/checkpoint", "/authwall", "/login", "/uas/"]
+
+# Card selectors tried for the public layouts, most specific first
+PUBLIC_CARD_SELECTORS = [
+    JOB_CARD_SELECTOR,
+    ".job-search-card",
+    ".job-card-container",
+    ".job-card",
+    "[data-job-id]"
+]
+
+# Reads every card's fields in the browser and returns them as one JSON payload,
+# replacing several chromedriver round trips per field per card
+BULK_EXTRACT_JS = """
+var cards = document.querySelectorAll(arguments[0]);
+var fields = arguments[1];
+var limit = arguments[2];
+var rows = [];
+for (var i = 0; i < cards.length && rows.length < limit; i++) {
+    var row = {};
+    for (var name in fields) {
+        var value = null;
+        var selectors = fields[name];
+        for (var j = 0; j < selectors.length && !value; j++) {
+            var el = cards[i].querySelector(selectors[j]);
+            if (!el) continue;
+            value = name === "url" ? (el.href || el.getAttribute("href")) : (el.innerText || el.textContent || "").trim();
+        }
+        row[name] = value;
+    }
+    rows.push(row);
+}
+return JSON.stringify(rows);
+"""
+
+# Scrolls to the bottom, then resolves with the card count as soon as it grows
+# past arguments[1] (observed with a MutationObserver) or after arguments[2] ms
+WAIT_FOR_MORE_CARDS_JS = """
+var selector = arguments[0], previous = arguments[1], timeoutMs = arguments[2];
+var done = arguments[arguments.length - 1];
+var count = function () { return document.querySelectorAll(selector).length; };
+window.scrollTo(0, document.body.scrollHeight);
+if (count() > previous) { done(count()); return; }
+var timer = null;
+var observer = new MutationObserver(function () {
+    if (count() > previous) { observer.disconnect(); clearTimeout(timer); done(count()); }
+});
+observer.observe(document.body, {childList: true, subtree: true});
+timer = setTimeout(function () { observer.disconnect(); done(count()); }, timeoutMs);
+"""
+
+# Concurrent identical searches share one scrape (see SingleFlight)
+_search_flights = SingleFlight()
+
+_chromedriver_path = None
+_chromedriver_lock = threading.Lock()
+
+def get_chromedriver_path(logger=None):
+    """Resolve the chromedriver binary once per process and reuse it"""
+    global _chromedriver_path
+    with _chromedriver_lock:
+        if _chromedriver_path:
+            return _chromedriver_path
+        logger = logger or logging.getLogger(__name__)
+        # Patch: Ensure correct chromedriver binary is used
+        driver_path = ChromeDriverManager().install()
+        logger.info(f"[DEBUG] ChromeDriverManager returned path: {driver_path}")
+        if not driver_path.endswith("chromedriver") or driver_path.endswith("THIRD_PARTY_NOTICES.chromedriver"):
+            driver_dir = os.path.dirname(driver_path)
+            candidate = os.path.join(driver_dir, "chromedriver")
+            logger.info(f"[DEBUG] Forcing driver path to: {candidate}")
+            driver_path = candidate
+        _chromedriver_path = driver_path
+        return _chromedriver_path
+
+class ChromeDriverPool:
+    """Pool of pre-warmed (and optionally pre-authenticated) Chrome sessions.
+
+    Drivers are handed out with checkout()/checkin() and kept alive across
+    searches, so only the first search pays for launching Chrome and loading
+    cookies. Sessions are health-checked on checkout and recycled after
+    max_uses searches.
+    """
+    def __init__(self, size=2, headless=True, use_cookies=False, cookies_file=None, max_uses=50, prewarm=True):
+        self.size = size
+        self.headless = headless
+        self.use_cookies = use_cookies
+        self.cookies_file = cookies_file
+        self.max_uses = max_uses
+        self.logger = logging.getLogger(__name__)
+        self._idle = []  # Used as a stack: LIFO keeps the most recently used session hot
+        self._uses = {}
+        self._count = 0
+        # Notified whenever a session is checked in or retired, i.e. when a waiter may proceed
+        self._available = threading.Condition(threading.Lock())
+        self._closed = False
+        if prewarm:
+            self.warm()
+
+    def _launch(self):
+        """Start a new Chrome session with the pool's options and cookies"""
+        scraper = LinkedInJobScraper(
+            headless=self.headless,
+            use_cookies=self.use_cookies,
+            cookies_file=self.cookies_file
+        )
+        driver = scraper._launch_driver()
+        self.logger.info("[Pool] Launched new Chrome session")
+        return driver
+
+    def _discard(self, driver):
+        with self._available:
+            if self._uses.pop(id(driver), None) is not None:
+                self._count -= 1
+                # The freed slot lets a waiting checkout launch a replacement
+                self._available.notify()
+        try:
+            driver.quit()
+        except Exception:
+            pass
+        get_browser_admission().release()
+
+    def _new_session(self):
+        """Launch a session into a slot already reserved in _count"""
+        try:
+            driver = self._launch()
+        except Exception:
+            with self._available:
+                self._count -= 1
+                self._available.notify()
+            raise
+        with self._available:
+            self._uses[id(driver)] = 0
+        return driver
+
+    def warm(self):
+        """Launch sessions until the pool is full"""
+        while True:
+            with self._available:
+                if self._closed or self._count >= self.size:
+                    break
+                self._count += 1  # Reserve the slot before the slow launch
+            driver = self._new_session()
+            with self._available:
+                self._idle.append(driver)
+                self._available.notify()
+
+    def is_healthy(self, driver):
+        """Cheap liveness probe for a pooled session"""
+        try:
+            return driver.execute_script("return 1") == 1
+        except WebDriverException:
+            return False
+
+    def checkout(self, timeout=CHECKOUT_TIMEOUT):
+        """Hand out a healthy driver, launching one if the pool has room.
+
+        Waits up to timeout seconds (None waits forever) for a session to be
+        checked in or retired, then raises TimeoutError.
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while True:
+            with self._available:
+                while not self._closed and not self._idle and self._count >= self.size:
+                    remaining = None if deadline is None else deadline - time.monotonic()
+                    if remaining is not None and remaining <= 0:
+                        raise TimeoutError("No Chrome session available in pool")
+                    self._available.wait(remaining)
+                if self._closed:
+                    raise RuntimeError("ChromeDriverPool is closed")
+                if self._idle:
+                    driver = self._idle.pop()
+                else:
+                    self._count += 1  # Reserve the slot before the slow launch
+                    driver = None
+            if driver is None:
+                driver = self._new_session()
+            if self.is_healthy(driver):
+                with self._available:
+                    self._uses[id(driver)] += 1
+                return driver
+            self.logger.warning("[Pool] Discarding unhealthy Chrome session")
+            self._discard(driver)
+
+    def checkin(self, driver):
+        """Return a driver to the pool, recycling it if it is worn out or broken"""
+        if driver is None:
+            return
+        with self._available:
+            uses = self._uses.get(id(driver), 0)
+        if self._closed or uses >= self.max_uses or not self.is_healthy(driver):
+            self.logger.info("[Pool] Retiring Chrome session")
+            self._discard(driver)
+            return
+        with self._available:
+            self._idle.append(driver)
+            self._available.notify()
+
+    @contextmanager
+    def driver(self, timeout=CHECKOUT_TIMEOUT):
+        driver = self.checkout(timeout=timeout)
+        try:
+            yield driver
+        finally:
+            self.checkin(driver)
+
+    def close(self):
+        """Quit every idle session; checked-out sessions are quit on checkin"""
+        with self._available:
+            self._closed = True
+            idle, self._idle = self._idle, []
+            self._available.notify_all()
+        for driver in idle:
+            self._discard(driver)
+        self.logger.info("[Pool] Closed")
+
 class LinkedInJobScraper:
-    def __init__(self, headless=True, use_cookies=False, cookies_file=None):
+    IMPLICIT_WAIT = 10
+
+    # Resolved selector sets keyed by layout fingerprint, shared by all scrapers
+    _layout_cache = {}
+    _layout_cache_lock = threading.Lock()
+
+    def __init__(self, headless=True, use_cookies=False, cookies_file=None, pool=None, use_http=True,
+                 load_budget=20.0, limiter=None, cache=None):
         self.headless = headless
         self.use_cookies = use_cookies
         self.cookies_file = cookies_file
+        self.pool = pool
         self.driver = None
+        # Browser-free engine for public search; Selenium is only the fallback
+        # Every request to LinkedIn takes a permit from (and reports back to) one rate_limit.RateLimiter
+        self.limiter = limiter or get_rate_limiter()
+        self.http = LinkedInHTTPScraper(limiter=self.limiter) if use_http else None
+        # Seconds a search may spend waiting for results to load
+        self.load_budget = load_budget
+        self.timings = {}
+        # Optional search_cache.SearchCache consulted before every search
+        self.cache = cache
         self.setup_logging()
         
     def setup_logging(self):
@@ -32,6 +301,14 @@ class LinkedInJobScraper:
     
     def setup_driver(self):
         """Setup Chrome driver with appropriate options"""
+        if self.pool:
+            # Warm session from the pool: already launched and authenticated
+            self.driver = self.pool.checkout()
+            return
+        self._launch_driver()
+
+    def _launch_driver(self):
+        """Launch a new Chrome session and load cookies if configured"""
         chrome_options = Options()
         
         if self.headless:
@@ -50,21 +327,21 @@ class LinkedInJobScraper:
         }
         chrome_options.add_experimental_option("prefs", prefs)
         
-        # Patch: Ensure correct chromedriver binary is used
-        driver_path = ChromeDriverManager().install()
-        self.logger.info(f"[DEBUG] ChromeDriverManager returned path: {driver_path}")
-        if not driver_path.endswith("chromedriver") or driver_path.endswith("THIRD_PARTY_NOTICES.chromedriver"):
-            driver_dir = os.path.dirname(driver_path)
-            candidate = os.path.join(driver_dir, "chromedriver")
-            self.logger.info(f"[DEBUG] Forcing driver path to: {candidate}")
-            driver_path = candidate
+        driver_path = get_chromedriver_path(self.logger)
         service = Service(driver_path)
-        self.driver = webdriver.Chrome(service=service, options=chrome_options)
-        self.driver.implicitly_wait(10)
+        # Every live Chrome holds a slot of the process-wide admission limit
+        get_browser_admission().acquire()
+        try:
+            self.driver = webdriver.Chrome(service=service, options=chrome_options)
+        except Exception:
+            get_browser_admission().release()
+            raise
+        self.driver.implicitly_wait(self.IMPLICIT_WAIT)
         
         # Load cookies if provided
         if self.use_cookies and self.cookies_file:
             self.load_cookies()
+        return self.driver
     
     def load_cookies(self):
         """Load cookies from file to maintain session"""
@@ -93,131 +370,477 @@ class LinkedInJobScraper:
         except Exception as e:
             self.logger.warning(f"Failed to save cookies: {str(e)}")
     
-    def search_jobs(self, job_title, location=None, experience_level=None, max_jobs=10):
-        """Search for jobs on LinkedIn"""
+    def search_jobs(self, job_title, location=None, experience_level=None, max_jobs=10, incremental=False):
+        """Search for jobs on LinkedIn.
+
+        With incremental (True, or a crawl_state.IncrementalCrawl) only jobs
+        not seen before are returned (see crawl_state); such searches bypass
+        the cache, since their answer changes with every crawl. This method
+        stores nothing, so the watermark only moves if the caller passes a
+        tracker and calls its finish() once the jobs are stored; with True
+        the jobs count as seen once they are ingested.
+        """
+        if incremental:
+            tracker = incremental if isinstance(incremental, IncrementalCrawl) else \
+                incremental_crawl(job_title, location, experience_level)
+            return self._search_jobs(job_title, location, experience_level, max_jobs, tracker)
+
+        key = normalize_query(job_title, location, experience_level, authenticated=self.use_cookies, namespace="selenium")
+
+        def compute():
+            # Identical searches already running in other threads are joined, not repeated
+            jobs = _search_flights.do(
+                f"{key}|{max_jobs}", lambda emit: self._search_jobs(job_title, location, experience_level, max_jobs)
+            )
+            return jobs, True
+
+        if self.cache:
+            return self.cache.get_or_compute(key, max_jobs, compute)
+        return compute()[0]
+
+    def _search_jobs(self, job_title, location, experience_level, max_jobs, incremental=None, raise_errors=False):
+        """One search, browser first. A failed search returns [] unless raise_errors,
+        for callers that retry failures (scrape_farm) and must not take them for empty results.
+        """
         try:
             self.logger.info(f"Searching for jobs: {job_title} in {location}")
+
+            # Without a browser only the public search is possible
+            if self.driver is None:
+                return self._search_public_jobs(job_title, location, max_jobs, experience_level, incremental,
+                                                raise_errors)
             
-            # Construct search URL
-            search_url = f"https://www.linkedin.com/jobs/search/?keywords={job_title.replace(' ', '%20')}"
-            if location:
-                search_url += f"&location={location.replace(' ', '%20')}"
-            if experience_level:
-                search_url += f"&f_E={self._get_experience_level_code(experience_level)}"
-            
+            search_url = self._build_search_url(job_title, location, experience_level, recent_first=bool(incremental))
+            jobs = self._search_page(search_url, max_jobs, raise_errors=raise_errors)
+            if jobs is None:
+                self.logger.warning("Authentication required. Using public job search.")
+                try:
+                    return self._search_public_jobs(job_title, location, max_jobs, experience_level, incremental,
+                                                    raise_errors)
+                finally:
+                    self._record_auth_wall()
+            return incremental.filter_page(jobs, max_jobs)[0] if incremental else jobs
+
+        except CircuitOpenError:
+            raise  # Not a result: must not be cached as an empty search
+        except Exception as e:
+            self.logger.error(f"Error searching jobs: {str(e)}")
+            if raise_errors:
+                raise
+            return []
+
+    def _record_auth_wall(self, limiter=None):
+        """Report an auth wall to the limiter, after the public fallback has run.
+
+        Anonymous sessions expect auth walls; with cookies one means the
+        session was challenged, which trips the breaker at once. Reporting
+        it any earlier would block the fallback's own request.
+        """
+        if self.use_cookies:
+            (limiter or self.limiter).record(AUTH_WALL)
+
+    def _build_search_url(self, job_title, location=None, experience_level=None, start=0, recent_first=False):
+        """Construct a LinkedIn job search URL, optionally at a result offset or sorted newest first"""
+        search_url = f"https://www.linkedin.com/jobs/search/?keywords={job_title.replace(' ', '%20')}"
+        if location:
+            search_url += f"&location={location.replace(' ', '%20')}"
+        if experience_level:
+            search_url += f"&f_E={self._get_experience_level_code(experience_level)}"
+        if start:
+            search_url += f"&start={start}"
+        if recent_first:
+            search_url += "&sortBy=DD"
+        return search_url
+
+    def _search_page(self, search_url, max_jobs, limiter=None, raise_errors=False):
+        """Load one results page and extract up to max_jobs jobs.
+
+        Returns None if LinkedIn shows an auth wall instead of results, and
+        [] if the page failed to load (or raises, with raise_errors).
+        """
+        limiter = limiter or self.limiter
+        try:
+            # Pacing between requests comes from the rate limiter, not the load loop
+            limiter.acquire("page load")
+            self.timings = {}
+            started = time.monotonic()
             self.driver.get(search_url)
-            time.sleep(2)  # Initial wait for page load
-            
-            # Slow mode: random delay to mimic human behavior and avoid rate limiting
-            slow_mo = random.uniform(1.0, 2.0)
-            self.logger.info(f"[SlowMo] Waiting {slow_mo:.2f} seconds after page load...")
-            time.sleep(slow_mo)
+            self.timings["navigate"] = time.monotonic() - started
 
-            # Explicit wait for job cards to appear
+            # Wait only until the first cards (or an auth wall) show up
+            phase_start = time.monotonic()
+            first_wait = min(15, self.load_budget)
             try:
-                WebDriverWait(self.driver, 15).until(
-                    EC.presence_of_element_located((By.CSS_SELECTOR, ".job-card-job-posting-card-wrapper__entity-lockup"))
-                )
+                with self._no_implicit_wait():
+                    WebDriverWait(self.driver, first_wait, poll_frequency=0.25).until(
+                        lambda d: d.find_elements(By.CSS_SELECTOR, f"{JOB_CARD_SELECTOR}, {AUTH_WALL_SELECTOR}")
+                    )
                 self.logger.info("[Wait] Job cards appeared on the page.")
             except TimeoutException:
                 self.logger.warning("[Wait] Timeout waiting for job cards to appear.")
+            self.timings["first_cards"] = time.monotonic() - phase_start
 
-            # Check if we need to handle authentication
+            # Check if we need to handle authentication (the caller reports it, see _record_auth_wall)
             if self._is_auth_required():
-                self.logger.warning("Authentication required. Using public job search.")
-                return self._search_public_jobs(job_title, location, max_jobs)
+                return None
             
             jobs = []
             job_cards = []
             
-            # Scroll to load more jobs
-            for scroll_num in range(3):  # Scroll 3 times to load more content
-                self.driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
-                slow_mo = random.uniform(1.0, 2.0)
-                self.logger.info(f"[SlowMo] Waiting {slow_mo:.2f} seconds after scroll {scroll_num+1}...")
-                time.sleep(slow_mo)
-                # Log number of job cards after each scroll
-                cards_now = self.driver.find_elements(By.CSS_SELECTOR, ".job-card-job-posting-card-wrapper__entity-lockup")
-                self.logger.info(f"[Scroll {scroll_num+1}] Found {len(cards_now)} job cards so far.")
+            # Scroll until max_jobs cards are loaded or the count stops growing
+            phase_start = time.monotonic()
+            remaining = self.load_budget - (phase_start - started)
+            self._scroll_until_stable(JOB_CARD_SELECTOR, max_jobs, remaining)
+            self.timings["scroll"] = time.monotonic() - phase_start
             
-            # Find job cards
-            job_cards = self.driver.find_elements(By.CSS_SELECTOR, ".job-card-job-posting-card-wrapper__entity-lockup")
+            # Find job cards and the selectors that match this layout
+            layout, job_cards = self._probe_layout([JOB_CARD_SELECTOR], JOB_CARD_FIELDS)
             
             self.logger.info(f"Found {len(job_cards)} job cards after scrolling.")
-            
-            # Save page source for debugging
-            with open("debug_linkedin_jobs_after_scroll.html", "w", encoding="utf-8") as f:
-                f.write(self.driver.page_source)
-            self.logger.info("Saved page source to debug_linkedin_jobs_after_scroll.html")
 
-            for i, card in enumerate(job_cards[:max_jobs]):
-                try:
-                    job_data = self._extract_job_data(card)
-                    if job_data:
-                        jobs.append(job_data)
-                        self.logger.info(f"Extracted job {i+1}: {job_data['title']}")
-                except Exception as e:
-                    self.logger.warning(f"Failed to extract job {i+1}: {str(e)}")
-                    continue
+            # Fast path: every card in a single round trip to the browser
+            phase_start = time.monotonic()
+            if not layout:
+                limiter.record(self._empty_outcome())
+                return jobs
+            limiter.record(SUCCESS)
+            bulk_jobs = self._extract_jobs_bulk(
+                JOB_CARD_SELECTOR, self._layout_fields(layout, JOB_CARD_FIELDS), max_jobs, "LinkedIn"
+            )
+            if bulk_jobs:
+                self.logger.info(f"Extracted {len(bulk_jobs)} jobs in one bulk pass")
+                self.timings["extract"] = time.monotonic() - phase_start
+                self._log_timings()
+                return bulk_jobs
+
+            # Per-card fallback; missing optional fields fail fast instead of waiting
+            with self._no_implicit_wait():
+                for i, card in enumerate(job_cards[:max_jobs]):
+                    try:
+                        job_data = self._extract_job_data(card)
+                        if job_data:
+                            jobs.append(job_data)
+                            self.logger.info(f"Extracted job {i+1}: {job_data['title']}")
+                    except Exception as e:
+                        self.logger.warning(f"Failed to extract job {i+1}: {str(e)}")
+                        continue
             
+            self.timings["extract"] = time.monotonic() - phase_start
+            self._log_timings()
             return jobs
-            
+
+        except CircuitOpenError:
+            raise
         except Exception as e:
             self.logger.error(f"Error searching jobs: {str(e)}")
+            if raise_errors:
+                raise
             return []
+
+    def crawl_jobs(self, job_title, location=None, experience_level=None, max_jobs=100, concurrency=2, limiter=None,
+                   incremental=False):
+        """Collect up to max_jobs unique jobs by walking LinkedIn's start= result offsets.
+
+        Pages are fetched `concurrency` at a time, each after taking a permit
+        from `limiter` (a rate_limit.RateLimiter, default this scraper's).
+        With a driver pool every page in a wave gets its own pooled browser;
+        with a single driver pages are loaded one by one; without any
+        browser the crawl runs on the HTTP engine. Stops early once enough
+        unique jobs are collected or a page adds nothing new. With
+        incremental (True, or a crawl_state.IncrementalCrawl) pages are walked
+        newest first, only jobs not seen before are returned and the crawl
+        stops at the first page that reaches known postings (see
+        crawl_state); as for search_jobs, the watermark only moves when the
+        caller's tracker is finished after storing the jobs.
+        """
+        limiter = limiter or self.limiter
+        tracker = incremental if isinstance(incremental, IncrementalCrawl) else \
+            incremental_crawl(job_title, location, experience_level) if incremental else None
+        return self._crawl_jobs(job_title, location, experience_level, max_jobs, concurrency, limiter, tracker)
+
+    def _crawl_jobs(self, job_title, location, experience_level, max_jobs, concurrency, limiter, incremental):
+        if self.driver is None and self.pool is None:
+            if not self.http:
+                return []
+            experience_code = self._get_experience_level_code(experience_level) if experience_level else None
+            return self.http.crawl(job_title, location, max_jobs, experience_code, concurrency, limiter, incremental) or []
+
+        if self.pool is None:
+            concurrency = 1  # One browser can only show one page at a time
+        jobs = []
+        seen_urls = set()
+        start = 0
+        with ThreadPoolExecutor(max_workers=concurrency) as executor:
+            while len(jobs) < max_jobs and start < MAX_RESULTS_START:
+                offsets = [start + i * RESULTS_PAGE_SIZE for i in range(concurrency)]
+                start += concurrency * RESULTS_PAGE_SIZE
+                futures = [
+                    executor.submit(
+                        self._crawl_page, limiter,
+                        self._build_search_url(job_title, location, experience_level, offset, recent_first=bool(incremental))
+                    )
+                    for offset in offsets
+                ]
+                exhausted = False
+                for future in futures:
+                    page = future.result()
+                    if page is None and not jobs:
+                        # Auth wall on the first page: the public search is all we can do
+                        try:
+                            return self._search_public_jobs(job_title, location, max_jobs, experience_level, incremental)
+                        finally:
+                            self._record_auth_wall(limiter)
+                    if page is None:
+                        self._record_auth_wall(limiter)
+                    new_jobs = [job for job in page or [] if not job["url"] or job["url"] not in seen_urls]
+                    if not new_jobs:
+                        exhausted = True
+                        break
+                    if incremental:
+                        new_jobs, exhausted = incremental.filter_page(new_jobs, max_jobs - len(jobs))
+                    for job in new_jobs:
+                        seen_urls.add(job["url"])
+                        jobs.append(job)
+                    if exhausted:
+                        break
+                self.logger.info(f"[Crawl] {len(jobs)} unique jobs after offset {start - RESULTS_PAGE_SIZE}")
+                if exhausted:
+                    break
+        return jobs[:max_jobs]
+
+    def _crawl_page(self, limiter, search_url):
+        """Scrape one results page, on a pooled browser when a pool is configured"""
+        if self.pool is None:
+            return self._search_page(search_url, RESULTS_PAGE_SIZE, limiter)
+        worker = LinkedInJobScraper(use_cookies=self.use_cookies, pool=self.pool, use_http=False,
+                                    load_budget=self.load_budget, limiter=limiter)
+        worker.setup_driver()
+        try:
+            return worker._search_page(search_url, RESULTS_PAGE_SIZE)
+        finally:
+            worker.close()
     
+    def _scroll_until_stable(self, card_selector, max_jobs, budget, stable_rounds=2, round_timeout=3.0):
+        """Scroll until max_jobs cards are present, the count stops growing, or the budget runs out.
+
+        Each round scrolls to the bottom and waits for new cards with a
+        MutationObserver in the page, falling back to polling if async
+        scripts are unavailable. Returns the final card count.
+        """
+        deadline = time.monotonic() + budget
+        count = self._count_cards(card_selector)
+        if count == 0:
+            return 0  # Nothing rendered at all; scrolling will not help
+        unchanged = 0
+        scroll_num = 0
+        while count < max_jobs and unchanged < stable_rounds:
+            timeout = min(round_timeout, deadline - time.monotonic())
+            if timeout <= 0:
+                self.logger.info("[Scroll] Load budget exhausted.")
+                break
+            scroll_num += 1
+            new_count = self._wait_for_more_cards(card_selector, count, timeout)
+            unchanged = unchanged + 1 if new_count <= count else 0
+            count = new_count
+            self.logger.info(f"[Scroll {scroll_num}] Found {count} job cards so far.")
+        return count
+
+    def _count_cards(self, card_selector):
+        return self.driver.execute_script("return document.querySelectorAll(arguments[0]).length;", card_selector)
+
+    def _wait_for_more_cards(self, card_selector, previous, timeout):
+        """Scroll to the bottom and wait up to timeout seconds for the card count to grow"""
+        try:
+            self.driver.set_script_timeout(timeout + 5)
+            return self.driver.execute_async_script(WAIT_FOR_MORE_CARDS_JS, card_selector, previous, int(timeout * 1000))
+        except WebDriverException as e:
+            self.logger.debug(f"MutationObserver wait failed, polling instead: {str(e)}")
+        self.driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
+        deadline = time.monotonic() + timeout
+        count = self._count_cards(card_selector)
+        while count <= previous and time.monotonic() < deadline:
+            time.sleep(0.25)
+            count = self._count_cards(card_selector)
+        return count
+
+    def _log_timings(self):
+        summary = ", ".join(f"{phase}={seconds:.2f}s" for phase, seconds in self.timings.items())
+        self.logger.info(f"[Timing] {summary}")
+
+    @contextmanager
+    def _no_implicit_wait(self):
+        """Make missing-element lookups return immediately instead of waiting"""
+        self.driver.implicitly_wait(0)
+        try:
+            yield
+        finally:
+            self.driver.implicitly_wait(self.IMPLICIT_WAIT)
+
+    def _probe_layout(self, card_selectors, fields, sample_size=3):
+        """Work out which card and field selectors match the current page.
+
+        Runs once per page with zero implicit wait, so selectors that miss cost
+        nothing. The winning selectors are cached by layout fingerprint (the
+        field map probed, the card selector and the first card's classes) and
+        reused for every card. Only resolved fields are cached: one that no
+        selector matched (e.g. the page was still loading) is probed again on
+        the next page.
+        Returns (layout, job_cards); layout is None if no card selector matched.
+        """
+        with self._no_implicit_wait():
+            job_cards = []
+            for card_selector in card_selectors:
+                job_cards = self.driver.find_elements(By.CSS_SELECTOR, card_selector)
+                if job_cards:
+                    break
+            if not job_cards:
+                return None, []
+
+            # Field maps sharing a card selector (JOB_CARD_FIELDS, PUBLIC_JOB_CARD_FIELDS) resolve differently
+            field_set = tuple((name, tuple(selectors)) for name, selectors in fields.items())
+            fingerprint = (field_set, card_selector, job_cards[0].get_attribute("class") or "")
+            with self._layout_cache_lock:
+                layout = dict(self._layout_cache.get(fingerprint) or {"card": card_selector})
+            unresolved = [name for name, selectors in fields.items() if selectors and not layout.get(name)]
+            if not unresolved:
+                return layout, job_cards
+
+            sample = job_cards[:sample_size]
+            resolved = {}
+            for name in unresolved:
+                layout[name] = None
+                for selector in fields[name]:
+                    elements = [el for card in sample for el in card.find_elements(By.CSS_SELECTOR, selector)]
+                    if elements and (name == "url" or any(el.text.strip() for el in elements)):
+                        layout[name] = resolved[name] = selector
+                        break
+            if resolved:
+                with self._layout_cache_lock:
+                    self._layout_cache.setdefault(fingerprint, {"card": card_selector}).update(resolved)
+                self.logger.info(f"[Layout] Resolved selectors: {layout}")
+            return layout, job_cards
+
+    @staticmethod
+    def _layout_fields(layout, fields):
+        """Narrow a field selector map down to the selectors a layout resolved"""
+        return {name: [layout[name]] if layout.get(name) else [] for name in fields}
+
+    def _empty_outcome(self):
+        """Limiter outcome for a page without job cards: EMPTY if we were redirected away from the results"""
+        try:
+            url = self.driver.current_url
+        except WebDriverException:
+            return EMPTY
+        return EMPTY if any(marker in url for marker in BLOCKED_URL_MARKERS) else NO_RESULTS
+
     def _is_auth_required(self):
         """Check if authentication is required"""
         try:
             # Look for login prompts or restricted content
-            auth_elements = self.driver.find_elements(By.CSS_SELECTOR, ".auth-wall, .login-prompt, .sign-in-prompt")
+            with self._no_implicit_wait():
+                auth_elements = self.driver.find_elements(By.CSS_SELECTOR, AUTH_WALL_SELECTOR)
             return len(auth_elements) > 0
         except:
             return False
     
-    def _search_public_jobs(self, job_title, location, max_jobs):
+    def _search_public_jobs(self, job_title, location, max_jobs, experience_level=None, incremental=None,
+                            raise_errors=False):
         """Search for jobs using public LinkedIn job search (limited results)"""
         try:
             self.logger.info("Using public job search (limited results)")
+
+            # Fast path: plain HTTP + BeautifulSoup, no browser needed
+            if self.http:
+                experience_code = self._get_experience_level_code(experience_level) if experience_level else None
+                jobs = self.http.search(job_title, location, max_jobs, experience_code, incremental)
+                if jobs is not None:
+                    return jobs
+                self.logger.info("HTTP search needs JavaScript, falling back to Selenium")
+
+            if self.driver is None:
+                self.logger.warning("No browser available for public job search fallback")
+                return []
             
             # Use a different approach for public access
             search_url = f"https://www.linkedin.com/jobs/search/?keywords={job_title.replace(' ', '%20')}"
             if location:
                 search_url += f"&location={location.replace(' ', '%20')}"
+            if incremental:
+                search_url += "&sortBy=DD"
             
+            self.limiter.acquire("public search")
             self.driver.get(search_url)
-            time.sleep(5)
-            
-            # Try to find job listings with different selectors
-            selectors = [
-                ".job-card-job-posting-card-wrapper__entity-lockup",
-                ".job-search-card",
-                ".job-card-container",
-                ".job-card",
-                "[data-job-id]"
-            ]
-            
-            job_cards = []
-            for selector in selectors:
-                job_cards = self.driver.find_elements(By.CSS_SELECTOR, selector)
-                if job_cards:
-                    break
+            try:
+                with self._no_implicit_wait():
+                    WebDriverWait(self.driver, min(15, self.load_budget), poll_frequency=0.25).until(
+                        lambda d: d.find_elements(By.CSS_SELECTOR, ", ".join(PUBLIC_CARD_SELECTORS))
+                    )
+            except TimeoutException:
+                self.logger.warning("[Wait] Timeout waiting for public job cards to appear.")
+
+            # Find which of the known layouts this page uses
+            layout, job_cards = self._probe_layout(PUBLIC_CARD_SELECTORS, PUBLIC_JOB_CARD_FIELDS)
+            if not layout:
+                self.limiter.record(self._empty_outcome())
+                return []
+            self.limiter.record(SUCCESS)
+            fields = self._layout_fields(layout, PUBLIC_JOB_CARD_FIELDS)
+
+            bulk_jobs = self._extract_jobs_bulk(layout["card"], fields, max_jobs, "LinkedIn (Public)")
+            if bulk_jobs:
+                return incremental.filter_page(bulk_jobs, max_jobs)[0] if incremental else bulk_jobs
             
             jobs = []
-            for i, card in enumerate(job_cards[:max_jobs]):
-                try:
-                    job_data = self._extract_job_data_public(card)
-                    if job_data:
-                        jobs.append(job_data)
-                except Exception as e:
-                    continue
-            
-            return jobs
+            with self._no_implicit_wait():
+                for i, card in enumerate(job_cards[:max_jobs]):
+                    try:
+                        job_data = self._extract_job_data_public(card, fields)
+                        if job_data:
+                            jobs.append(job_data)
+                    except Exception as e:
+                        continue
             
+            return incremental.filter_page(jobs, max_jobs)[0] if incremental else jobs
+
+        except CircuitOpenError:
+            raise
         except Exception as e:
             self.logger.error(f"Error in public job search: {str(e)}")
+            if raise_errors:
+                raise
             return []
     
+    def _extract_jobs_bulk(self, card_selector, fields, max_jobs, source):
+        """Extract all job cards with one execute_script call.
+
+        Returns the same dicts as _extract_job_data / _extract_job_data_public,
+        or None if the script failed and the per-element path should be used.
+        """
+        try:
+            payload = self.driver.execute_script(BULK_EXTRACT_JS, card_selector, fields, max_jobs)
+            rows = json.loads(payload)
+        except Exception as e:
+            self.logger.warning(f"Bulk extraction failed, falling back to per-card extraction: {str(e)}")
+            return None
+
+        public = source != "LinkedIn"
+        jobs = []
+        for row in rows:
+            title = row.get("title")
+            if not title:
+                if not public:
+                    continue  # _extract_job_data skips cards without a title
+                title = "Unknown Title"
+            jobs.append({
+                "title": title,
+                "company": row.get("company") or "Unknown Company",
+                "location": row.get("location") or "Unknown Location",
+                "url": row.get("url") or "",
+                "posted_time": row.get("posted_time") or "Unknown",
+                "source": source
+            })
+        return jobs
+
     def _extract_job_data(self, job_card):
         """Extract job data from a job card element"""
         try:
@@ -266,13 +889,15 @@ class LinkedInJobScraper:
             self.logger.warning(f"Error extracting job data: {str(e)}")
             return None
     
-    def _extract_job_data_public(self, job_card):
+    def _extract_job_data_public(self, job_card, fields=None):
         """Extract job data from public job search results"""
         try:
-            # Try multiple selectors for different LinkedIn layouts
-            title_selectors = [".job-search-card__title", ".job-card__title", "h3", "h4"]
-            company_selectors = [".job-search-card__subtitle", ".job-card__company", ".company-name"]
-            location_selectors = [".job-search-card__location", ".job-card__location", ".location"]
+            # Try multiple selectors for different LinkedIn layouts, or only the
+            # ones a layout probe resolved
+            fields = fields or PUBLIC_JOB_CARD_FIELDS
+            title_selectors = fields["title"]
+            company_selectors = fields["company"]
+            location_selectors = fields["location"]
             
             title = "Unknown Title"
             company = "Unknown Company"
@@ -310,11 +935,13 @@ class LinkedInJobScraper:
                     continue
             
             # Extract URL
-            try:
-                link_element = job_card.find_element(By.CSS_SELECTOR, "a")
-                job_url = link_element.get_attribute("href")
-            except:
-                pass
+            for selector in fields["url"]:
+                try:
+                    link_element = job_card.find_element(By.CSS_SELECTOR, selector)
+                    job_url = link_element.get_attribute("href")
+                    break
+                except:
+                    continue
             
             return {
                 "title": title,
@@ -343,12 +970,45 @@ class LinkedInJobScraper:
     
     def close(self):
         """Close the browser"""
-        if self.driver:
+        if self.driver and self.pool:
+            self.pool.checkin(self.driver)
+            self.driver = None
+            self.logger.info("Browser returned to pool")
+        elif self.driver:
             self.driver.quit()
+            self.driver = None
+            get_browser_admission().release()
             self.logger.info("Browser closed")
 
+class CrawlLimitReached(Exception):
+    """Raised from a scraper callback to stop a worker once enough jobs are collected"""
+
+def build_paginated_queries(job_title, location, filters, max_jobs, concurrency):
+    """Split a search into Query shards that start at different result pages.
+
+    Each shard gets its own page_offset, so scraper workers walk disjoint
+    ranges of LinkedIn's start= offsets in parallel instead of all paging
+    from the first result.
+    """
+    pages = max(1, math.ceil(max_jobs / RESULTS_PAGE_SIZE))
+    shards = max(1, min(concurrency, pages))
+    pages_per_shard = math.ceil(pages / shards)
+    return [
+        Query(
+            query=job_title,
+            options=QueryOptions(
+                locations=[location] if location else [],
+                limit=min(pages_per_shard * RESULTS_PAGE_SIZE, max_jobs),
+                filters=filters,
+                page_offset=shard * pages_per_shard
+            )
+        )
+        for shard in range(shards)
+    ]
+
 # Tool function for CrewAI
-def linkedin_job_search_tool(job_title, location=None, experience_level=None, max_jobs=10, li_at_cookie=None):
+def linkedin_job_search_tool(job_title, location=None, experience_level=None, max_jobs=10, li_at_cookie=None, concurrency=1,
+                             on_job=None, use_cache=True, store=False, incremental=False):
     """
     Search for jobs on LinkedIn using py-linkedin-jobs-scraper
     Args:
@@ -357,10 +1017,179 @@ def linkedin_job_search_tool(job_title, location=None, experience_level=None, ma
         experience_level (str): Experience level (internship, entry, associate, mid-senior, senior, executive)
         max_jobs (int): Maximum number of jobs to return
         li_at_cookie (str): LinkedIn session cookie for authenticated search
+        concurrency (int): Number of browsers crawling result pages in parallel
+        on_job (callable): Called from the scraper thread with each job as soon as it is scraped
+        use_cache (bool): Serve repeat searches from the shared search cache
+        store (bool): Queue every scraped job for the database (write-behind, never blocks on the DB)
+        incremental (bool or crawl_state.IncrementalCrawl): Return only jobs not seen before, newest
+            first, and stop paging at the first known posting (see crawl_state); bypasses the cache.
+            The watermark only moves once the jobs are stored: with True, when store is set and the
+            writer has flushed them; with a tracker, when the caller calls its finish()
     Returns:
         list: List of job dictionaries
     """
+    key = normalize_query(job_title, location, experience_level, authenticated=bool(li_at_cookie), namespace="linkedin_jobs_scraper")
+
+    writer = get_job_writer() if store else None
+
+    def produce(emit, tracker=None):
+        def on_scraped(job):
+            if writer:
+                writer.put(job)
+            emit(job)
+        return _scrape_linkedin_jobs(job_title, location, experience_level, max_jobs, li_at_cookie, concurrency, on_scraped,
+                                     tracker)
+
+    if incremental:
+        # Its answer moves with every crawl, so it is neither cached nor shared with concurrent callers
+        if isinstance(incremental, IncrementalCrawl):
+            return produce(on_job or (lambda job: None), incremental)[0]
+        tracker = incremental_crawl(job_title, location, experience_level)
+        jobs, _ = produce(on_job or (lambda job: None), tracker)
+        # Jobs never stored would otherwise count as known to the next crawl and never be ingested
+        if writer and writer.flush():
+            tracker.finish()
+        return jobs
+
+    def scrape(callback):
+        # Identical searches already running are joined: one browser run, streamed to every caller
+        try:
+            return _search_flights.do(f"{key}|{max_jobs}", produce, callback)
+        except CrawlLimitReached:
+            return [], False  # This caller's consumer stopped while following another caller's scrape
+
+    if not use_cache:
+        return scrape(on_job)[0]
+
+    scraped = False
+
+    def compute():
+        nonlocal scraped
+        scraped = True
+        return scrape(on_job)
+
+    jobs = get_search_cache().get_or_compute(key, max_jobs, compute, refresh=lambda: scrape(None))
+    if on_job and not scraped:
+        # Cache hit: replay the jobs to the streaming consumer
+        for job in jobs:
+            try:
+                on_job(job)
+            except CrawlLimitReached:
+                break
+    return jobs
+
+def expand_searches(job_titles, locations=(None,), experience_levels=(None,)):
+    """Every (title, location, experience) combination, as search dicts for linkedin_batch_search_tool"""
+    return [
+        {"job_title": title, "location": location, "experience_level": experience}
+        for title in job_titles
+        for location in (locations or (None,))
+        for experience in (experience_levels or (None,))
+    ]
+
+def _search_label(search):
+    return " | ".join(str(search.get(field) or "any") for field in ("job_title", "location", "experience_level"))
+
+def linkedin_batch_search_tool(searches, max_jobs_per_query=10, li_at_cookie=None, workers=None,
+                               on_job=None, use_cache=True, store=False, incremental=False):
+    """
+    Run many searches in parallel and merge their results
+    Args:
+        searches (list): Search dicts with job_title, location and experience_level (see expand_searches),
+            or (job_title, location, experience_level) tuples
+        max_jobs_per_query (int): Maximum number of jobs per search
+        li_at_cookie (str): LinkedIn session cookie for authenticated search
+        workers (int): Searches running at once (default: all of them; live browsers are still
+            capped by the shared browser admission)
+        on_job (callable): Called with each merged job the first time any search finds it
+        use_cache, store, incremental: As for linkedin_job_search_tool
+    Returns:
+        list: Jobs deduplicated across searches (by URL, then near-duplicates), in search order;
+            each tagged with "queries", the labels of every search that found it
+    """
+    searches = [
+        search if isinstance(search, dict) else dict(zip(("job_title", "location", "experience_level"), search))
+        for search in searches
+    ]
+    if not searches:
+        return []
+    logger = logging.getLogger(__name__)
+    merged = {}
+    reposts = NearDuplicateIndex()
+    merged_lock = threading.Lock()
+
+    def merge(job, label):
+        """Tag a job with the search that found it; returns it if it is new across the batch"""
+        key = job.get("url") or id(job)
+        with merged_lock:
+            existing = merged.get(key)
+            if existing is None:
+                original = reposts.add(key, job)
+                existing = merged.get(original) if original is not None else None
+            if existing is not None:
+                if label not in existing["queries"]:
+                    existing["queries"].append(label)
+                merged.setdefault(key, existing)
+                return None
+            # Copy: the job may be the search cache's own object
+            job = merged[key] = dict(job, queries=[label])
+            return job
+
+    def run(search):
+        label = _search_label(search)
+
+        def on_found(job):
+            job = merge(job, label)
+            if job is not None and on_job:
+                on_job(job)
+
+        return linkedin_job_search_tool(
+            search["job_title"], search.get("location"), search.get("experience_level"),
+            max_jobs=max_jobs_per_query, li_at_cookie=li_at_cookie, on_job=on_found,
+            use_cache=use_cache, store=store, incremental=incremental
+        )
+
+    started = time.time()
+    errors = []
+    with ThreadPoolExecutor(max_workers=workers or min(len(searches), 16), thread_name_prefix="batch-search") as pool:
+        futures = [pool.submit(run, search) for search in searches]
+        per_search = []
+        for search, future in zip(searches, futures):
+            try:
+                per_search.append(future.result())
+            except Exception as e:
+                logger.error(f"[BATCH] Search '{_search_label(search)}' failed: {str(e)}")
+                errors.append(e)
+                per_search.append([])
+    if errors and len(errors) == len(searches):
+        raise errors[0]
+
+    # Searches may have returned jobs without streaming them (e.g. a follower cancelled early)
+    for search, jobs in zip(searches, per_search):
+        for job in jobs:
+            merge(job, _search_label(search))
+    results = []
+    seen = set()
+    for jobs in per_search:
+        for job in jobs:
+            kept = merged[job.get("url") or id(job)]
+            if id(kept) not in seen:
+                seen.add(id(kept))
+                results.append(kept)
+    logger.info(f"[BATCH] {len(searches)} searches, {len(results)} unique jobs in {time.time() - started:.1f}s")
+    return results
+
+def _scrape_linkedin_jobs(job_title, location, experience_level, max_jobs, li_at_cookie, concurrency, on_job,
+                          incremental=None):
+    """Run py-linkedin-jobs-scraper; returns (jobs, cacheable)"""
     results = []
+    seen_urls = set()
+    reposts = NearDuplicateIndex()
+    results_lock = threading.Lock()
+    enough = threading.Event()
+    cancelled = threading.Event()
+    paused = []
+    limiter = get_rate_limiter()
     logger = logging.getLogger("py-linkedin-jobs-scraper-wrapper")
     logger.setLevel(logging.INFO)
     
@@ -384,6 +1213,15 @@ def linkedin_job_search_tool(job_title, location=None, experience_level=None, ma
         exp_filter = exp_map.get(key, None)  # Ignore invalid values
 
     def on_data(data):
+        if enough.is_set():
+            raise CrawlLimitReached()
+        try:
+            # Each job is a click and a detail request; its permit is taken before the scraper moves on
+            limiter.acquire("next job")
+        except CircuitOpenError as e:
+            paused.append(e)
+            enough.set()
+            raise CrawlLimitReached()
         job = {
             "title": data.title,
             "company": data.company,
@@ -393,12 +1231,39 @@ def linkedin_job_search_tool(job_title, location=None, experience_level=None, ma
             "posted_time": data.date,
             "source": "LinkedIn"
         }
-        results.append(job)
+        with results_lock:
+            # Page shards can overlap, so keep only the first copy of each posting
+            if job["url"] and job["url"] in seen_urls:
+                return
+            seen_urls.add(job["url"])
+            if incremental:
+                # Results come newest first: a known posting means everything after it is known too
+                new_jobs, reached = incremental.filter_page([job], max_jobs - len(results))
+                if reached:
+                    enough.set()
+                if not new_jobs:
+                    raise CrawlLimitReached()
+            # The same role reposted under another URL or location
+            if reposts.add(job["url"], job) is not None:
+                return
+            results.append(job)
+            if len(results) >= max_jobs:
+                enough.set()
         logger.info(f"[DATA] {job['title']} at {job['company']}")
+        if on_job:
+            try:
+                on_job(job)
+            except CrawlLimitReached:
+                # The consumer has enough jobs; stop this worker without an error
+                cancelled.set()
+                enough.set()
+                raise
         # Removed scraper.stop() as it is not supported
 
     def on_error(error):
         logger.error(f"[ERROR] {error}")
+        if "429" in str(error) or "Too Many Requests" in str(error):
+            limiter.record(RATE_LIMITED)
 
     def on_end():
         logger.info("[END]")
@@ -407,8 +1272,9 @@ def linkedin_job_search_tool(job_title, location=None, experience_level=None, ma
         chrome_executable_path=None,
         chrome_options=None,
         headless=True,
-        max_workers=1,
-        slow_mo=0.5,
+        max_workers=max(1, concurrency),
+        # Only spaces the library's own UI actions; request pacing is the limiter's permits
+        slow_mo=limiter.jitter.min_delay,
         page_load_timeout=40
     )
     scraper.on(Events.DATA, on_data)
@@ -416,20 +1282,44 @@ def linkedin_job_search_tool(job_title, location=None, experience_level=None, ma
     scraper.on(Events.END, on_end)
 
     filters = QueryFilters(
-        experience=[exp_filter] if exp_filter else None
+        experience=[exp_filter] if exp_filter else None,
+        relevance=RelevanceFilters.RECENT if incremental else None
     )
-    queries = [
-        Query(
-            query=job_title,
-            options=QueryOptions(
-                locations=[location] if location else [],
-                limit=max_jobs,
-                filters=filters
+    if concurrency > 1 and max_jobs > RESULTS_PAGE_SIZE:
+        queries = build_paginated_queries(job_title, location, filters, max_jobs, concurrency)
+    else:
+        queries = [
+            Query(
+                query=job_title,
+                options=QueryOptions(
+                    locations=[location] if location else [],
+                    limit=max_jobs,
+                    filters=filters
+                )
             )
-        )
-    ]
-    scraper.run(queries)
-    return results
+        ]
+    limiter.acquire("search")
+    try:
+        with get_browser_admission().slots(max(1, concurrency)):
+            scraper.run(queries)
+    except Exception:
+        # Workers still paging after the limit was reached are stopped by raising
+        # CrawlLimitReached from on_data; anything else is a real failure
+        if not enough.is_set():
+            raise
+    if incremental and (paused or cancelled.is_set()):
+        # A crawl cut short must not move the watermark past jobs it never reached
+        incremental.interrupted = True
+    if paused:
+        if not results:
+            raise paused[0]
+        logger.warning(f"[PAUSED] {paused[0]}; returning {len(results)} jobs found so far")
+        return results[:max_jobs], False
+    # The library does not expose the page, so an empty result cannot be told from a block:
+    # only the rate-limit errors it reports count against the breaker
+    limiter.record(SUCCESS if results else NO_RESULTS)
+    # A search the consumer cut short is incomplete and must not be cached
+    return results[:max_jobs], not cancelled.is_set()
 
 if __name__ == "__main__":
     # Test the scraper
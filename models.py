@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String, Text, DateTime, ForeignKey, Boolean
+from sqlalchemy import Column, Integer, String, Text, DateTime, ForeignKey, Boolean, Index, LargeBinary, JSON, Float
 from sqlalchemy.orm import declarative_base, relationship
 from sqlalchemy.sql import func
 
@@ -14,10 +14,28 @@ class Job(Base):
     requirements = Column(Text)
     salary_range = Column(String(100))
     job_url = Column(String(500), nullable=False)
+    source = Column(String(100))
     posted_date = Column(DateTime)
     created_at = Column(DateTime, server_default=func.now())
+    updated_at = Column(DateTime, index=True)  # Set when a re-scraped job overwrites the stored row (dedup.py reads changes by it)
+    # Near-duplicate detection (dedup.py): reposts point at the job they duplicate
+    canonical_id = Column(Integer, ForeignKey("jobs.id"), index=True)
+    fingerprint = Column(LargeBinary)  # MinHash signature
+    skills = Column(JSON)  # Canonical skills found in the description (skills.py)
     resumes = relationship("OptimizedResume", back_populates="job")
     referrals = relationship("Referral", back_populates="job")
+    __table_args__ = (
+        # ingest.upsert_jobs conflicts on the URL; an index (not a column constraint) so init_db adds it to old tables
+        Index("ux_jobs_job_url", "job_url", unique=True),
+        # Keyset pagination in job_query: one (sort column, id) index per sort field
+        Index("ix_jobs_title_id", "title", "id"),
+        Index("ix_jobs_company_id", "company", "id"),
+        Index("ix_jobs_location_id", "location", "id"),
+        Index("ix_jobs_posted_date_id", "posted_date", "id"),
+        # Company / location filters browsed by posted date
+        Index("ix_jobs_company_posted_date_id", "company", "posted_date", "id"),
+        Index("ix_jobs_location_posted_date_id", "location", "posted_date", "id"),
+    )
 
 class OptimizedResume(Base):
     __tablename__ = "optimized_resumes"
@@ -26,6 +44,7 @@ class OptimizedResume(Base):
     original_resume_path = Column(String(500), nullable=False)
     optimized_resume_path = Column(String(500), nullable=False)
     optimization_notes = Column(Text)
+    skills = Column(JSON)  # Canonical skills found in the optimized resume (skills.py)
     created_at = Column(DateTime, server_default=func.now())
     job = relationship("Job", back_populates="resumes")
 
@@ -41,4 +60,39 @@ class Referral(Base):
     introduction_needed = Column(Boolean, default=False)
     notes = Column(Text)
     created_at = Column(DateTime, server_default=func.now())
-    job = relationship("Job", back_populates="referrals") 
\ No newline at end of file
+    job = relationship("Job", back_populates="referrals")
+
+# A search the scheduler (scheduler.py) re-runs in the background
+class SavedSearch(Base):
+    __tablename__ = "saved_searches"
+    id = Column(Integer, primary_key=True)
+    query_key = Column(String(500), nullable=False, unique=True)  # search_cache.normalize_query
+    job_title = Column(String(255), nullable=False)
+    location = Column(String(255))
+    experience_level = Column(String(50))
+    max_jobs = Column(Integer, nullable=False, default=25)
+    interval_minutes = Column(Integer, nullable=False, default=60)
+    enabled = Column(Boolean, nullable=False, default=True)
+    next_run_at = Column(DateTime, index=True)
+    last_run_at = Column(DateTime)
+    runs = Column(Integer, nullable=False, default=0)
+    # Moving average of new jobs per run; due searches with the best yield run first
+    yield_score = Column(Float, nullable=False, default=1.0)
+    last_new_jobs = Column(Integer, nullable=False, default=0)
+    last_error = Column(Text)
+    last_viewed_at = Column(DateTime)  # When the app last showed its results
+    created_at = Column(DateTime, server_default=func.now())
+    jobs = relationship("SavedSearchJob", back_populates="saved_search")
+
+# A job a saved search has found, and when
+class SavedSearchJob(Base):
+    __tablename__ = "saved_search_jobs"
+    saved_search_id = Column(Integer, ForeignKey("saved_searches.id"), primary_key=True)
+    job_id = Column(Integer, ForeignKey("jobs.id"), primary_key=True)
+    found_at = Column(DateTime, nullable=False)
+    saved_search = relationship("SavedSearch", back_populates="jobs")
+    job = relationship("Job")
+    __table_args__ = (
+        # A search's jobs, newest first, and those found since the last visit
+        Index("ix_saved_search_jobs_search_found", "saved_search_id", "found_at"),
+    )
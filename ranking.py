@@ -0,0 +1,149 @@
+import math
+import re
+import threading
+from collections import Counter
+import numpy as np
+import scipy.sparse as sp
+
+STOP_WORDS = frozenset("""
+a about above after all also an and any are as at be been being both but by can could did do does doing
+each etc for from had has have having he her here his how i if in into is it its just me more most must
+my no not of on one or other our out over own per same she should so some such than that the their them
+then there these they this those through to too under until up very was we were what when where which
+while who whom why will with within would you your yours able across well work working team role job
+""".split())
+
+def tokenize(text):
+    """Lowercased terms, keeping tech tokens such as c++, c# and node.js intact"""
+    terms = re.findall(r"[a-z0-9][a-z0-9+#.-]*[a-z0-9+#]|[a-z0-9]", (text or "").lower())
+    return [term for term in terms if term not in STOP_WORDS and not term.isdigit()]
+
+def job_text(job):
+    return " ".join(str(job.get(field) or "") for field in ("title", "company", "description"))
+
+class JobRanker:
+    """Scores jobs against a resume with sparse TF-IDF vectors and cosine similarity.
+
+    Jobs are added incrementally: each batch only tokenizes the new jobs,
+    grows the vocabulary and document frequencies, and appends rows to a
+    CSR matrix of sublinear term frequencies. IDF weights and row norms are
+    derived from that matrix at ranking time, so adding jobs never
+    re-vectorizes the corpus, and scoring every job is one sparse
+    matrix-vector product. Jobs are keyed by URL; re-adding one is a no-op.
+    """
+    def __init__(self):
+        self.vocabulary = {}
+        self.jobs = []
+        self._keys = {}
+        self._df = np.zeros(0, dtype=np.float64)
+        self._matrix = sp.csr_matrix((0, 0), dtype=np.float64)
+        self._pending = []  # (columns, weights) rows not yet stacked into the matrix
+        self._idf = self._row_norms = None
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self.jobs)
+
+    def _term_weights(self, text, grow):
+        counts = Counter(tokenize(text))
+        columns, weights = [], []
+        for term, count in counts.items():
+            column = self.vocabulary.get(term)
+            if column is None:
+                if not grow:
+                    continue
+                column = self.vocabulary[term] = len(self.vocabulary)
+            columns.append(column)
+            weights.append(1.0 + math.log(count))
+        return np.array(columns, dtype=np.int64), np.array(weights, dtype=np.float64)
+
+    def add_jobs(self, jobs):
+        """Vectorize and index new jobs; returns how many were added"""
+        added = 0
+        with self._lock:
+            for job in jobs:
+                key = job.get("url") or job.get("job_url") or id(job)
+                if key in self._keys:
+                    continue
+                self._keys[key] = len(self.jobs)
+                self.jobs.append(job)
+                self._pending.append(self._term_weights(job_text(job), grow=True))
+                added += 1
+        return added
+
+    def _consolidate(self):
+        """Stack pending rows onto the matrix and update document frequencies"""
+        n_terms = len(self.vocabulary)
+        if self._pending:
+            indptr = np.cumsum([0] + [len(columns) for columns, _ in self._pending])
+            block = sp.csr_matrix(
+                (np.concatenate([weights for _, weights in self._pending]),
+                 np.concatenate([columns for columns, _ in self._pending]),
+                 indptr),
+                shape=(len(self._pending), n_terms)
+            )
+            self._pending = []
+            if self._matrix.shape[1] < n_terms:
+                self._matrix.resize((self._matrix.shape[0], n_terms))
+            self._matrix = sp.vstack([self._matrix, block], format="csr")
+            self._df = np.concatenate([self._df, np.zeros(n_terms - len(self._df))])
+            self._df += np.bincount(block.indices, minlength=n_terms)
+            self._idf = self._row_norms = None
+        if self._idf is None:
+            self._idf = np.log((1.0 + len(self.jobs)) / (1.0 + self._df)) + 1.0
+            # Norms of the TF-IDF rows (tf * idf), reused until more jobs are added
+            self._row_norms = np.sqrt(self._matrix.multiply(self._matrix) @ (self._idf ** 2))
+            self._row_norms[self._row_norms == 0] = 1.0
+        return self._matrix
+
+    def tfidf(self):
+        """(L2-normalized TF-IDF rows of every job, terms by column) for other vector stages"""
+        with self._lock:
+            matrix = self._consolidate()
+            weighted = matrix @ sp.diags(self._idf)
+            normalized = sp.diags(1.0 / self._row_norms) @ weighted
+            terms = [None] * len(self.vocabulary)
+            for term, column in self.vocabulary.items():
+                terms[column] = term
+            return normalized.tocsr(), terms
+
+    def rank(self, resume_text, top_k=10, matched_terms=10):
+        """Top-k jobs for a resume: [{"job", "score", "matched_terms"}], best first"""
+        with self._lock:
+            matrix = self._consolidate()
+            if not self.jobs:
+                return []
+            idf = self._idf
+            columns, weights = self._term_weights(resume_text, grow=False)
+            if not len(columns):
+                return []
+            query = np.zeros(len(self.vocabulary))
+            query[columns] = weights * idf[columns]
+            query /= np.linalg.norm(query)
+            # Cosine similarity of every TF-IDF row with the query
+            scores = (matrix @ (idf * query)) / self._row_norms
+            top_k = min(top_k, len(scores))
+            top = np.argpartition(-scores, top_k - 1)[:top_k]
+            top = top[np.argsort(-scores[top])]
+            query_columns = set(columns.tolist())
+            terms = {column: term for term, column in self.vocabulary.items() if column in query_columns}
+            results = []
+            for row in top:
+                if scores[row] <= 0:
+                    break
+                start, end = matrix.indptr[row], matrix.indptr[row + 1]
+                row_columns = matrix.indices[start:end]
+                contribution = matrix.data[start:end] * idf[row_columns] * query[row_columns]
+                order = np.argsort(-contribution)[:matched_terms]
+                results.append({
+                    "job": self.jobs[row],
+                    "score": float(scores[row]),
+                    "matched_terms": [terms[row_columns[i]] for i in order if contribution[i] > 0]
+                })
+            return results
+
+def rank_jobs(resume_text, jobs, top_k=10):
+    """One-off ranking of a list of job dicts against a resume (see JobRanker)"""
+    ranker = JobRanker()
+    ranker.add_jobs(jobs)
+    return ranker.rank(resume_text, top_k)
@@ -0,0 +1,304 @@
+import logging
+import os
+import random
+import sqlite3
+import threading
+import time
+from contextlib import contextmanager
+
+class JitterPolicy:
+    """Human-like random pauses between requests to LinkedIn.
+
+    Kept separate from the page loading logic so waits for content never
+    include artificial delays, and pacing can be tuned (or disabled with
+    min_delay=max_delay=0) in one place.
+    """
+    def __init__(self, min_delay=1.0, max_delay=2.0):
+        self.min_delay = min_delay
+        self.max_delay = max_delay
+        self.logger = logging.getLogger(__name__)
+
+    def delay(self):
+        return random.uniform(self.min_delay, self.max_delay)
+
+    def pause(self, label="request"):
+        """Sleep for a jittered interval and return how long it was"""
+        delay = self.delay()
+        if delay > 0:
+            self.logger.info(f"[SlowMo] Waiting {delay:.2f} seconds before {label}...")
+            time.sleep(delay)
+        return delay
+
+class TokenBucket:
+    """Thread-safe token bucket: `rate` permits per second, bursts up to `capacity`"""
+    def __init__(self, rate=1.0, capacity=1):
+        self.rate = rate
+        self.capacity = capacity
+        self._tokens = capacity
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def _refill(self):
+        now = time.monotonic()
+        self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+    def acquire(self, tokens=1):
+        """Block until `tokens` permits are available and take them"""
+        while True:
+            with self._lock:
+                self._refill()
+                if self._tokens >= tokens:
+                    self._tokens -= tokens
+                    return
+                wait = (tokens - self._tokens) / self.rate
+            time.sleep(wait)
+
+# How a request went, as reported back to the limiter. EMPTY is an empty page that looks blocked
+# (a redirect, challenge or non-job page); NO_RESULTS is a search that legitimately matched nothing
+SUCCESS, NO_RESULTS, EMPTY, RATE_LIMITED, AUTH_WALL = "success", "no_results", "empty", "rate_limited", "auth_wall"
+
+class CircuitOpenError(RuntimeError):
+    """LinkedIn traffic is paused after rate limiting, an auth wall or repeated empty pages"""
+    def __init__(self, reason, retry_in):
+        super().__init__(f"LinkedIn requests paused for {retry_in:.0f}s after {reason}")
+        self.reason = reason
+        self.retry_in = retry_in
+
+class _SharedState:
+    """SQLite file holding limiter state; every process that opens the same file shares it"""
+    def __init__(self, path):
+        self.path = path
+        conn = sqlite3.connect(path, timeout=30)
+        try:
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS token_buckets (name TEXT PRIMARY KEY, tokens REAL NOT NULL, updated_at REAL NOT NULL)"
+            )
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS circuit_breakers (name TEXT PRIMARY KEY, failures INTEGER NOT NULL, "
+                "trips INTEGER NOT NULL, open_until REAL NOT NULL, half_open INTEGER NOT NULL, reason TEXT)"
+            )
+            conn.commit()
+        finally:
+            conn.close()
+
+    @contextmanager
+    def transaction(self):
+        """Exclusive read-modify-write across threads and processes"""
+        conn = sqlite3.connect(self.path, timeout=30, isolation_level=None)
+        try:
+            conn.execute("BEGIN IMMEDIATE")
+            try:
+                yield conn
+                conn.execute("COMMIT")
+            except BaseException:
+                conn.execute("ROLLBACK")
+                raise
+        finally:
+            conn.close()
+
+class SharedTokenBucket:
+    """Token bucket kept in a _SharedState, so all processes draw from one budget"""
+    def __init__(self, state, name="linkedin", rate=0.5, capacity=3):
+        self.state = state
+        self.name = name
+        self.rate = rate
+        self.capacity = capacity
+
+    def try_acquire(self, tokens=1):
+        """Take `tokens` permits if available; otherwise return the seconds until they will be"""
+        now = time.time()
+        with self.state.transaction() as conn:
+            row = conn.execute("SELECT tokens, updated_at FROM token_buckets WHERE name = ?", (self.name,)).fetchone()
+            available = self.capacity if row is None else min(self.capacity, row[0] + max(0.0, now - row[1]) * self.rate)
+            wait = 0.0
+            if available >= tokens:
+                available -= tokens
+            else:
+                wait = (tokens - available) / self.rate
+            conn.execute(
+                "INSERT INTO token_buckets (name, tokens, updated_at) VALUES (?, ?, ?) "
+                "ON CONFLICT(name) DO UPDATE SET tokens = excluded.tokens, updated_at = excluded.updated_at",
+                (self.name, available, now)
+            )
+        return wait
+
+    def acquire(self, tokens=1):
+        while True:
+            wait = self.try_acquire(tokens)
+            if not wait:
+                return
+            # A little spread so waiting processes don't all retry at the same instant
+            time.sleep(wait + random.uniform(0, 0.05))
+
+class CircuitBreaker:
+    """Stops all traffic for a cooldown when LinkedIn pushes back, shared through a _SharedState.
+
+    An auth wall or a 429 trips it at once; empty pages that look blocked
+    trip it after `failure_threshold` in a row (zero-result searches are
+    answers, and count as successes). Each consecutive trip doubles the cooldown
+    (up to max_cooldown, and at least any Retry-After). When the cooldown
+    ends one request goes through as a probe while the rest keep waiting:
+    success closes the breaker, failure reopens it.
+    """
+    def __init__(self, state, name="linkedin", failure_threshold=3, cooldown=60.0, max_cooldown=1800.0):
+        self.state = state
+        self.name = name
+        self.failure_threshold = failure_threshold
+        self.cooldown = cooldown
+        self.max_cooldown = max_cooldown
+        self.logger = logging.getLogger(__name__)
+
+    def _load(self, conn):
+        row = conn.execute(
+            "SELECT failures, trips, open_until, half_open, reason FROM circuit_breakers WHERE name = ?", (self.name,)
+        ).fetchone()
+        return list(row) if row else [0, 0, 0.0, 0, None]
+
+    def _save(self, conn, failures, trips, open_until, half_open, reason):
+        conn.execute(
+            "INSERT OR REPLACE INTO circuit_breakers (name, failures, trips, open_until, half_open, reason) "
+            "VALUES (?, ?, ?, ?, ?, ?)",
+            (self.name, failures, trips, open_until, half_open, reason)
+        )
+
+    def before_request(self, claim_probe=True):
+        """Raise CircuitOpenError while the breaker is open.
+
+        With claim_probe=False an expired cooldown is only noted, so a
+        caller can fail fast before queueing for a permit and claim the
+        probe once it has one.
+        """
+        now = time.time()
+        with self.state.transaction() as conn:
+            failures, trips, open_until, half_open, reason = self._load(conn)
+            if not open_until:
+                return
+            if now < open_until:
+                raise CircuitOpenError(reason, open_until - now)
+            if not claim_probe:
+                return
+            # Cooldown over: this request is the probe; hold the others until it reports back
+            self._save(conn, failures, trips, now + self.cooldown, 1, reason)
+        self.logger.info(f"[Breaker] Probing LinkedIn after {reason}")
+
+    def record_success(self):
+        with self.state.transaction() as conn:
+            failures, trips, open_until, half_open, reason = self._load(conn)
+            # A late success from before the trip does not close an open breaker; only the probe does
+            if open_until and not half_open:
+                return
+            if half_open:
+                self.logger.info("[Breaker] Closed")
+            if failures or trips or open_until:
+                self._save(conn, 0, 0, 0.0, 0, None)
+
+    def record_failure(self, reason, retry_after=None):
+        now = time.time()
+        with self.state.transaction() as conn:
+            failures, trips, open_until, half_open, _ = self._load(conn)
+            if open_until and not half_open:
+                return  # Already open; requests in flight when it tripped don't extend it
+            failures += 1
+            if half_open or reason in (RATE_LIMITED, AUTH_WALL) or failures >= self.failure_threshold:
+                trips += 1
+                cooldown = max(min(self.max_cooldown, self.cooldown * 2 ** (trips - 1)), retry_after or 0)
+                self._save(conn, 0, trips, now + cooldown, 0, reason)
+                self.logger.warning(f"[Breaker] Open for {cooldown:.0f}s after {reason} (trip {trips})")
+            else:
+                self._save(conn, failures, trips, open_until, half_open, reason)
+
+class RateLimiter:
+    """The one gate every LinkedIn request goes through.
+
+    acquire() fails fast with CircuitOpenError while the breaker is open,
+    then takes a permit from this process's bucket and from the bucket
+    shared with every other process using the same state file, then adds
+    a jittered pause so requests never go out on an exact beat. After the
+    request, callers report the outcome with record(); that is what
+    trips the breaker.
+    """
+    def __init__(self, path="rate_limit.sqlite3", name="linkedin", rate=0.5, burst=3, process_rate=None,
+                 jitter=None, failure_threshold=3, cooldown=60.0, max_cooldown=1800.0):
+        state = _SharedState(path)
+        self.local = TokenBucket(rate=process_rate or rate, capacity=burst)
+        self.shared = SharedTokenBucket(state, name, rate, burst)
+        self.breaker = CircuitBreaker(state, name, failure_threshold, cooldown, max_cooldown)
+        self.jitter = jitter or JitterPolicy(0.2, 1.0)
+
+    def acquire(self, label="request"):
+        self.breaker.before_request(claim_probe=False)
+        self.local.acquire()
+        self.shared.acquire()
+        # The wait for a permit can be long; check again (and claim the probe) just before sending
+        self.breaker.before_request()
+        self.jitter.pause(label)
+
+    def record(self, outcome, retry_after=None):
+        if outcome in (SUCCESS, NO_RESULTS):
+            self.breaker.record_success()
+        else:
+            self.breaker.record_failure(outcome, retry_after)
+
+_rate_limiter = None
+_rate_limiter_lock = threading.Lock()
+
+def get_rate_limiter():
+    """Process-wide limiter for LinkedIn traffic.
+
+    Configured by LINKEDIN_RATE (requests per second, default 0.5),
+    LINKEDIN_BURST (default 3) and RATE_LIMIT_PATH (state file shared by
+    all processes, default rate_limit.sqlite3).
+    """
+    global _rate_limiter
+    with _rate_limiter_lock:
+        if _rate_limiter is None:
+            _rate_limiter = RateLimiter(
+                os.getenv("RATE_LIMIT_PATH", "rate_limit.sqlite3"),
+                rate=float(os.getenv("LINKEDIN_RATE", "0.5")),
+                burst=int(os.getenv("LINKEDIN_BURST", "3"))
+            )
+        return _rate_limiter
+
+class BrowserAdmission:
+    """Process-wide cap on how many Chrome instances may be alive at once"""
+    def __init__(self, limit=4, timeout=300):
+        self.limit = limit
+        self.timeout = timeout
+        self._in_use = 0
+        self._cond = threading.Condition()
+
+    def acquire(self, count=1, timeout=None):
+        """Take `count` browser slots at once (atomically, so callers cannot deadlock each other)"""
+        count = min(count, self.limit)
+        timeout = self.timeout if timeout is None else timeout
+        with self._cond:
+            if not self._cond.wait_for(lambda: self._in_use + count <= self.limit, timeout):
+                raise TimeoutError(f"No browser slot available within {timeout}s ({self._in_use}/{self.limit} in use)")
+            self._in_use += count
+        return count
+
+    def release(self, count=1):
+        with self._cond:
+            self._in_use = max(0, self._in_use - count)
+            self._cond.notify_all()
+
+    @contextmanager
+    def slots(self, count=1, timeout=None):
+        taken = self.acquire(count, timeout)
+        try:
+            yield taken
+        finally:
+            self.release(taken)
+
+_browser_admission = None
+_browser_admission_lock = threading.Lock()
+
+def get_browser_admission():
+    """Shared admission limit, sized by MAX_CONCURRENT_BROWSERS (default 4)"""
+    global _browser_admission
+    with _browser_admission_lock:
+        if _browser_admission is None:
+            _browser_admission = BrowserAdmission(limit=int(os.getenv("MAX_CONCURRENT_BROWSERS", "4")))
+        return _browser_admission
@@ -0,0 +1,168 @@
+import hashlib
+import json
+import logging
+import os
+import re
+import threading
+from collections import OrderedDict
+from skills import extract_skills
+
+# Headings that start a resume section (matched case-insensitively on their own line)
+SECTION_HEADINGS = {
+    "summary": ["summary", "profile", "professional summary", "about me", "objective"],
+    "experience": ["experience", "work experience", "professional experience", "employment", "employment history"],
+    "education": ["education", "academic background"],
+    "skills": ["skills", "technical skills", "core competencies", "technologies"],
+    "projects": ["projects", "personal projects", "selected projects"],
+    "certifications": ["certifications", "certificates", "licenses"],
+    "publications": ["publications"],
+    "awards": ["awards", "honors", "achievements"],
+    "languages": ["languages"],
+    "volunteering": ["volunteering", "volunteer experience"]
+}
+_HEADING_LOOKUP = {alias: section for section, aliases in SECTION_HEADINGS.items() for alias in aliases}
+
+def hash_file(path, chunk_size=1 << 20):
+    """SHA-256 of a file, read in chunks"""
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(chunk_size), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+def _extract_pdf(path):
+    try:
+        from pypdf import PdfReader
+    except ImportError:
+        raise RuntimeError("Reading PDF resumes requires pypdf (pip install pypdf)")
+    return "\n".join(page.extract_text() or "" for page in PdfReader(path).pages)
+
+def _extract_docx(path):
+    try:
+        import docx
+    except ImportError:
+        raise RuntimeError("Reading DOCX resumes requires python-docx (pip install python-docx)")
+    document = docx.Document(path)
+    lines = [paragraph.text for paragraph in document.paragraphs]
+    for table in document.tables:
+        for row in table.rows:
+            lines.append(" | ".join(cell.text for cell in row.cells))
+    return "\n".join(lines)
+
+def _extract_text_file(path):
+    with open(path, encoding="utf-8", errors="ignore") as f:
+        return f.read()
+
+EXTRACTORS = {
+    ".pdf": _extract_pdf,
+    ".docx": _extract_docx,
+    ".txt": _extract_text_file,
+    ".md": _extract_text_file
+}
+
+def extract_text(path):
+    """Plain text of a PDF, DOCX or text resume"""
+    extension = os.path.splitext(path)[1].lower()
+    extractor = EXTRACTORS.get(extension)
+    if extractor is None:
+        raise ValueError(f"Unsupported resume format: {extension or 'no extension'} (use PDF, DOCX or TXT)")
+    return extractor(path)
+
+def split_sections(text):
+    """Split resume text into {section: text}; text before the first heading goes to "header" """
+    sections = OrderedDict()
+    current = "header"
+    lines = []
+    for line in text.splitlines():
+        heading = re.sub(r"[^a-z ]", "", line.lower()).strip()
+        section = _HEADING_LOOKUP.get(heading)
+        if section and len(line.strip()) <= 40:
+            if lines:
+                sections[current] = (sections.get(current, "") + "\n" + "\n".join(lines)).strip()
+            current, lines = section, []
+        elif line.strip():
+            lines.append(line.strip())
+    if lines:
+        sections[current] = (sections.get(current, "") + "\n" + "\n".join(lines)).strip()
+    return dict(sections)
+
+class ResumeCache:
+    """Parsed resumes keyed by the SHA-256 of the file's content.
+
+    The first time a resume's content is seen it is parsed once (text,
+    sections, skills) and the result is written to `directory` as
+    <sha256>.json; every later call for the same content, under any file
+    name, costs one hash of the file plus a lookup (in memory, then on disk).
+    """
+    def __init__(self, directory="resume_cache", max_memory_entries=128):
+        self.directory = directory
+        self.max_memory_entries = max_memory_entries
+        self.logger = logging.getLogger(__name__)
+        self._memory = OrderedDict()
+        self._lock = threading.Lock()
+        os.makedirs(directory, exist_ok=True)
+
+    def _path(self, sha256):
+        return os.path.join(self.directory, f"{sha256}.json")
+
+    def _remember(self, sha256, document):
+        with self._lock:
+            self._memory[sha256] = document
+            self._memory.move_to_end(sha256)
+            while len(self._memory) > self.max_memory_entries:
+                self._memory.popitem(last=False)
+
+    def get(self, sha256):
+        with self._lock:
+            document = self._memory.get(sha256)
+            if document:
+                self._memory.move_to_end(sha256)
+                return document
+        try:
+            with open(self._path(sha256), encoding="utf-8") as f:
+                document = json.load(f)
+        except (OSError, ValueError):
+            return None
+        self._remember(sha256, document)
+        return document
+
+    def process(self, path, sha256=None):
+        """Parsed resume: {"sha256", "format", "text", "sections", "skills"}"""
+        sha256 = sha256 or hash_file(path)
+        document = self.get(sha256)
+        if document:
+            return document
+        text = extract_text(path)
+        document = {
+            "sha256": sha256,
+            "format": os.path.splitext(path)[1].lower().lstrip("."),
+            "text": text,
+            "sections": split_sections(text),
+            "skills": extract_skills(text)
+        }
+        # Write then rename, so a concurrent reader never sees a partial file
+        temp_path = f"{self._path(sha256)}.{threading.get_ident()}.tmp"
+        with open(temp_path, "w", encoding="utf-8") as f:
+            json.dump(document, f)
+        os.replace(temp_path, self._path(sha256))
+        self._remember(sha256, document)
+        self.logger.info(f"[Resume] Parsed {path} ({len(text)} chars, {len(document['skills'])} skills)")
+        return document
+
+_default_cache = None
+_default_cache_lock = threading.Lock()
+
+def get_resume_cache():
+    """Process-wide cache, stored in RESUME_CACHE_DIR (default resume_cache/)"""
+    global _default_cache
+    with _default_cache_lock:
+        if _default_cache is None:
+            _default_cache = ResumeCache(os.getenv("RESUME_CACHE_DIR", "resume_cache"))
+        return _default_cache
+
+def process_resume(path):
+    """Parse a resume once per distinct content (see ResumeCache)"""
+    # Files saved by utils.save_uploaded_file are already named by their SHA-256
+    name = os.path.splitext(os.path.basename(path))[0]
+    sha256 = name if re.fullmatch(r"[0-9a-f]{64}", name) else None
+    return get_resume_cache().process(path, sha256)
@@ -0,0 +1,156 @@
+from datetime import datetime, timedelta
+from sqlalchemy import delete, func, select, update
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from db import AsyncSessionLocal
+from job_query import job_dict
+from models import Job, SavedSearch, SavedSearchJob
+from search_cache import normalize_query
+
+def search_key(job_title, location=None, experience_level=None):
+    """Saved searches differing only in case, punctuation or spacing are the same search"""
+    return normalize_query(job_title, location, experience_level, namespace="saved")
+
+def saved_search_dict(search):
+    return {
+        "id": search.id,
+        "job_title": search.job_title,
+        "location": search.location,
+        "experience_level": search.experience_level,
+        "max_jobs": search.max_jobs,
+        "interval_minutes": search.interval_minutes,
+        "enabled": search.enabled,
+        "next_run_at": search.next_run_at,
+        "last_run_at": search.last_run_at,
+        "runs": search.runs,
+        "yield_score": search.yield_score,
+        "last_new_jobs": search.last_new_jobs,
+        "last_error": search.last_error,
+        "last_viewed_at": search.last_viewed_at
+    }
+
+def is_fresh(search, now=None):
+    """True if the scheduler is keeping this search up to date: it is enabled, has run, and is
+    not overdue by more than one interval (otherwise the scheduler is not running, or is behind)"""
+    if not search["enabled"] or not search["last_run_at"]:
+        return False
+    now = now or datetime.utcnow()
+    return not search["next_run_at"] or now - search["next_run_at"] <= timedelta(minutes=search["interval_minutes"])
+
+async def save_search(job_title, location=None, experience_level=None, interval_minutes=60, max_jobs=25,
+                      session_factory=AsyncSessionLocal):
+    """Saved search for these criteria, created (and due at once) if there is none yet.
+
+    Saving counts as a visit, so the search does not expire; a search that
+    had expired is enabled again and due at once.
+    """
+    key = search_key(job_title, location, experience_level)
+    now = datetime.utcnow()
+    async with session_factory() as session:
+        search = (await session.execute(select(SavedSearch).where(SavedSearch.query_key == key))).scalar_one_or_none()
+        if search is None:
+            search = SavedSearch(
+                query_key=key, job_title=job_title, location=location, experience_level=experience_level,
+                interval_minutes=interval_minutes, max_jobs=max_jobs, enabled=True, runs=0, yield_score=1.0,
+                last_new_jobs=0, next_run_at=now, last_viewed_at=now
+            )
+            session.add(search)
+        else:
+            if not search.enabled:
+                search.enabled = True
+                search.next_run_at = now
+            search.last_viewed_at = now
+        await session.commit()
+        return saved_search_dict(search)
+
+async def expire_saved_searches(max_idle, session_factory=AsyncSessionLocal):
+    """Disable searches nobody has looked at for max_idle (a timedelta); returns how many.
+
+    Without this every query ever typed would stay a background scrape
+    forever. Searching again (save_search) enables it again.
+    """
+    cutoff = datetime.utcnow() - max_idle
+    async with session_factory() as session:
+        result = await session.execute(
+            update(SavedSearch)
+            .where(SavedSearch.enabled.is_(True), func.coalesce(SavedSearch.last_viewed_at, SavedSearch.created_at) < cutoff)
+            .values(enabled=False)
+        )
+        await session.commit()
+        return result.rowcount
+
+async def get_saved_search(job_title, location=None, experience_level=None, session_factory=AsyncSessionLocal):
+    key = search_key(job_title, location, experience_level)
+    async with session_factory() as session:
+        search = (await session.execute(select(SavedSearch).where(SavedSearch.query_key == key))).scalar_one_or_none()
+        return saved_search_dict(search) if search else None
+
+async def list_saved_searches(enabled_only=False, session_factory=AsyncSessionLocal):
+    stmt = select(SavedSearch).order_by(SavedSearch.id)
+    if enabled_only:
+        stmt = stmt.where(SavedSearch.enabled.is_(True))
+    async with session_factory() as session:
+        return [saved_search_dict(search) for search in (await session.execute(stmt)).scalars()]
+
+async def delete_saved_search(search_id, session_factory=AsyncSessionLocal):
+    async with session_factory() as session:
+        await session.execute(delete(SavedSearchJob).where(SavedSearchJob.saved_search_id == search_id))
+        result = await session.execute(delete(SavedSearch).where(SavedSearch.id == search_id))
+        await session.commit()
+        return result.rowcount > 0
+
+async def link_jobs(session, search_id, urls, found_at=None):
+    """Record that a search found the stored jobs with these URLs; returns how many it had not found before"""
+    urls = [url for url in dict.fromkeys(urls) if url]
+    if not urls:
+        return 0
+    job_ids = (await session.execute(select(Job.id).where(Job.job_url.in_(urls)))).scalars().all()
+    if not job_ids:
+        return 0
+    dialect_name = session.bind.dialect.name
+    if dialect_name == "postgresql":
+        insert = pg_insert
+    elif dialect_name == "sqlite":
+        insert = sqlite_insert
+    else:
+        raise ValueError(f"Bulk insert is not supported on {dialect_name}")
+    found_at = found_at or datetime.utcnow()
+    stmt = insert(SavedSearchJob).values([
+        {"saved_search_id": search_id, "job_id": job_id, "found_at": found_at} for job_id in job_ids
+    ]).on_conflict_do_nothing(index_elements=[SavedSearchJob.saved_search_id, SavedSearchJob.job_id])
+    result = await session.execute(stmt)
+    return result.rowcount
+
+async def saved_search_results(search_id, limit=25, mark_viewed=True, session_factory=AsyncSessionLocal):
+    """A saved search's most recently found jobs, flagged "new" if found since the last visit.
+
+    Returns {"search": dict, "jobs": [job dicts with "new"], "new_count": n}, or
+    None if there is no such search. With mark_viewed the visit is recorded,
+    so the same jobs are not new next time.
+    """
+    async with session_factory() as session:
+        search = await session.get(SavedSearch, search_id)
+        if search is None:
+            return None
+        last_visit = search.last_viewed_at
+        found = (SavedSearchJob.saved_search_id == search_id, Job.canonical_id.is_(None))
+        rows = (await session.execute(
+            select(Job, SavedSearchJob.found_at)
+            .join(SavedSearchJob, SavedSearchJob.job_id == Job.id)
+            .where(*found)
+            .order_by(SavedSearchJob.found_at.desc(), Job.id.desc())
+            .limit(limit)
+        )).all()
+        new_count_stmt = select(func.count()).select_from(SavedSearchJob).join(Job, SavedSearchJob.job_id == Job.id).where(*found)
+        if last_visit:
+            new_count_stmt = new_count_stmt.where(SavedSearchJob.found_at > last_visit)
+        new_count = (await session.execute(new_count_stmt)).scalar_one()
+        result = {
+            "search": saved_search_dict(search),
+            "jobs": [dict(job_dict(job), new=last_visit is None or found_at > last_visit) for job, found_at in rows],
+            "new_count": new_count
+        }
+        if mark_viewed:
+            search.last_viewed_at = datetime.utcnow()
+            await session.commit()
+        return result
@@ -0,0 +1,217 @@
+"""
+Background scheduler for saved searches, independent of the chat app.
+
+    python scheduler.py add "Data Engineer" --location "New York" --every 30
+    python scheduler.py list
+    python scheduler.py remove 3
+    python scheduler.py run --workers 2
+
+Every enabled saved search is re-run on its own interval as an incremental
+crawl (only jobs not seen before, see crawl_state), ingested into the jobs
+table and linked to the search, so app.py can answer from the database and
+show what is new since the last visit. Scraping cost depends on the number
+of saved searches, not on the number of people using the app. Searches
+nobody has looked at for SAVED_SEARCH_EXPIRY_DAYS (default 14) are disabled
+until someone runs them again.
+"""
+import argparse
+import asyncio
+import heapq
+import logging
+import os
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta
+from crawl_state import incremental_crawl
+from db import create_session_factory, init_db
+from ingest import upsert_jobs
+from models import SavedSearch
+from rate_limit import CircuitOpenError
+from saved_searches import delete_saved_search, expire_saved_searches, link_jobs, list_saved_searches, save_search
+
+logger = logging.getLogger("scheduler")
+
+# Weight of the latest run in a search's yield score
+YIELD_SMOOTHING = 0.3
+
+class SearchScheduler:
+    """Runs due saved searches, `workers` at a time.
+
+    Searches wait in a heap ordered by when they are next due; once due
+    they move to a second heap ordered by past yield (a moving average of
+    new jobs per run), so when more searches are due than can run, the
+    productive ones go first. The saved_searches table is the source of
+    truth: the heaps are rebuilt from it on every poll, so searches added
+    from the app or the CLI are picked up without a restart.
+    """
+    def __init__(self, workers=2, engine="linkedin", poll_interval=30.0, session_factory=None, expire_days=None):
+        self.workers = workers
+        self.engine = engine
+        self.poll_interval = poll_interval
+        self.expire_after = timedelta(days=expire_days or float(os.getenv("SAVED_SEARCH_EXPIRY_DAYS", "14")))
+        self.session_factory = session_factory or create_session_factory()
+        self._executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="saved-search")
+        self._waiting = []
+        self._ready = []
+        self._running = set()
+        self._scraper = None
+
+    async def _refresh(self):
+        expired = await expire_saved_searches(self.expire_after, self.session_factory)
+        if expired:
+            logger.info(f"[Scheduler] Disabled {expired} saved searches nobody has viewed in {self.expire_after.days} days")
+        now = datetime.utcnow()
+        searches = await list_saved_searches(enabled_only=True, session_factory=self.session_factory)
+        self._waiting = [
+            (search["next_run_at"] or now, -search["yield_score"], search["id"], search)
+            for search in searches if search["id"] not in self._running
+        ]
+        heapq.heapify(self._waiting)
+        self._ready = []
+        while self._waiting and self._waiting[0][0] <= now:
+            due, negative_yield, search_id, search = heapq.heappop(self._waiting)
+            heapq.heappush(self._ready, (negative_yield, due, search_id, search))
+
+    def _scrape(self, search, tracker):
+        """Runs on the executor: the new jobs for a search (known ones are in tracker.known)"""
+        if self.engine == "http":
+            from linkedin_scraper import LinkedInJobScraper
+            if self._scraper is None:
+                self._scraper = LinkedInJobScraper()
+            experience = search["experience_level"]
+            jobs = self._scraper.http.crawl(
+                search["job_title"], search["location"], search["max_jobs"],
+                self._scraper._get_experience_level_code(experience) if experience else None,
+                concurrency=1, incremental=tracker
+            )
+            if jobs is None:
+                raise RuntimeError("Guest search needs JavaScript; use the linkedin engine")
+            return jobs
+        from linkedin_scraper import linkedin_job_search_tool
+        return linkedin_job_search_tool(
+            search["job_title"], search["location"], search["experience_level"], max_jobs=search["max_jobs"],
+            incremental=tracker
+        )
+
+    async def _reschedule(self, search_id, delay, error):
+        async with self.session_factory() as session:
+            search = await session.get(SavedSearch, search_id)
+            if search:
+                search.next_run_at = datetime.utcnow() + delay
+                search.last_error = error
+                await session.commit()
+
+    async def run_search(self, search):
+        """Crawl one saved search, store and link its jobs, then move it to its next due time"""
+        search_id = search["id"]
+        interval = timedelta(minutes=search["interval_minutes"])
+        tracker = incremental_crawl(search["job_title"], search["location"], search["experience_level"])
+        try:
+            jobs = await asyncio.get_running_loop().run_in_executor(self._executor, self._scrape, search, tracker)
+            if jobs:
+                await upsert_jobs(jobs, self.session_factory)
+            async with self.session_factory() as session:
+                # Jobs the crawl skipped are already stored (often found by another search): link them too
+                found = await link_jobs(session, search_id, [job.get("url") for job in jobs + tracker.known])
+                row = await session.get(SavedSearch, search_id)
+                if row:
+                    now = datetime.utcnow()
+                    row.last_run_at = now
+                    row.next_run_at = now + interval
+                    row.runs += 1
+                    row.last_new_jobs = found
+                    row.yield_score = (1 - YIELD_SMOOTHING) * row.yield_score + YIELD_SMOOTHING * found
+                    row.last_error = None
+                await session.commit()
+            # Only now that the jobs are stored may the watermark move past them
+            tracker.finish()
+            logger.info(f"[Scheduler] '{search['job_title']}' ({search['location'] or 'any'}): {found} new jobs")
+        except CircuitOpenError as e:
+            # LinkedIn is pushing back: retry when the breaker allows, without counting a run
+            logger.warning(f"[Scheduler] '{search['job_title']}' postponed: {e}")
+            await self._reschedule(search_id, timedelta(seconds=e.retry_in), str(e))
+        except Exception as e:
+            logger.error(f"[Scheduler] '{search['job_title']}' failed: {str(e)}")
+            await self._reschedule(search_id, interval, f"{type(e).__name__}: {e}")
+        finally:
+            self._running.discard(search_id)
+
+    async def run(self, once=False):
+        """Run due searches until cancelled; with once=True, stop when nothing is due or running"""
+        tasks = set()
+        try:
+            while True:
+                await self._refresh()
+                while self._ready and len(tasks) < self.workers:
+                    _, _, search_id, search = heapq.heappop(self._ready)
+                    self._running.add(search_id)
+                    tasks.add(asyncio.create_task(self.run_search(search)))
+                if once and not tasks:
+                    return
+                # Wake up for the next due search, a finished run or the next poll, whichever is first
+                timeout = self.poll_interval
+                if self._waiting:
+                    until_due = (self._waiting[0][0] - datetime.utcnow()).total_seconds()
+                    timeout = max(0.1, min(timeout, until_due))
+                if tasks:
+                    _, tasks = await asyncio.wait(tasks, timeout=timeout, return_when=asyncio.FIRST_COMPLETED)
+                else:
+                    await asyncio.sleep(timeout)
+        finally:
+            self._executor.shutdown(wait=False)
+            await self.session_factory.kw["bind"].dispose()
+
+def _format_search(search):
+    last = search["last_run_at"].strftime("%Y-%m-%d %H:%M") if search["last_run_at"] else "never"
+    due = search["next_run_at"].strftime("%Y-%m-%d %H:%M") if search["next_run_at"] else "now"
+    if not search["enabled"]:
+        due = "never (expired)"
+    line = (f"{search['id']:>4}  {search['job_title']} | {search['location'] or 'any'} | "
+            f"{search['experience_level'] or 'any'}  every {search['interval_minutes']}m  last run {last}  "
+            f"next {due}  yield {search['yield_score']:.1f}")
+    return line + (f"  error: {search['last_error']}" if search["last_error"] else "")
+
+async def _main(args):
+    await init_db()
+    if args.command == "add":
+        search = await save_search(args.job_title, args.location, args.experience, args.every, args.max_jobs)
+        print(f"Saved search {search['id']}")
+    elif args.command == "list":
+        for search in await list_saved_searches():
+            print(_format_search(search))
+    elif args.command == "remove":
+        print("Removed" if await delete_saved_search(args.id) else f"No saved search {args.id}")
+    elif args.command == "run":
+        await SearchScheduler(args.workers, args.engine, args.poll_interval, expire_days=args.expire_days).run(once=args.once)
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Saved search scheduler")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    add = commands.add_parser("add", help="Save a search for the scheduler to keep fresh")
+    add.add_argument("job_title")
+    add.add_argument("--location")
+    add.add_argument("--experience")
+    add.add_argument("--every", type=int, default=60, help="Minutes between runs")
+    add.add_argument("--max-jobs", type=int, default=25)
+
+    commands.add_parser("list", help="Show saved searches and their schedule")
+    remove = commands.add_parser("remove", help="Delete a saved search")
+    remove.add_argument("id", type=int)
+
+    run = commands.add_parser("run", help="Run the scheduler")
+    run.add_argument("--workers", type=int, default=2, help="Searches scraped at once")
+    run.add_argument("--engine", choices=["linkedin", "http"], default="linkedin")
+    run.add_argument("--poll-interval", type=float, default=30.0, help="Seconds between checks for new searches")
+    run.add_argument("--once", action="store_true", help="Run the searches that are due, then exit")
+    run.add_argument("--expire-days", type=float, help="Disable searches not viewed for this many days "
+                                                       "(default SAVED_SEARCH_EXPIRY_DAYS or 14)")
+
+    args = parser.parse_args(argv)
+    logging.basicConfig(level=logging.INFO)
+    try:
+        asyncio.run(_main(args))
+    except KeyboardInterrupt:
+        pass
+
+if __name__ == "__main__":
+    main()
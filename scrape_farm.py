@@ -0,0 +1,232 @@
+"""
+Scraping farm: a supervisor process running N worker processes over a durable work queue.
+
+    python scrape_farm.py enqueue "Software Engineer" "Data Engineer" --location "New York" --location Remote
+    python scrape_farm.py run --workers 8 --engine http
+    python scrape_farm.py status
+    python scrape_farm.py requeue-poisoned
+
+Each worker owns its scraping engine (a browser, or an HTTP session) for its
+whole life, leases one search at a time from the queue, stores the jobs it
+finds and only then marks the search done. A worker that crashes is
+restarted by the supervisor, and the search it held is retried once its
+lease expires.
+"""
+import argparse
+import asyncio
+import json
+import logging
+import multiprocessing
+import os
+import signal
+import socket
+import threading
+import time
+from rate_limit import CircuitOpenError
+from work_queue import WorkQueue, default_queue_path
+
+logger = logging.getLogger("scrape_farm")
+
+class SearchEngineUnavailable(Exception):
+    """The engine could not run the search (e.g. the page needs JavaScript); the search is retried"""
+
+def _heartbeat(work_queue, item_id, owner, lease_seconds, done):
+    while not done.wait(lease_seconds / 3):
+        if not work_queue.heartbeat(item_id, owner, lease_seconds):
+            logger.warning(f"[{owner}] Lost the lease on item {item_id}")
+            return
+
+def worker_main(worker_id, queue_path, engine, lease_seconds, stop, cookies_file=None, idle_poll=2.0):
+    """Worker process: lease searches, scrape, store, acknowledge, until stop is set"""
+    logging.basicConfig(level=logging.INFO, format=f"%(asctime)s [worker {worker_id}] %(levelname)s %(message)s")
+    signal.signal(signal.SIGINT, signal.SIG_IGN)  # The supervisor coordinates shutdown
+    from crawl_state import incremental_crawl
+    from db import create_session_factory
+    from ingest import upsert_jobs
+    owner = f"{socket.gethostname()}:{os.getpid()}"
+    work_queue = WorkQueue(queue_path)
+    # One loop and engine for the process's whole life, so pooled DB connections stay valid
+    loop = asyncio.new_event_loop()
+    session_factory = create_session_factory()
+
+    from linkedin_scraper import ChromeDriverPool, LinkedInJobScraper
+    if engine == "browser":
+        pool = ChromeDriverPool(size=1, use_cookies=bool(cookies_file), cookies_file=cookies_file)
+        scraper = LinkedInJobScraper(use_cookies=bool(cookies_file), cookies_file=cookies_file, pool=pool, use_http=False)
+
+        def search(payload, tracker):
+            scraper.setup_driver()  # Checks the session is alive, relaunching a crashed browser
+            try:
+                # raise_errors: a crashed browser or a timeout must reach work_queue.fail, not count as 0 jobs
+                return scraper._search_jobs(
+                    payload["job_title"], payload.get("location"), payload.get("experience_level"),
+                    payload.get("max_jobs", 25), tracker, raise_errors=True
+                )
+            finally:
+                scraper.close()
+    else:
+        scraper = LinkedInJobScraper()
+        pool = None
+
+        def search(payload, tracker):
+            experience = payload.get("experience_level")
+            jobs = scraper.http.crawl(
+                payload["job_title"], payload.get("location"), payload.get("max_jobs", 25),
+                scraper._get_experience_level_code(experience) if experience else None, concurrency=1,
+                incremental=tracker
+            )
+            if jobs is None:
+                raise SearchEngineUnavailable("Guest search needs JavaScript; use the browser engine")
+            return jobs
+
+    try:
+        while not stop.is_set():
+            item = work_queue.lease(owner, lease_seconds)
+            if item is None:
+                stop.wait(idle_poll)
+                continue
+            item_id, payload, attempt = item
+            logger.info(f"Item {item_id} (attempt {attempt}): {payload}")
+            done = threading.Event()
+            threading.Thread(
+                target=_heartbeat, args=(work_queue, item_id, owner, lease_seconds, done), daemon=True
+            ).start()
+            try:
+                tracker = incremental_crawl(payload["job_title"], payload.get("location"), payload.get("experience_level")) \
+                    if payload.get("incremental") else None
+                jobs = search(payload, tracker)
+                counts = loop.run_until_complete(upsert_jobs(jobs, session_factory)) if jobs else {}
+                if tracker:
+                    tracker.finish()  # Only once the jobs are stored, so a retry never skips them
+                work_queue.complete(item_id, owner, {"jobs": len(jobs), **counts})
+            except CircuitOpenError as e:
+                # LinkedIn is pushing back: not the search's fault, so put it back and wait out the cooldown
+                logger.warning(f"{e}; returning item {item_id} to the queue")
+                work_queue.release(item_id, owner, e.retry_in)
+                stop.wait(e.retry_in)
+            except Exception as e:
+                work_queue.fail(item_id, owner, f"{type(e).__name__}: {e}")
+            finally:
+                done.set()
+    finally:
+        if pool:
+            pool.close()
+        loop.run_until_complete(session_factory.kw["bind"].dispose())
+        loop.close()
+
+async def _prepare_database():
+    """Create missing tables before any worker stores jobs (a fresh database would poison every search)"""
+    from db import engine, init_db
+    try:
+        await init_db()
+    finally:
+        await engine.dispose()  # The supervisor's loop ends here; workers use their own engines
+
+class ScrapeFarm:
+    """Supervisor: keeps `workers` worker processes alive while the queue has work.
+
+    With drain=True the farm stops once nothing is queued or leased;
+    otherwise it runs until interrupted. Workers finish their current
+    search before exiting. Workers are started with the spawn method, so
+    no browser, socket or lock is shared across a fork.
+    """
+    def __init__(self, queue_path=None, workers=None, engine="http", lease_seconds=300, drain=True,
+                 cookies_file=None, check_interval=1.0):
+        self.queue_path = queue_path or default_queue_path()
+        self.workers = workers or os.cpu_count() or 1
+        self.engine = engine
+        self.lease_seconds = lease_seconds
+        self.drain = drain
+        self.cookies_file = cookies_file
+        self.check_interval = check_interval
+        self.restarts = 0
+        self._context = multiprocessing.get_context("spawn")
+        self._stop = self._context.Event()
+
+    def _start_worker(self, worker_id):
+        process = self._context.Process(
+            target=worker_main,
+            args=(worker_id, self.queue_path, self.engine, self.lease_seconds, self._stop, self.cookies_file),
+            name=f"scrape-worker-{worker_id}"
+        )
+        process.start()
+        return process
+
+    def stop(self):
+        self._stop.set()
+
+    def run(self):
+        work_queue = WorkQueue(self.queue_path)
+        asyncio.run(_prepare_database())
+        processes = {worker_id: self._start_worker(worker_id) for worker_id in range(self.workers)}
+        logger.info(f"[Farm] Started {self.workers} {self.engine} workers on {self.queue_path}")
+        try:
+            while processes:
+                time.sleep(self.check_interval)
+                for worker_id, process in list(processes.items()):
+                    if process.is_alive():
+                        continue
+                    if self._stop.is_set():
+                        del processes[worker_id]
+                    else:
+                        # Its leased search becomes available again when the lease expires
+                        logger.warning(f"[Farm] Worker {worker_id} exited with {process.exitcode}; restarting")
+                        self.restarts += 1
+                        processes[worker_id] = self._start_worker(worker_id)
+                if self.drain and not self._stop.is_set() and work_queue.pending() == 0:
+                    logger.info("[Farm] Queue drained, stopping workers")
+                    self._stop.set()
+        except KeyboardInterrupt:
+            logger.info("[Farm] Interrupted, waiting for workers to finish their current search")
+            self._stop.set()
+            for process in processes.values():
+                process.join()
+        return work_queue.stats()
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="LinkedIn scraping farm")
+    parser.add_argument("--queue", default=default_queue_path(), help="Work queue SQLite file")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    enqueue = commands.add_parser("enqueue", help="Queue searches (every title x location x experience level)")
+    enqueue.add_argument("titles", nargs="+")
+    enqueue.add_argument("--location", action="append", default=[])
+    enqueue.add_argument("--experience", action="append", default=[])
+    enqueue.add_argument("--max-jobs", type=int, default=25)
+    enqueue.add_argument("--max-attempts", type=int, default=3)
+    enqueue.add_argument("--incremental", action="store_true", help="Only scrape jobs not seen by earlier crawls")
+
+    run = commands.add_parser("run", help="Run the supervisor and its workers")
+    run.add_argument("--workers", type=int, default=os.cpu_count())
+    run.add_argument("--engine", choices=["http", "browser"], default="http")
+    run.add_argument("--lease-seconds", type=int, default=300)
+    run.add_argument("--forever", action="store_true", help="Keep waiting for new searches instead of draining")
+    run.add_argument("--cookies-file", help="LinkedIn cookies for authenticated browser workers")
+
+    commands.add_parser("status", help="Show queue counts and poisoned searches")
+    requeue = commands.add_parser("requeue-poisoned", help="Retry poisoned searches")
+    requeue.add_argument("ids", nargs="*", type=int)
+
+    args = parser.parse_args(argv)
+    logging.basicConfig(level=logging.INFO)
+    work_queue = WorkQueue(args.queue)
+
+    if args.command == "enqueue":
+        from linkedin_scraper import expand_searches
+        searches = expand_searches(args.titles, args.location or [None], args.experience or [None])
+        for search in searches:
+            work_queue.enqueue({**search, "max_jobs": args.max_jobs, "incremental": args.incremental},
+                               max_attempts=args.max_attempts)
+        print(f"Queued {len(searches)} searches")
+    elif args.command == "run":
+        farm = ScrapeFarm(args.queue, args.workers, args.engine, args.lease_seconds,
+                          drain=not args.forever, cookies_file=args.cookies_file)
+        stats = farm.run()
+        print(json.dumps({**stats, "worker_restarts": farm.restarts}))
+    elif args.command == "status":
+        print(json.dumps({"counts": work_queue.stats(), "poisoned": work_queue.poisoned()}, indent=2))
+    elif args.command == "requeue-poisoned":
+        print(f"Requeued {work_queue.requeue_poisoned(args.ids)} searches")
+
+if __name__ == "__main__":
+    main()
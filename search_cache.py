@@ -0,0 +1,180 @@
+import json
+import logging
+import os
+import re
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from contextlib import contextmanager
+
+def normalize_query(job_title, location=None, experience_level=None, authenticated=False, namespace="search"):
+    """Cache key for a search: case, punctuation and spacing differences map to the same key"""
+    def norm(value):
+        return " ".join(re.findall(r"[a-z0-9+#]+", (value or "").lower()))
+    experience = norm(experience_level)
+    if experience == "senior":
+        experience = "mid senior"  # Both map to the same LinkedIn filter
+    auth = "auth" if authenticated else "public"
+    return f"{namespace}|{norm(job_title)}|{norm(location)}|{experience}|{auth}"
+
+class SearchCache:
+    """Two-tier cache of search results: an in-process LRU in front of a SQLite file.
+
+    Entries are fresh for `ttl` seconds and may then be served stale for
+    another `stale_ttl` seconds while a background refresh runs
+    (stale-while-revalidate). A cached result satisfies any request for up to
+    the max_jobs it was fetched with, or any size if the search ran dry.
+    """
+    def __init__(self, path="search_cache.sqlite3", ttl=3600, stale_ttl=86400,
+                 max_memory_entries=256, max_disk_entries=10000):
+        self.path = path
+        self.ttl = ttl
+        self.stale_ttl = stale_ttl
+        self.max_memory_entries = max_memory_entries
+        self.max_disk_entries = max_disk_entries
+        self.logger = logging.getLogger(__name__)
+        self._memory = OrderedDict()
+        self._lock = threading.Lock()
+        self._refreshing = set()
+        self._stats = {"memory_hits": 0, "disk_hits": 0, "stale_hits": 0, "misses": 0, "refreshes": 0}
+        if self.path:
+            with self._connect() as conn:
+                conn.execute("""
+                    CREATE TABLE IF NOT EXISTS search_cache (
+                        key TEXT PRIMARY KEY,
+                        jobs TEXT NOT NULL,
+                        max_jobs INTEGER NOT NULL,
+                        created_at REAL NOT NULL,
+                        last_access REAL NOT NULL
+                    )
+                """)
+
+    @contextmanager
+    def _connect(self):
+        conn = sqlite3.connect(self.path, timeout=10)
+        try:
+            with conn:  # Commits on success, rolls back on error
+                yield conn
+        finally:
+            conn.close()
+
+    def _count(self, stat):
+        with self._lock:
+            self._stats[stat] += 1
+
+    def stats(self):
+        """Hit/miss counters since this cache was created"""
+        with self._lock:
+            return dict(self._stats)
+
+    def _satisfies(self, entry, max_jobs):
+        return entry["max_jobs"] >= max_jobs or len(entry["jobs"]) < entry["max_jobs"]
+
+    def _lookup(self, key):
+        """Find an entry in memory, then on disk (promoting it to memory)"""
+        with self._lock:
+            entry = self._memory.get(key)
+            if entry:
+                self._memory.move_to_end(key)
+                return entry, "memory_hits"
+        if not self.path:
+            return None, None
+        with self._connect() as conn:
+            row = conn.execute(
+                "SELECT jobs, max_jobs, created_at FROM search_cache WHERE key = ?", (key,)
+            ).fetchone()
+            if not row:
+                return None, None
+            conn.execute("UPDATE search_cache SET last_access = ? WHERE key = ?", (time.time(), key))
+        entry = {"jobs": json.loads(row[0]), "max_jobs": row[1], "created_at": row[2]}
+        self._remember(key, entry)
+        return entry, "disk_hits"
+
+    def _remember(self, key, entry):
+        with self._lock:
+            self._memory[key] = entry
+            self._memory.move_to_end(key)
+            while len(self._memory) > self.max_memory_entries:
+                self._memory.popitem(last=False)
+
+    def set(self, key, jobs, max_jobs):
+        now = time.time()
+        self._remember(key, {"jobs": jobs, "max_jobs": max_jobs, "created_at": now})
+        if not self.path:
+            return
+        with self._connect() as conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO search_cache (key, jobs, max_jobs, created_at, last_access) VALUES (?, ?, ?, ?, ?)",
+                (key, json.dumps(jobs), max_jobs, now, now)
+            )
+            # Size-bounded: drop the least recently used entries beyond the limit
+            conn.execute(
+                "DELETE FROM search_cache WHERE key IN "
+                "(SELECT key FROM search_cache ORDER BY last_access DESC LIMIT -1 OFFSET ?)",
+                (self.max_disk_entries,)
+            )
+
+    def invalidate(self, key):
+        with self._lock:
+            self._memory.pop(key, None)
+        if self.path:
+            with self._connect() as conn:
+                conn.execute("DELETE FROM search_cache WHERE key = ?", (key,))
+
+    def _refresh(self, key, max_jobs, compute):
+        try:
+            jobs, cacheable = compute()
+            if jobs and cacheable:
+                self.set(key, jobs, max_jobs)
+        except Exception as e:
+            self.logger.warning(f"[Cache] Background refresh failed for {key}: {str(e)}")
+        finally:
+            with self._lock:
+                self._refreshing.discard(key)
+
+    def _refresh_in_background(self, key, max_jobs, compute):
+        with self._lock:
+            if key in self._refreshing:
+                return
+            self._refreshing.add(key)
+            self._stats["refreshes"] += 1
+        threading.Thread(target=self._refresh, args=(key, max_jobs, compute), daemon=True).start()
+
+    def get_or_compute(self, key, max_jobs, compute, refresh=None):
+        """Return cached jobs for key, running compute() on a miss.
+
+        compute and refresh return (jobs, cacheable); empty or uncacheable
+        results (errors, cancelled searches) are not stored. Stale entries are
+        only served when a thread-safe `refresh` is given to revalidate them in
+        the background; otherwise they are recomputed like a miss.
+        """
+        entry, tier = self._lookup(key)
+        if entry and self._satisfies(entry, max_jobs):
+            age = time.time() - entry["created_at"]
+            if age < self.ttl:
+                self._count(tier)
+                return entry["jobs"][:max_jobs]
+            if refresh and age < self.ttl + self.stale_ttl:
+                self._count("stale_hits")
+                self._refresh_in_background(key, max_jobs, refresh)
+                return entry["jobs"][:max_jobs]
+        self._count("misses")
+        jobs, cacheable = compute()
+        if jobs and cacheable:
+            self.set(key, jobs, max_jobs)
+        return jobs
+
+_default_cache = None
+_default_cache_lock = threading.Lock()
+
+def get_search_cache():
+    """Process-wide cache, stored at SEARCH_CACHE_PATH (default search_cache.sqlite3)"""
+    global _default_cache
+    with _default_cache_lock:
+        if _default_cache is None:
+            _default_cache = SearchCache(
+                path=os.getenv("SEARCH_CACHE_PATH", "search_cache.sqlite3"),
+                ttl=int(os.getenv("SEARCH_CACHE_TTL", "3600"))
+            )
+        return _default_cache
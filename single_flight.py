@@ -0,0 +1,107 @@
+import threading
+
+class _Flight:
+    """One in-flight call: its streamed items, final result and interested callers"""
+    def __init__(self):
+        self.items = []
+        self.listeners = 0
+        self.done = False
+        self.result = None
+        self.error = None
+        self.leader_error = None
+        self._cond = threading.Condition()
+
+    def join(self):
+        with self._cond:
+            self.listeners += 1
+
+    def leave(self):
+        with self._cond:
+            self.listeners -= 1
+
+    def emit(self, item, on_item):
+        """Called by the leader for every item its call produces"""
+        with self._cond:
+            self.items.append(item)
+            self._cond.notify_all()
+        if on_item and self.leader_error is None:
+            try:
+                on_item(item)
+            except Exception as e:
+                # The leader's own consumer stopped; keep going for the followers
+                self.leader_error = e
+                self.leave()
+        if self.leader_error is not None and self.listeners <= 0:
+            raise self.leader_error  # Nobody is listening any more: cancel the call
+
+    def finish(self, result=None, error=None):
+        with self._cond:
+            self.result = result
+            self.error = error
+            self.done = True
+            self._cond.notify_all()
+
+    def follow(self, on_item):
+        """Replay items produced so far, stream the rest, then return the shared result"""
+        index = 0
+        try:
+            while True:
+                with self._cond:
+                    while index >= len(self.items) and not self.done:
+                        self._cond.wait()
+                    batch = self.items[index:]
+                    index = len(self.items)
+                    finished = self.done
+                if on_item:
+                    for item in batch:
+                        on_item(item)
+                if finished and index >= len(self.items):
+                    break
+        finally:
+            self.leave()
+        if self.error:
+            raise self.error
+        return self.result
+
+class SingleFlight:
+    """Coalesce concurrent calls with the same key into a single execution.
+
+    The first caller for a key (the leader) runs fn(emit); callers arriving
+    while it runs wait for the same result instead of starting their own.
+    Items the leader passes to emit are streamed to every caller's on_item,
+    followers first getting a replay of what was produced before they
+    joined. If every caller stops listening (their on_item raised), the
+    exception is raised from emit so fn can cancel its work.
+    """
+    def __init__(self):
+        self._flights = {}
+        self._lock = threading.Lock()
+
+    def in_flight(self, key):
+        with self._lock:
+            return key in self._flights
+
+    def do(self, key, fn, on_item=None):
+        with self._lock:
+            flight = self._flights.get(key)
+            leader = flight is None
+            if leader:
+                flight = _Flight()
+                self._flights[key] = flight
+            flight.join()
+        if not leader:
+            return flight.follow(on_item)
+
+        try:
+            result = fn(lambda item: flight.emit(item, on_item))
+        except BaseException as e:
+            flight.finish(error=e)
+            raise
+        else:
+            flight.finish(result=result)
+            return result
+        finally:
+            with self._lock:
+                self._flights.pop(key, None)
+            if flight.leader_error is None:
+                flight.leave()
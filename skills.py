@@ -0,0 +1,236 @@
+import re
+from collections import deque
+
+# Canonical skill -> the phrases that mention it. Matching is case-insensitive and ignores punctuation
+# between words, so "Node.js", "node js" and "NODE-JS" are all "node js".
+# Everyday words ("containers", "security", "r", "net") are only matched in unambiguous multi-word or
+# technical forms; bare words that are also skill names ("go", "swift", "rust") are in AMBIGUOUS_SKILLS.
+SKILLS = {
+    "Python": ["python", "python3"],
+    "JavaScript": ["javascript", "js", "ecmascript", "es6"],
+    "TypeScript": ["typescript"],
+    "Go": ["golang", "go lang"],
+    "Rust": ["rustlang"],
+    "C++": ["c++", "cpp"],
+    "C#": ["c#", "csharp", "c sharp"],
+    ".NET": ["dotnet", "asp.net", "dot net", ".net core"],
+    "Ruby on Rails": ["ruby on rails", "ror"],
+    "PHP": ["php"],
+    "Scala": ["scala"],
+    "Kotlin": ["kotlin"],
+    "Swift": ["swiftui", "swift ios", "swift programming"],
+    "SQL": ["sql"],
+    "PostgreSQL": ["postgresql", "postgres", "psql"],
+    "MySQL": ["mysql"],
+    "MongoDB": ["mongodb", "mongo"],
+    "Redis": ["redis"],
+    "Elasticsearch": ["elasticsearch", "elastic search", "opensearch"],
+    "Kafka": ["kafka", "apache kafka"],
+    "Spark": ["pyspark", "apache spark", "spark sql", "spark streaming"],
+    "Airflow": ["airflow", "apache airflow"],
+    "dbt": ["dbt"],
+    "Snowflake": ["snowflake db", "snowflake data warehouse", "snowpark", "snowsql"],
+    "Pandas": ["pandas dataframe", "pandas dataframes"],
+    "NumPy": ["numpy"],
+    "React": ["reactjs", "react.js", "react native", "react hooks", "react redux"],
+    "Angular": ["angular", "angularjs"],
+    "Vue": ["vue", "vuejs", "vue.js"],
+    "Node.js": ["node.js", "nodejs"],
+    "Django": ["django"],
+    "Flask": ["flask api", "python flask", "flask framework"],
+    "FastAPI": ["fastapi", "fast api"],
+    "Spring": ["spring boot", "springboot", "spring framework"],
+    "GraphQL": ["graphql"],
+    "REST APIs": ["rest api", "rest apis", "restful"],
+    "gRPC": ["grpc"],
+    "Microservices": ["microservices", "micro services", "microservice"],
+    "AWS": ["aws", "amazon web services"],
+    "GCP": ["gcp", "google cloud", "google cloud platform"],
+    "Azure": ["azure", "microsoft azure"],
+    "Docker": ["docker", "containerization", "containerized", "docker compose"],
+    "Kubernetes": ["kubernetes", "k8s", "eks", "gke", "aks"],
+    "Terraform": ["terraform"],
+    "Ansible": ["ansible"],
+    "CI/CD": ["ci/cd", "ci cd", "continuous integration", "continuous delivery", "continuous deployment"],
+    "Jenkins": ["jenkins"],
+    "GitHub Actions": ["github actions"],
+    "Git": ["git"],
+    "Linux": ["linux", "unix"],
+    "Prometheus": ["prometheus"],
+    "Grafana": ["grafana"],
+    "Machine Learning": ["machine learning", "ml engineer", "ml engineering", "ml models", "ml systems"],
+    "Deep Learning": ["deep learning"],
+    "NLP": ["nlp", "natural language processing"],
+    "Computer Vision": ["computer vision"],
+    "PyTorch": ["pytorch"],
+    "TensorFlow": ["tensorflow"],
+    "scikit-learn": ["scikit-learn", "sklearn", "scikit learn"],
+    "LLMs": ["llm", "llms", "large language models", "large language model"],
+    "MLOps": ["mlops", "ml ops"],
+    "Data Engineering": ["data engineering", "data pipelines", "etl", "elt"],
+    "Data Analysis": ["data analysis", "data analytics"],
+    "Tableau": ["tableau"],
+    "Power BI": ["power bi", "powerbi"],
+    "Excel": ["microsoft excel", "ms excel", "advanced excel"],
+    "Agile": ["agile", "scrum", "kanban"],
+    "System Design": ["system design", "distributed systems"],
+    "Security": ["application security", "information security", "network security", "cloud security",
+                 "appsec", "infosec", "cybersecurity", "cyber security"],
+    "HTML": ["html", "html5"],
+    "CSS": ["css", "css3", "sass", "scss", "tailwind"],
+    "Figma": ["figma"],
+    "iOS": ["ios"],
+    "Android": ["android"],
+    "Product Management": ["product management", "product manager", "product roadmap"],
+    "Leadership": ["leadership", "mentoring", "people management"],
+    "Communication": ["communication skills", "stakeholder management"]
+}
+
+# Bare words that are skills only in a technical sense: canonical skill -> (word, rule).
+# "cased": only the capitalized spelling counts (Go, not "go to"), and at the start of a sentence or
+# line only next to another skill or TECH_CONTEXT word ("Go ahead" is not Go, "Go developer" is).
+# "context": any spelling counts, but only next to another skill or TECH_CONTEXT word
+# ("Java, Spring and SQL", not "a cup of java").
+AMBIGUOUS_SKILLS = {
+    "Go": ("Go", "cased"),
+    "Swift": ("Swift", "cased"),
+    "React": ("React", "cased"),
+    "Machine Learning": ("ML", "cased"),
+    "Spark": ("Spark", "cased"),
+    "Flask": ("Flask", "cased"),
+    "Rust": ("Rust", "context"),
+    "Ruby": ("Ruby", "context"),
+    "Java": ("Java", "context"),
+    "Snowflake": ("Snowflake", "context"),
+    "Pandas": ("Pandas", "context")
+}
+TECH_CONTEXT = frozenset("""
+developer developers engineer engineers engineering programmer programmers programming language languages
+framework frameworks library libraries backend frontend sdk stack codebase
+""".split())
+# How many words away a skill or TECH_CONTEXT word may be to vouch for an ambiguous word
+CONTEXT_WINDOW = 3
+
+def _tokens(text):
+    # Same normalization for the dictionary and the text: lowercase, punctuation splits words,
+    # except the symbols that carry meaning in skill names (c++, c#)
+    return re.findall(r"[a-z0-9+#]+", (text or "").lower())
+
+def _text_tokens(text):
+    """Tokens of text as in _tokens, with their original spelling and whether they start a sentence or line"""
+    words, spellings, starts = [], [], []
+    previous_end = 0
+    for match in re.finditer(r"[A-Za-z0-9+#]+", text or ""):
+        gap = text[previous_end:match.start()]
+        words.append(match.group().lower())
+        spellings.append(match.group())
+        starts.append(len(words) == 1 or "\n" in gap or re.search(r"[.!?]\s", gap) is not None)
+        previous_end = match.end()
+    return words, spellings, starts
+
+class SkillMatcher:
+    """Aho-Corasick automaton over the skill dictionary, matching whole words.
+
+    Transitions are on tokens rather than characters: text is split into
+    words once (in C, by the regex engine), then a single pass over the
+    words reports every dictionary phrase it contains, overlapping ones
+    included, in time linear in the text length regardless of dictionary
+    size. Ambiguous bare words (see AMBIGUOUS_SKILLS) are checked after
+    that pass against the positions of the phrases it found.
+    """
+    def __init__(self, skills=None, ambiguous=None):
+        skills = skills or SKILLS
+        self._goto = [{}]
+        self._fail = [0]
+        self._output = [set()]
+        for canonical, synonyms in skills.items():
+            for phrase in synonyms:
+                self._add(_tokens(phrase), canonical)
+        self._build_failure_links()
+        # lowercased word -> (canonical, spelling, rule)
+        self._ambiguous = {
+            word.lower(): (canonical, word, rule)
+            for canonical, (word, rule) in (AMBIGUOUS_SKILLS if ambiguous is None else ambiguous).items()
+        }
+
+    def _add(self, words, canonical):
+        if not words:
+            return
+        state = 0
+        for word in words:
+            next_state = self._goto[state].get(word)
+            if next_state is None:
+                next_state = len(self._goto)
+                self._goto.append({})
+                self._fail.append(0)
+                self._output.append(set())
+                self._goto[state][word] = next_state
+            state = next_state
+        self._output[state].add(canonical)
+
+    def _build_failure_links(self):
+        queue = deque(self._goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for word, next_state in self._goto[state].items():
+                queue.append(next_state)
+                fail = self._fail[state]
+                while fail and word not in self._goto[fail]:
+                    fail = self._fail[fail]
+                self._fail[next_state] = self._goto[fail].get(word, 0)
+                # A match ending here also ends every suffix phrase that matches here
+                self._output[next_state] |= self._output[self._fail[next_state]]
+
+    def extract(self, text):
+        """Sorted canonical skills mentioned in text"""
+        goto, fail, output, ambiguous = self._goto, self._fail, self._output, self._ambiguous
+        words, spellings, starts = _text_tokens(text)
+        found = set()
+        # Positions of skill phrase ends and context words, and of the ambiguous words to check against them
+        context, candidates = [], []
+        state = 0
+        for position, word in enumerate(words):
+            while state and word not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(word, 0)
+            if output[state]:
+                found |= output[state]
+                context.append(position)
+            elif word in TECH_CONTEXT:
+                context.append(position)
+            if word in ambiguous:
+                candidates.append(position)
+        # Capitalized mid-sentence words first, so they vouch for their neighbours too ("Go and Rust")
+        unsure = []
+        for position in candidates:
+            canonical, spelling, rule = ambiguous[words[position]]
+            if rule == "cased" and spellings[position] != spelling:
+                continue
+            if rule == "cased" and not starts[position]:
+                found.add(canonical)
+                context.append(position)
+            else:
+                unsure.append((position, canonical))
+        for position, canonical in unsure:
+            if any(abs(position - other) <= CONTEXT_WINDOW for other in context):
+                found.add(canonical)
+        return sorted(found)
+
+_default_matcher = None
+
+def extract_skills(text):
+    """Canonical skills in text, using the built-in dictionary"""
+    global _default_matcher
+    if _default_matcher is None:
+        _default_matcher = SkillMatcher()
+    return _default_matcher.extract(text)
+
+def skill_gap(job_skills, resume_skills):
+    """Compare stored skill lists: {"matched": [...], "missing": [...], "coverage": 0..1}"""
+    job_skills, resume_skills = set(job_skills or ()), set(resume_skills or ())
+    matched = sorted(job_skills & resume_skills)
+    return {
+        "matched": matched,
+        "missing": sorted(job_skills - resume_skills),
+        "coverage": len(matched) / len(job_skills) if job_skills else 1.0
+    }
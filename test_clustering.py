@@ -0,0 +1,32 @@
+from clustering import cluster_jobs
+
+DATA = ["spark airflow pipelines warehouse sql", "etl pipelines airflow dbt warehouse", "spark kafka streaming pipelines sql",
+        "warehouse modelling dbt sql airflow", "batch pipelines spark warehouse etl"]
+IOS = ["swift uikit app store releases", "swift swiftui mobile app releases", "ios swift xcode mobile app",
+       "mobile app swift accessibility uikit"]
+
+def jobs(descriptions, title, prefix):
+    return [{"title": title, "company": f"Company {i}", "url": f"https://example.com/{prefix}/{i}", "description": text}
+            for i, text in enumerate(descriptions)]
+
+def test_separates_unrelated_roles():
+    clusters = cluster_jobs(jobs(DATA, "Data Engineer", "data") + jobs(IOS, "iOS Developer", "ios"))
+    assert [cluster["size"] for cluster in clusters] == [5, 4]
+    data, ios = clusters
+    assert {job["url"] for job in data["jobs"]} == {f"https://example.com/data/{i}" for i in range(5)}
+    assert {job["url"] for job in ios["jobs"]} == {f"https://example.com/ios/{i}" for i in range(4)}
+    assert "swift" in ios["profile"]
+    assert "pipelines" in data["profile"]
+    assert data["label"] == ", ".join(data["profile"][:3])
+    assert data["representative"] in data["jobs"]
+
+def test_explicit_k_is_used():
+    clusters = cluster_jobs(jobs(DATA, "Data Engineer", "data") + jobs(IOS, "iOS Developer", "ios"), k=3)
+    assert len(clusters) <= 3
+    assert sum(cluster["size"] for cluster in clusters) == 9
+
+def test_few_jobs_form_one_cluster():
+    clusters = cluster_jobs(jobs(DATA[:2], "Data Engineer", "data"))
+    assert len(clusters) == 1
+    assert clusters[0]["size"] == 2
+    assert cluster_jobs([]) == []
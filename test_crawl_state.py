@@ -0,0 +1,92 @@
+import asyncio
+from datetime import datetime
+from crawl_state import BloomFilter, CrawlState, get_crawl_state, job_key
+from ingest import upsert_jobs
+
+def job(job_id, posted_time="2024-03-01"):
+    return {"title": "Data Engineer", "url": f"https://www.linkedin.com/jobs/view/{job_id}/", "posted_time": posted_time}
+
+def test_job_key_ignores_tracking_parameters():
+    assert job_key("https://www.linkedin.com/jobs/view/3812345678/?refId=abc") == "linkedin:3812345678"
+    assert job_key("https://www.linkedin.com/jobs/search/?currentJobId=3812345678&keywords=x") == "linkedin:3812345678"
+    assert job_key("https://example.com/careers/data-engineer?utm_source=x") == "https://example.com/careers/data-engineer"
+    assert job_key("") is None
+
+def test_bloom_filter_membership_and_error_rate():
+    bloom = BloomFilter(capacity=1000, error_rate=0.01)
+    for i in range(1000):
+        bloom.add(f"seen-{i}")
+    assert not bloom.add("seen-0")
+    assert all(f"seen-{i}" in bloom for i in range(1000))
+    false_positives = sum(f"other-{i}" in bloom for i in range(10000))
+    assert false_positives < 300
+
+def test_bloom_filters_merge():
+    first, second = BloomFilter(capacity=100), BloomFilter(capacity=100)
+    first.add("a")
+    second.add("b")
+    first.merge(bytes(second.bits))
+    assert "a" in first and "b" in first
+
+def test_seen_urls_are_shared_through_the_file(tmp_path):
+    path = str(tmp_path / "crawl_state.sqlite3")
+    writer, reader = CrawlState(path, capacity=1000), CrawlState(path, capacity=1000)
+    writer.mark_seen([job(3800000001)["url"]])
+    assert not reader.is_seen(job(3800000001)["url"])
+    writer.flush()
+    reader.mark_seen([job(3800000002)["url"]])
+    reader.flush()  # Merges, so neither process loses the other's keys
+    reader.refresh()
+    writer.refresh()
+    assert reader.is_seen(job(3800000001)["url"] + "?trk=public")
+    assert writer.is_seen(job(3800000002)["url"])
+
+def test_incremental_crawl_stops_at_known_jobs(tmp_path):
+    state = CrawlState(str(tmp_path / "crawl_state.sqlite3"), capacity=1000)
+    first = state.incremental("data engineer")
+    assert first.filter_page([job(3800000002), job(3800000001)]) == ([job(3800000002), job(3800000001)], False)
+    first.finish()
+    assert state.watermark("data engineer") == {
+        "newest_posted": datetime(2024, 3, 1), "recent_ids": {"linkedin:3800000001", "linkedin:3800000002"}
+    }
+
+    second = state.incremental("data engineer")
+    new_jobs, reached = second.filter_page([job(3800000003, "2024-03-02"), job(3800000002)])
+    assert new_jobs == [job(3800000003, "2024-03-02")]
+    assert reached
+    assert second.known == [job(3800000002)]
+
+def test_incremental_crawl_stops_past_the_watermark_date(tmp_path):
+    state = CrawlState(str(tmp_path / "crawl_state.sqlite3"), capacity=1000)
+    state.save_watermark("data engineer", datetime(2024, 3, 10), [])
+    tracker = state.incremental("data engineer")
+    assert tracker.filter_page([job(3800000005, "2024-03-09")]) == ([job(3800000005, "2024-03-09")], False)
+    assert tracker.filter_page([job(3800000004, "2024-03-01")])[1]
+
+def test_only_returned_jobs_move_the_watermark(tmp_path):
+    state = CrawlState(str(tmp_path / "crawl_state.sqlite3"), capacity=1000)
+    first = state.incremental("data engineer")
+    page = [job(3800000003, "2024-03-03"), job(3800000002, "2024-03-02"), job(3800000001)]
+    assert first.filter_page(page, limit=1) == ([job(3800000003, "2024-03-03")], True)
+    first.finish()
+    assert state.watermark("data engineer")["recent_ids"] == {"linkedin:3800000003"}
+
+    # The jobs left over are still new to the next crawl
+    second = state.incremental("data engineer")
+    new_jobs, reached = second.filter_page(page)
+    assert new_jobs == page[1:]
+    assert reached
+    assert second.known == page[:1]
+
+def test_upsert_records_urls_for_incremental_crawls(session_factory):
+    url = job(3800000001)["url"]
+    asyncio.run(upsert_jobs([{"title": "Data Engineer", "company": "Acme", "url": url}], session_factory))
+    assert get_crawl_state().is_seen(url)
+
+def test_interrupted_crawl_keeps_the_watermark(tmp_path):
+    state = CrawlState(str(tmp_path / "crawl_state.sqlite3"), capacity=1000)
+    tracker = state.incremental("data engineer")
+    tracker.filter_page([job(3800000001)])
+    tracker.interrupted = True
+    tracker.finish()
+    assert state.watermark("data engineer") is None
@@ -0,0 +1,68 @@
+import asyncio
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import create_async_engine, AsyncSession
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import NullPool
+import crawl_state
+from db import init_db
+from ingest import upsert_jobs
+
+# The jobs and optimized_resumes tables as the app created them before bulk upserts: no unique job_url
+BASELINE_SCHEMA = [
+    """CREATE TABLE jobs (
+        id INTEGER PRIMARY KEY, title VARCHAR(255) NOT NULL, company VARCHAR(255) NOT NULL,
+        location VARCHAR(255) NOT NULL, description TEXT NOT NULL, requirements TEXT, salary_range VARCHAR(100),
+        job_url VARCHAR(500) NOT NULL, posted_date DATETIME, created_at DATETIME DEFAULT CURRENT_TIMESTAMP
+    )""",
+    """CREATE TABLE optimized_resumes (
+        id INTEGER PRIMARY KEY, job_id INTEGER NOT NULL REFERENCES jobs (id),
+        original_resume_path VARCHAR(500) NOT NULL, optimized_resume_path VARCHAR(500) NOT NULL,
+        optimization_notes TEXT, created_at DATETIME DEFAULT CURRENT_TIMESTAMP
+    )""",
+    "INSERT INTO jobs (id, title, company, location, description, job_url) VALUES "
+    "(1, 'Data Engineer', 'Acme', 'Remote', '', 'https://www.linkedin.com/jobs/view/3800000001/'), "
+    "(2, 'Data Engineer', 'Acme', 'Remote', '', 'https://www.linkedin.com/jobs/view/3800000001/'), "
+    "(3, 'ML Engineer', 'Acme', 'Remote', '', 'https://www.linkedin.com/jobs/view/3800000002/')",
+    "INSERT INTO optimized_resumes (job_id, original_resume_path, optimized_resume_path) VALUES (2, 'cv.pdf', 'cv-2.pdf')"
+]
+
+def test_init_db_upgrades_a_baseline_database(tmp_path, monkeypatch):
+    monkeypatch.setenv("CRAWL_STATE_PATH", str(tmp_path / "crawl_state.sqlite3"))
+    monkeypatch.setattr(crawl_state, "_default_state", None)
+    engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path / 'jobs.db'}", poolclass=NullPool)
+
+    async def upgrade():
+        async with engine.begin() as conn:
+            for statement in BASELINE_SCHEMA:
+                await conn.execute(text(statement))
+        await init_db(engine)
+        session_factory = sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+        counts = await upsert_jobs([
+            {"title": "Senior Data Engineer", "company": "Acme", "url": "https://www.linkedin.com/jobs/view/3800000001/"},
+            {"title": "Data Scientist", "company": "Acme", "url": "https://www.linkedin.com/jobs/view/3800000003/"}
+        ], session_factory, dedupe=False)
+        async with engine.connect() as conn:
+            jobs = (await conn.execute(text("SELECT id, title FROM jobs ORDER BY id"))).all()
+            resumes = (await conn.execute(text("SELECT job_id, skills FROM optimized_resumes"))).all()
+        await engine.dispose()
+        return counts, jobs, resumes
+
+    counts, jobs, resumes = asyncio.run(upgrade())
+    assert counts == {"inserted": 1, "updated": 1, "skipped": 0, "duplicates": 0}
+    # The duplicate URL was merged into the oldest row, and what pointed at it moved along
+    assert [tuple(row) for row in jobs] == [(1, "Senior Data Engineer"), (3, "ML Engineer"), (4, "Data Scientist")]
+    # Columns added since (optimized_resumes.skills) exist, empty for old rows
+    assert [tuple(row) for row in resumes] == [(1, None)]
+
+def test_init_db_is_idempotent(tmp_path):
+    engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path / 'jobs.db'}", poolclass=NullPool)
+
+    async def init_twice():
+        await init_db(engine)
+        await init_db(engine)
+        async with engine.connect() as conn:
+            indexes = (await conn.execute(text("SELECT name FROM sqlite_master WHERE type = 'index'"))).scalars().all()
+        await engine.dispose()
+        return indexes
+
+    assert "ux_jobs_job_url" in asyncio.run(init_twice())
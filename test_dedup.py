@@ -0,0 +1,67 @@
+import asyncio
+from sqlalchemy import select
+from dedup import NearDuplicateIndex, dedupe_jobs
+from ingest import upsert_jobs
+from models import Job
+
+DESCRIPTION = (
+    "We are hiring a data engineer to build batch and streaming pipelines in Python and SQL on AWS, "
+    "own our Airflow deployment, model data in the warehouse and work closely with analysts and product teams"
+)
+OTHER_DESCRIPTION = (
+    "Join our mobile team as an iOS developer shipping Swift features to millions of riders, "
+    "pairing with designers on accessibility, release tooling, crash reporting and app store rollouts"
+)
+
+def job(job_id, title="Data Engineer", company="Acme", location="Remote", description=DESCRIPTION):
+    return {"title": title, "company": company, "location": location, "description": description,
+            "url": f"https://www.linkedin.com/jobs/view/{job_id}/"}
+
+def test_reposted_description_is_a_duplicate():
+    index = NearDuplicateIndex()
+    assert index.add(1, job(1)) is None
+    # Same role, reworded a little and posted in another city
+    assert index.add(2, job(2, location="Berlin", description=DESCRIPTION.replace("closely", "together"))) == 1
+    assert index.add(3, job(3, description=OTHER_DESCRIPTION)) is None
+    assert len(index) == 2
+
+def test_same_text_at_another_company_is_not_a_duplicate():
+    index = NearDuplicateIndex()
+    index.add(1, job(1))
+    assert index.add(2, job(2, company="Globex")) is None
+
+def test_jobs_without_description_match_on_company_and_title():
+    index = NearDuplicateIndex()
+    assert index.add(1, job(1, description="")) is None
+    assert index.add(2, job(2, title="Data  engineer!", description="")) == 1
+    assert index.add(3, job(3, title="ML Engineer", description="")) is None
+    # The same listing scraped later with its description still matches the title-only one
+    assert index.add(4, job(4, title="ML Engineer")) == 3
+    # ...but a described listing only matches another described one on its text
+    index.add(5, job(5, title="iOS Developer", description=OTHER_DESCRIPTION))
+    assert index.add(6, job(6, title="iOS Developer")) is None
+
+def test_dedupe_jobs_keeps_the_first_and_merges_the_rest():
+    jobs = [job(1, description=""), job(2, location="Berlin"), job(3, title="ML Engineer")]
+    deduped = dedupe_jobs(jobs)
+    assert [j["url"] for j in deduped] == [jobs[0]["url"], jobs[2]["url"]]
+    kept = deduped[0]
+    assert kept["duplicate_urls"] == [jobs[1]["url"]]
+    assert kept["locations"] == ["Remote", "Berlin"]
+    assert kept["description"] == DESCRIPTION
+
+def test_upsert_marks_reposts_as_duplicates(session_factory):
+    asyncio.run(upsert_jobs([job(3800000001)], session_factory))
+    counts = asyncio.run(upsert_jobs([job(3800000002, location="Berlin"), job(3800000003, company="Globex")],
+                                     session_factory))
+    assert counts["duplicates"] == 1
+
+    async def stored():
+        async with session_factory() as session:
+            return {row.job_url: row for row in (await session.execute(select(Job))).scalars()}
+
+    rows = asyncio.run(stored())
+    original = rows[job(3800000001)["url"]]
+    assert original.canonical_id is None
+    assert rows[job(3800000002)["url"]].canonical_id == original.id
+    assert rows[job(3800000003)["url"]].canonical_id is None
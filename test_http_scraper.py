@@ -0,0 +1,115 @@
+from crawl_state import CrawlState
+from http_scraper import LinkedInHTTPScraper, parse_job_cards, requires_javascript
+from rate_limit import JitterPolicy, RateLimiter
+
+GUEST_PAGE = """
+<li>
+  <div class="base-card job-search-card">
+    <a class="base-card__full-link" href="https://www.linkedin.com/jobs/view/data-engineer-at-acme-3812345678?refId=abc&trk=public"></a>
+    <h3 class="base-search-card__title"> Data Engineer </h3>
+    <h4 class="base-search-card__subtitle"><a>Acme</a></h4>
+    <span class="job-search-card__location">New York, NY</span>
+    <time class="job-search-card__listdate" datetime="2024-03-01">2 days ago</time>
+  </div>
+</li>
+<li>
+  <div class="base-card job-search-card">
+    <a class="base-card__full-link" href="https://www.linkedin.com/jobs/view/ml-engineer-at-globex-3812345679"></a>
+    <h3 class="base-search-card__title">ML Engineer</h3>
+  </div>
+</li>
+<li>
+  <div class="base-card job-search-card"><h3 class="base-search-card__title"></h3></div>
+</li>
+"""
+
+def test_parse_job_cards_reads_guest_api_cards():
+    assert parse_job_cards(GUEST_PAGE) == [
+        {
+            "title": "Data Engineer",
+            "company": "Acme",
+            "location": "New York, NY",
+            "url": "https://www.linkedin.com/jobs/view/data-engineer-at-acme-3812345678",
+            "posted_time": "2 days ago",
+            "source": "LinkedIn (Public)"
+        },
+        {
+            "title": "ML Engineer",
+            "company": "Unknown Company",
+            "location": "Unknown Location",
+            "url": "https://www.linkedin.com/jobs/view/ml-engineer-at-globex-3812345679",
+            "posted_time": "Unknown",
+            "source": "LinkedIn (Public)"
+        }
+    ]
+
+def test_parse_job_cards_falls_back_to_older_card_classes():
+    html = '<div class="job-card-container"><h3>Data Engineer</h3><div class="company-name">Acme</div><a href="/jobs/view/1/">x</a></div>'
+    jobs = parse_job_cards(html, source="LinkedIn")
+    assert [(job["title"], job["company"], job["url"], job["source"]) for job in jobs] == [
+        ("Data Engineer", "Acme", "/jobs/view/1/", "LinkedIn")
+    ]
+
+def test_parse_job_cards_without_cards():
+    assert parse_job_cards("") == []
+    assert parse_job_cards("<html><body><p>No matching jobs found.</p></body></html>") == []
+
+def test_requires_javascript_spots_shells_and_auth_walls():
+    assert requires_javascript('<html><noscript>Please enable JavaScript</noscript></html>')
+    assert requires_javascript('<a href="https://www.linkedin.com/authwall?trk=x">Sign in</a>')
+    assert not requires_javascript(GUEST_PAGE)
+
+class FakeResponse:
+    def __init__(self, text, status_code=200):
+        self.text = text
+        self.status_code = status_code
+        self.headers = {}
+        self.history = []
+
+class FakeSession:
+    """Serves `total` guest-API results, `page_size` per start= offset; LinkedIn repeats the last page past the end"""
+    def __init__(self, total, page_size=10):
+        self.total = total
+        self.page_size = page_size
+        self.starts = []
+
+    def get(self, url, params=None, timeout=None):
+        self.starts.append(params["start"])
+        start = min(params["start"], (self.total - 1) // self.page_size * self.page_size)
+        cards = "".join(
+            f'<div class="base-card"><a class="base-card__full-link" href="https://www.linkedin.com/jobs/view/{3800000000 + i}"></a>'
+            f'<h3 class="base-search-card__title">Job {i}</h3></div>'
+            for i in range(start, min(start + self.page_size, self.total))
+        )
+        return FakeResponse(cards)
+
+def make_scraper(tmp_path, session):
+    limiter = RateLimiter(str(tmp_path / "limits.sqlite3"), rate=1000, burst=1000, jitter=JitterPolicy(0, 0))
+    return LinkedInHTTPScraper(session=session, limiter=limiter)
+
+def test_crawl_walks_offsets_until_max_jobs(tmp_path):
+    session = FakeSession(total=100)
+    jobs = make_scraper(tmp_path, session).crawl("Data Engineer", max_jobs=35, concurrency=2)
+    assert [job["title"] for job in jobs] == [f"Job {i}" for i in range(35)]
+    assert sorted(session.starts) == [0, 10, 20, 30, 40]
+
+def test_crawl_stops_at_the_end_of_the_results(tmp_path):
+    session = FakeSession(total=25)
+    jobs = make_scraper(tmp_path, session).crawl("Data Engineer", max_jobs=100, concurrency=3)
+    assert len(jobs) == 25
+    assert len({job["url"] for job in jobs}) == 25
+
+def test_incremental_crawl_returns_and_records_at_most_max_jobs(tmp_path):
+    state = CrawlState(str(tmp_path / "crawl_state.sqlite3"), capacity=1000)
+    tracker = state.incremental("data engineer")
+    jobs = make_scraper(tmp_path, FakeSession(total=100)).crawl("Data Engineer", max_jobs=3, incremental=tracker)
+    assert [job["title"] for job in jobs] == ["Job 0", "Job 1", "Job 2"]
+    tracker.finish()
+    assert state.watermark("data engineer")["recent_ids"] == {f"linkedin:{3800000000 + i}" for i in range(3)}
+
+def test_crawl_returns_none_when_the_first_page_needs_a_browser(tmp_path):
+    class ShellSession(FakeSession):
+        def get(self, url, params=None, timeout=None):
+            return FakeResponse("<html><noscript>Please enable JavaScript</noscript></html>")
+
+    assert make_scraper(tmp_path, ShellSession(total=0)).crawl("Data Engineer") is None
@@ -0,0 +1,80 @@
+import asyncio
+from datetime import datetime
+from sqlalchemy import select
+import ingest
+import resume_cache
+from ingest import parse_posted_date, run_coroutine_sync, save_optimized_resume, upsert_jobs
+from models import Job, OptimizedResume
+
+DESCRIPTION = (
+    "We are hiring a data engineer to build batch and streaming pipelines in Python and SQL on AWS, "
+    "own our Airflow deployment, model data in the warehouse and work closely with analysts and product teams"
+)
+
+def job(job_id, title="Data Engineer", company="Acme", posted_time="2024-03-01", description=""):
+    return {
+        "title": title, "company": company, "location": "Remote", "description": description,
+        "url": f"https://www.linkedin.com/jobs/view/{job_id}/", "posted_time": posted_time, "source": "LinkedIn"
+    }
+
+async def stored_jobs(session_factory):
+    async with session_factory() as session:
+        return {row.job_url: row for row in (await session.execute(select(Job))).scalars()}
+
+def test_upsert_inserts_then_updates(session_factory):
+    counts = asyncio.run(upsert_jobs(
+        [job(3800000001, description=DESCRIPTION), job(3800000002, title="ML Engineer"), {"title": "No link"}],
+        session_factory
+    ))
+    assert counts == {"inserted": 2, "updated": 0, "skipped": 1, "duplicates": 0}
+
+    # A re-scrape from the public search has no description; the stored one is kept
+    counts = asyncio.run(upsert_jobs([job(3800000001, title="Senior Data Engineer")], session_factory))
+    assert counts == {"inserted": 0, "updated": 1, "skipped": 0, "duplicates": 0}
+    stored = asyncio.run(stored_jobs(session_factory))
+    row = stored[job(3800000001)["url"]]
+    assert row.title == "Senior Data Engineer"
+    assert row.description == DESCRIPTION
+    assert row.posted_date == datetime(2024, 3, 1)
+    assert "Python" in row.skills
+    assert row.updated_at is not None
+
+def test_save_optimized_resume_stores_its_skills(session_factory, tmp_path, monkeypatch):
+    monkeypatch.setenv("RESUME_CACHE_DIR", str(tmp_path / "resume_cache"))
+    monkeypatch.setattr(resume_cache, "_default_cache", None)
+    resume = tmp_path / "resume-data-engineer.txt"
+    resume.write_text("Data engineer: Python, SQL and Airflow pipelines on AWS")
+    asyncio.run(upsert_jobs([job(3800000001, description=DESCRIPTION)], session_factory))
+    job_id = asyncio.run(stored_jobs(session_factory))[job(3800000001)["url"]].id
+
+    async def saved():
+        resume_id = await save_optimized_resume(job_id, "resume.txt", str(resume), "Led with pipelines", session_factory)
+        async with session_factory() as session:
+            return await session.get(OptimizedResume, resume_id)
+
+    optimized = asyncio.run(saved())
+    assert optimized.job_id == job_id
+    assert optimized.skills == ["AWS", "Airflow", "Python", "SQL"]
+
+def test_parse_posted_date():
+    now = datetime(2024, 3, 10, 12, 0)
+    assert parse_posted_date("2024-03-01", now) == datetime(2024, 3, 1)
+    assert parse_posted_date("3 days ago", now) == datetime(2024, 3, 7, 12, 0)
+    assert parse_posted_date("1 week ago", now) == datetime(2024, 3, 3, 12, 0)
+    assert parse_posted_date("Just now", now) == now
+    assert parse_posted_date("Unknown", now) is None
+    assert parse_posted_date(None, now) is None
+
+def test_run_coroutine_sync_uses_one_loop_from_sync_and_async_callers(monkeypatch):
+    monkeypatch.setattr(ingest, "_sync_runner", None)
+
+    async def current_loop(session_factory):
+        return asyncio.get_running_loop(), session_factory
+
+    from_sync = run_coroutine_sync(current_loop)
+
+    async def from_running_loop():
+        return run_coroutine_sync(current_loop)
+
+    # Same loop and engine, so pooled connections stay on the loop that opened them
+    assert asyncio.run(from_running_loop()) == from_sync
@@ -0,0 +1,64 @@
+import asyncio
+import pytest
+from sqlalchemy import select
+from ingest import upsert_jobs
+from job_query import query_jobs
+from models import Job
+
+def job(job_id, title="Data Engineer", company="Acme", posted_time="2024-03-01"):
+    return {
+        "title": title, "company": company, "location": "Remote",
+        "url": f"https://www.linkedin.com/jobs/view/{job_id}/", "posted_time": posted_time, "source": "LinkedIn"
+    }
+
+async def stored_jobs(session_factory):
+    async with session_factory() as session:
+        return {row.job_url: row for row in (await session.execute(select(Job))).scalars()}
+
+def all_pages(session_factory, **kwargs):
+    pages, cursor = [], None
+    while True:
+        page = asyncio.run(query_jobs(limit=3, cursor=cursor, session_factory=session_factory, **kwargs))
+        pages.append([found["id"] for found in page["jobs"]])
+        cursor = page["next_cursor"]
+        if cursor is None:
+            return pages
+
+@pytest.mark.parametrize("direction", ["asc", "desc"])
+def test_keyset_pages_cover_every_job_once(session_factory, direction):
+    # Ties on the posted date and jobs without one, across page boundaries
+    posted = ["2024-03-01", "2024-03-02", "2024-03-02", "2024-03-02", None, "2024-03-03", None, "2024-03-01"]
+    asyncio.run(upsert_jobs(
+        [job(3800000001 + i, title=f"Engineer {i}", posted_time=date) for i, date in enumerate(posted)],
+        session_factory, dedupe=False
+    ))
+    stored = asyncio.run(stored_jobs(session_factory)).values()
+    dated = sorted((row for row in stored if row.posted_date), key=lambda row: (row.posted_date, row.id),
+                   reverse=direction == "desc")
+    undated = sorted((row for row in stored if not row.posted_date), key=lambda row: row.id,
+                     reverse=direction == "desc")
+
+    pages = all_pages(session_factory, sort="posted", direction=direction)
+    assert [len(page) for page in pages] == [3, 3, 2]
+    assert sum(pages, []) == [row.id for row in dated + undated]
+
+def test_keyset_paging_by_title_with_filters(session_factory):
+    asyncio.run(upsert_jobs(
+        [job(3800000001 + i, title=title, company=company) for i, (title, company) in enumerate([
+            ("Data Engineer", "Acme"), ("Analytics Engineer", "Acme"), ("Data Scientist", "Acme"),
+            ("Data Engineer II", "Acme"), ("Data Engineer", "Globex"), ("Staff Data Engineer", "Acme")
+        ])],
+        session_factory, dedupe=False
+    ))
+    pages = all_pages(session_factory, company="Acme", keywords="data engineer", sort="title", direction="asc")
+    stored = asyncio.run(stored_jobs(session_factory))
+    titles = [row.title for page in pages for found_id in page for row in stored.values() if row.id == found_id]
+    assert titles == ["Data Engineer", "Data Engineer II", "Staff Data Engineer"]
+
+def test_cursor_is_tied_to_its_sort_order(session_factory):
+    asyncio.run(upsert_jobs([job(3800000001 + i) for i in range(3)], session_factory, dedupe=False))
+    cursor = asyncio.run(query_jobs(limit=1, session_factory=session_factory))["next_cursor"]
+    with pytest.raises(ValueError):
+        asyncio.run(query_jobs(sort="title", limit=1, cursor=cursor, session_factory=session_factory))
+    with pytest.raises(ValueError):
+        asyncio.run(query_jobs(limit=1, cursor="not a cursor", session_factory=session_factory))
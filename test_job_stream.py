@@ -0,0 +1,70 @@
+import asyncio
+import threading
+import time
+import pytest
+import job_stream
+from job_stream import aiter_linkedin_jobs, iter_linkedin_jobs
+from linkedin_scraper import CrawlLimitReached
+
+class FakeSearch:
+    """Stands in for linkedin_job_search_tool: emits `count` jobs (forever if None) to on_job"""
+    def __init__(self, count=None, error=None):
+        self.count = count
+        self.error = error
+        self.emitted = 0
+        self.stopped = threading.Event()
+
+    def __call__(self, on_job, **search_kwargs):
+        try:
+            while self.count is None or self.emitted < self.count:
+                on_job({"title": f"Job {self.emitted}", "url": f"https://example.com/{self.emitted}"})
+                self.emitted += 1
+            if self.error:
+                raise self.error
+        except CrawlLimitReached:
+            pass
+        finally:
+            self.stopped.set()
+        return []
+
+@pytest.fixture
+def fake_search(monkeypatch):
+    def install(**kwargs):
+        search = FakeSearch(**kwargs)
+        monkeypatch.setattr(job_stream, "linkedin_job_search_tool", search)
+        return search
+    return install
+
+def test_stream_yields_every_job_in_order(fake_search):
+    fake_search(count=5)
+    assert [job["title"] for job in iter_linkedin_jobs("Data Engineer")] == [f"Job {i}" for i in range(5)]
+
+def test_closing_the_stream_stops_the_scrape(fake_search):
+    search = fake_search()
+    with iter_linkedin_jobs("Data Engineer", buffer_size=2) as stream:
+        assert next(stream)["title"] == "Job 0"
+    assert search.stopped.wait(5)
+    assert list(stream) == []
+
+def test_slow_consumer_holds_the_scraper_back(fake_search):
+    search = fake_search(count=100)
+    with iter_linkedin_jobs("Data Engineer", buffer_size=2):
+        time.sleep(0.3)
+        # Two jobs queued and a third waiting to be put; nothing more is scraped
+        assert search.emitted <= 3
+
+def test_scraper_errors_reach_the_consumer(fake_search):
+    fake_search(count=2, error=RuntimeError("browser crashed"))
+    stream = iter_linkedin_jobs("Data Engineer")
+    assert next(stream)["title"] == "Job 0"
+    assert next(stream)["title"] == "Job 1"
+    with pytest.raises(RuntimeError, match="browser crashed"):
+        next(stream)
+
+def test_async_iterator(fake_search):
+    fake_search(count=3)
+
+    async def collect():
+        return [job["title"] async for job in aiter_linkedin_jobs("Data Engineer")]
+
+    assert asyncio.run(collect()) == ["Job 0", "Job 1", "Job 2"]
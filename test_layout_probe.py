@@ -0,0 +1,72 @@
+import pytest
+from linkedin_scraper import PUBLIC_CARD_SELECTORS, PUBLIC_JOB_CARD_FIELDS, LinkedInJobScraper
+from rate_limit import JitterPolicy, RateLimiter
+
+class FakeElement:
+    """Just enough of a Selenium WebElement: text, class and CSS lookups among its children"""
+    def __init__(self, text="", children=None, classes=""):
+        self.text = text
+        self.children = children or {}
+        self.classes = classes
+        self.lookups = []
+
+    def find_elements(self, by, selector):
+        self.lookups.append(selector)
+        return self.children.get(selector, [])
+
+    def get_attribute(self, name):
+        return self.classes if name == "class" else None
+
+class FakeDriver:
+    def __init__(self, cards):
+        self.cards = cards
+
+    def find_elements(self, by, selector):
+        return self.cards.get(selector, [])
+
+    def implicitly_wait(self, seconds):
+        pass
+
+def card(title):
+    return FakeElement(classes="job-search-card", children={
+        ".job-search-card__title": [FakeElement(title)],
+        ".job-search-card__subtitle": [FakeElement("Acme")],
+        "a": [FakeElement()]
+    })
+
+@pytest.fixture
+def scraper(tmp_path, monkeypatch):
+    monkeypatch.setattr(LinkedInJobScraper, "_layout_cache", {})
+    limiter = RateLimiter(str(tmp_path / "limits.sqlite3"), jitter=JitterPolicy(0, 0))
+    return LinkedInJobScraper(use_http=False, limiter=limiter)
+
+def probe(scraper, cards):
+    scraper.driver = FakeDriver({".job-search-card": cards})
+    return scraper._probe_layout(PUBLIC_CARD_SELECTORS, PUBLIC_JOB_CARD_FIELDS)
+
+def test_layout_is_probed_once_and_reused(scraper):
+    layout, cards = probe(scraper, [card("Data Engineer"), card("ML Engineer")])
+    assert layout == {
+        "card": ".job-search-card", "title": ".job-search-card__title", "company": ".job-search-card__subtitle",
+        "location": None, "url": "a"
+    }
+    assert len(cards) == 2
+
+    later_page = [card("Data Scientist")]
+    layout, _ = probe(scraper, later_page)
+    assert layout["title"] == ".job-search-card__title"
+    # Only the field that did not resolve is looked up again
+    assert set(later_page[0].lookups) == set(PUBLIC_JOB_CARD_FIELDS["location"])
+
+def test_unresolved_field_is_probed_again_on_the_next_page(scraper):
+    # Titles still rendering on the first page
+    layout, _ = probe(scraper, [card(""), card("")])
+    assert layout["title"] is None
+    assert layout["company"] == ".job-search-card__subtitle"
+
+    layout, _ = probe(scraper, [card("Data Engineer")])
+    assert layout["title"] == ".job-search-card__title"
+    assert scraper._layout_fields(layout, PUBLIC_JOB_CARD_FIELDS)["title"] == [".job-search-card__title"]
+
+def test_page_without_cards_has_no_layout(scraper):
+    assert probe(scraper, []) == (None, [])
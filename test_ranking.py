@@ -0,0 +1,47 @@
+import numpy as np
+from ranking import JobRanker, rank_jobs, tokenize
+
+JOBS = [
+    {"title": "Data Engineer", "company": "Acme", "url": "https://example.com/1",
+     "description": "Build Spark and Airflow pipelines in Python, model the warehouse in SQL"},
+    {"title": "iOS Developer", "company": "Globex", "url": "https://example.com/2",
+     "description": "Ship Swift features, own release tooling and crash reporting"},
+    {"title": "Frontend Engineer", "company": "Initech", "url": "https://example.com/3",
+     "description": "React and TypeScript single page apps, node.js build tooling"}
+]
+RESUME = "Data engineer with five years of Python, SQL and Airflow experience building pipelines"
+
+def test_tokenize_keeps_tech_terms_and_drops_noise():
+    assert tokenize("C++, C# and Node.js for the 2024 team!") == ["c++", "c#", "node.js"]
+
+def test_best_match_comes_first_with_its_shared_terms():
+    ranked = rank_jobs(RESUME, JOBS)
+    assert ranked[0]["job"] is JOBS[0]
+    assert {"python", "sql", "airflow", "pipelines"} <= set(ranked[0]["matched_terms"])
+    assert ranked[1]["job"] is JOBS[2]
+    assert ranked[1]["matched_terms"] == ["engineer"]
+    # Jobs sharing no term with the resume are left out
+    assert len(ranked) == 2
+
+def test_scores_are_cosine_similarities():
+    ranker = JobRanker()
+    ranker.add_jobs(JOBS)
+    matrix, terms = ranker.tfidf()
+    assert np.allclose(np.sqrt(matrix.multiply(matrix).sum(axis=1)), 1.0)
+    # A resume equal to a job's text scores 1 against it
+    text = f"{JOBS[1]['title']} {JOBS[1]['company']} {JOBS[1]['description']}"
+    assert abs(ranker.rank(text, top_k=1)[0]["score"] - 1.0) < 1e-9
+
+def test_adding_jobs_incrementally_matches_a_one_off_ranking():
+    ranker = JobRanker()
+    assert ranker.add_jobs(JOBS[:1]) == 1
+    ranker.rank(RESUME)  # Consolidates the first batch
+    assert ranker.add_jobs(JOBS[1:] + JOBS[:1]) == 2  # Known URLs are skipped
+    incremental = [(match["job"]["url"], round(match["score"], 9)) for match in ranker.rank("Swift and Python", 3)]
+    one_off = [(match["job"]["url"], round(match["score"], 9)) for match in rank_jobs("Swift and Python", JOBS, 3)]
+    assert incremental == one_off
+    assert len(ranker) == 3
+
+def test_unknown_resume_terms_rank_nothing():
+    assert rank_jobs("Cobol mainframe", JOBS) == []
+    assert JobRanker().rank(RESUME) == []
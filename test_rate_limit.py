@@ -0,0 +1,82 @@
+import time
+import pytest
+from rate_limit import (
+    AUTH_WALL, EMPTY, NO_RESULTS, RATE_LIMITED, SUCCESS, CircuitOpenError, JitterPolicy, RateLimiter
+)
+
+def make_limiter(path, **kwargs):
+    return RateLimiter(str(path), rate=1000, burst=1000, jitter=JitterPolicy(0, 0), **kwargs)
+
+def test_shared_bucket_limits_every_limiter_on_the_file(tmp_path):
+    first = RateLimiter(str(tmp_path / "limits.sqlite3"), rate=0.01, burst=2, jitter=JitterPolicy(0, 0))
+    second = RateLimiter(str(tmp_path / "limits.sqlite3"), rate=0.01, burst=2, jitter=JitterPolicy(0, 0))
+    assert first.shared.try_acquire() == 0
+    assert second.shared.try_acquire() == 0
+    assert first.shared.try_acquire() > 0
+
+def test_rate_limited_trips_at_once_for_at_least_retry_after(tmp_path):
+    limiter = make_limiter(tmp_path / "limits.sqlite3", cooldown=1)
+    limiter.acquire()
+    limiter.record(RATE_LIMITED, retry_after=120)
+    with pytest.raises(CircuitOpenError) as error:
+        limiter.acquire()
+    assert error.value.reason == RATE_LIMITED
+    assert 100 < error.value.retry_in <= 120
+
+def test_auth_wall_trips_at_once(tmp_path):
+    limiter = make_limiter(tmp_path / "limits.sqlite3")
+    limiter.record(AUTH_WALL)
+    with pytest.raises(CircuitOpenError):
+        limiter.acquire()
+
+def test_blocked_looking_empty_pages_trip_after_threshold(tmp_path):
+    limiter = make_limiter(tmp_path / "limits.sqlite3", failure_threshold=3)
+    limiter.record(EMPTY)
+    limiter.record(EMPTY)
+    limiter.acquire()
+    limiter.record(EMPTY)
+    with pytest.raises(CircuitOpenError):
+        limiter.acquire()
+
+def test_zero_result_searches_never_trip(tmp_path):
+    limiter = make_limiter(tmp_path / "limits.sqlite3", failure_threshold=3)
+    for _ in range(5):
+        limiter.acquire()
+        limiter.record(NO_RESULTS)
+    # And they reset a run of empty pages
+    limiter.record(EMPTY)
+    limiter.record(EMPTY)
+    limiter.record(NO_RESULTS)
+    limiter.record(EMPTY)
+    limiter.acquire()
+
+def test_probe_after_cooldown_closes_the_breaker(tmp_path):
+    limiter = make_limiter(tmp_path / "limits.sqlite3", cooldown=0.05)
+    other = make_limiter(tmp_path / "limits.sqlite3", cooldown=0.05)
+    limiter.record(RATE_LIMITED)
+    with pytest.raises(CircuitOpenError):
+        other.acquire()
+    time.sleep(0.1)
+
+    limiter.acquire()  # The probe
+    with pytest.raises(CircuitOpenError):
+        other.acquire()  # Held until the probe reports back
+    limiter.record(SUCCESS)
+    other.acquire()
+
+def test_failed_probe_doubles_the_cooldown(tmp_path):
+    limiter = make_limiter(tmp_path / "limits.sqlite3", cooldown=0.2)
+    limiter.record(RATE_LIMITED)
+    time.sleep(0.25)
+    limiter.acquire()
+    limiter.record(EMPTY)
+    with pytest.raises(CircuitOpenError) as error:
+        limiter.acquire()
+    assert error.value.retry_in > 0.25
+
+def test_late_success_does_not_close_an_open_breaker(tmp_path):
+    limiter = make_limiter(tmp_path / "limits.sqlite3")
+    limiter.record(RATE_LIMITED)
+    limiter.record(SUCCESS)  # A request that was already in flight when the breaker tripped
+    with pytest.raises(CircuitOpenError):
+        limiter.acquire()
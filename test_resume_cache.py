@@ -0,0 +1,66 @@
+import hashlib
+import pytest
+import resume_cache
+from resume_cache import ResumeCache, extract_text, process_resume, split_sections
+
+RESUME = """Jane Doe
+jane@example.com
+
+Professional Summary
+Data engineer building pipelines.
+
+Work Experience
+Acme: Python, SQL and Airflow on AWS.
+
+Technical Skills
+Kafka, Docker
+"""
+
+def write_resume(directory, name="resume.txt", text=RESUME):
+    path = directory / name
+    path.write_text(text)
+    return str(path)
+
+def test_split_sections():
+    assert split_sections(RESUME) == {
+        "header": "Jane Doe\njane@example.com",
+        "summary": "Data engineer building pipelines.",
+        "experience": "Acme: Python, SQL and Airflow on AWS.",
+        "skills": "Kafka, Docker"
+    }
+
+def test_unsupported_format_is_rejected(tmp_path):
+    with pytest.raises(ValueError, match="Unsupported resume format"):
+        extract_text(write_resume(tmp_path, "resume.odt"))
+
+def test_same_content_is_parsed_once(tmp_path, monkeypatch):
+    cache = ResumeCache(str(tmp_path / "cache"))
+    parses = []
+    monkeypatch.setattr(resume_cache, "extract_text", lambda path: parses.append(path) or RESUME)
+    first = cache.process(write_resume(tmp_path, "resume.txt"))
+    # Another file name with the same content is a hit
+    again = cache.process(write_resume(tmp_path, "copy.txt"))
+    assert len(parses) == 1
+    assert again == first
+    assert first["sha256"] == hashlib.sha256(RESUME.encode()).hexdigest()
+    assert first["skills"] == ["AWS", "Airflow", "Docker", "Kafka", "Python", "SQL"]
+    assert first["sections"]["skills"] == "Kafka, Docker"
+
+    # A new process reads it from disk
+    assert ResumeCache(str(tmp_path / "cache")).process(write_resume(tmp_path, "third.txt")) == first
+    assert len(parses) == 1
+
+def test_memory_tier_is_size_bounded(tmp_path):
+    cache = ResumeCache(str(tmp_path / "cache"), max_memory_entries=2)
+    hashes = [cache.process(write_resume(tmp_path, f"resume{i}.txt", f"{RESUME}\nVersion {i}"))["sha256"]
+              for i in range(3)]
+    assert list(cache._memory) == hashes[1:]
+    assert cache.get(hashes[0])["sha256"] == hashes[0]  # Still on disk
+
+def test_process_resume_trusts_sha256_file_names(tmp_path, monkeypatch):
+    monkeypatch.setenv("RESUME_CACHE_DIR", str(tmp_path / "cache"))
+    monkeypatch.setattr(resume_cache, "_default_cache", None)
+    sha256 = hashlib.sha256(RESUME.encode()).hexdigest()
+    path = write_resume(tmp_path, f"{sha256}.txt")
+    monkeypatch.setattr(resume_cache, "hash_file", lambda path: pytest.fail("the file name is its hash"))
+    assert process_resume(path)["sha256"] == sha256
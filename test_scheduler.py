@@ -0,0 +1,103 @@
+import asyncio
+from datetime import datetime, timedelta
+from sqlalchemy import update
+from models import SavedSearch
+from rate_limit import CircuitOpenError, RATE_LIMITED
+from saved_searches import get_saved_search, save_search, saved_search_results
+from scheduler import SearchScheduler
+
+def job(job_id, title):
+    # Distinct titles per job id, or dedup.py would collapse these description-less listings into one
+    return {
+        "title": f"{title} {job_id % 100}", "company": "Acme", "location": "Remote", "posted_time": "2024-03-01",
+        "url": f"https://www.linkedin.com/jobs/view/{job_id}/", "source": "LinkedIn"
+    }
+
+class FakeScheduler(SearchScheduler):
+    """Scheduler whose scraper returns canned pages (by job title) instead of going to LinkedIn"""
+    def __init__(self, pages, **kwargs):
+        super().__init__(workers=1, **kwargs)
+        self.pages = pages
+        self.scraped = []
+
+    def _scrape(self, search, tracker):
+        self.scraped.append(search["job_title"])
+        page = self.pages[search["job_title"]]
+        if isinstance(page, Exception):
+            raise page
+        return tracker.filter_page(page)[0]
+
+async def set_search(session_factory, search_id, **values):
+    async with session_factory() as session:
+        await session.execute(update(SavedSearch).where(SavedSearch.id == search_id).values(**values))
+        await session.commit()
+
+def test_due_searches_run_best_yield_first(session_factory):
+    asyncio.run(save_search("Data Engineer", session_factory=session_factory))
+    high = asyncio.run(save_search("ML Engineer", session_factory=session_factory))
+    later = asyncio.run(save_search("Data Scientist", session_factory=session_factory))
+    asyncio.run(set_search(session_factory, high["id"], yield_score=5.0))
+    asyncio.run(set_search(session_factory, later["id"], next_run_at=datetime.utcnow() + timedelta(hours=1)))
+
+    scheduler = FakeScheduler({
+        "Data Engineer": [job(3800000001, "Data Engineer")],
+        "ML Engineer": [job(3800000002, "ML Engineer"), job(3800000003, "ML Engineer")]
+    }, session_factory=session_factory)
+    asyncio.run(scheduler.run(once=True))
+    assert scheduler.scraped == ["ML Engineer", "Data Engineer"]
+
+    search = asyncio.run(get_saved_search("ML Engineer", session_factory=session_factory))
+    assert search["runs"] == 1
+    assert search["last_new_jobs"] == 2
+    assert search["yield_score"] == 0.7 * 5.0 + 0.3 * 2
+    assert search["next_run_at"] - search["last_run_at"] == timedelta(minutes=60)
+    results = asyncio.run(saved_search_results(search["id"], session_factory=session_factory))
+    assert results["new_count"] == 2
+
+def test_second_run_only_links_new_jobs(session_factory):
+    search = asyncio.run(save_search("Data Engineer", session_factory=session_factory))
+    pages = {"Data Engineer": [job(3800000001, "Data Engineer")]}
+    asyncio.run(FakeScheduler(pages, session_factory=session_factory).run(once=True))
+    asyncio.run(saved_search_results(search["id"], session_factory=session_factory))  # The user has seen it
+
+    asyncio.run(set_search(session_factory, search["id"], next_run_at=datetime.utcnow()))
+    pages["Data Engineer"] = [job(3800000002, "Data Engineer"), job(3800000001, "Data Engineer")]
+    asyncio.run(FakeScheduler(pages, session_factory=session_factory).run(once=True))
+
+    results = asyncio.run(saved_search_results(search["id"], session_factory=session_factory))
+    assert results["new_count"] == 1
+    assert [found["new"] for found in results["jobs"]] == [True, False]
+    assert results["search"]["last_new_jobs"] == 1
+
+def test_open_breaker_postpones_without_counting_a_run(session_factory):
+    search = asyncio.run(save_search("Data Engineer", session_factory=session_factory))
+    scheduler = FakeScheduler({"Data Engineer": CircuitOpenError(RATE_LIMITED, 600)}, session_factory=session_factory)
+    asyncio.run(scheduler.run(once=True))
+
+    search = asyncio.run(get_saved_search("Data Engineer", session_factory=session_factory))
+    assert search["runs"] == 0
+    assert search["last_error"].startswith("LinkedIn requests paused")
+    assert timedelta(minutes=9) < search["next_run_at"] - datetime.utcnow() <= timedelta(minutes=10)
+
+def test_failed_search_waits_a_full_interval(session_factory):
+    asyncio.run(save_search("Data Engineer", interval_minutes=30, session_factory=session_factory))
+    scheduler = FakeScheduler({"Data Engineer": RuntimeError("browser crashed")}, session_factory=session_factory)
+    asyncio.run(scheduler.run(once=True))
+
+    search = asyncio.run(get_saved_search("Data Engineer", session_factory=session_factory))
+    assert search["runs"] == 0
+    assert search["last_error"] == "RuntimeError: browser crashed"
+    assert search["next_run_at"] - datetime.utcnow() > timedelta(minutes=29)
+
+def test_idle_searches_expire_until_searched_again(session_factory):
+    search = asyncio.run(save_search("Data Engineer", session_factory=session_factory))
+    asyncio.run(set_search(session_factory, search["id"], last_viewed_at=datetime.utcnow() - timedelta(days=30)))
+    scheduler = FakeScheduler({"Data Engineer": [job(3800000001, "Data Engineer")]},
+                              session_factory=session_factory, expire_days=14)
+    asyncio.run(scheduler.run(once=True))
+    assert scheduler.scraped == []
+    assert not asyncio.run(get_saved_search("Data Engineer", session_factory=session_factory))["enabled"]
+
+    search = asyncio.run(save_search("Data Engineer", session_factory=session_factory))
+    assert search["enabled"]
+    assert search["next_run_at"] <= datetime.utcnow()
@@ -0,0 +1,96 @@
+import threading
+import time
+from search_cache import SearchCache, normalize_query
+
+def jobs(count, prefix="Job"):
+    return [{"title": f"{prefix} {i}", "url": f"https://example.com/{prefix}/{i}"} for i in range(count)]
+
+class Compute:
+    """compute()/refresh() callback counting its calls"""
+    def __init__(self, result, cacheable=True):
+        self.result = result
+        self.cacheable = cacheable
+        self.calls = 0
+        self.done = threading.Event()
+
+    def __call__(self):
+        self.calls += 1
+        self.done.set()
+        return self.result, self.cacheable
+
+def test_normalize_query_ignores_formatting():
+    assert normalize_query("Data  Engineer!", "new york", "Senior") == normalize_query("data engineer", "New York", "mid-senior")
+    assert normalize_query("Data Engineer") != normalize_query("Data Engineer", authenticated=True)
+    assert normalize_query("Data Engineer") != normalize_query("Data Engineer", namespace="saved")
+
+def test_hits_come_from_memory_then_disk(tmp_path):
+    path = str(tmp_path / "cache.sqlite3")
+    cache = SearchCache(path)
+    compute = Compute(jobs(5))
+    assert cache.get_or_compute("key", 5, compute) == jobs(5)
+    assert cache.get_or_compute("key", 5, compute) == jobs(5)
+    assert compute.calls == 1
+    assert cache.stats()["memory_hits"] == 1
+
+    # A new process finds it on disk
+    other = SearchCache(path)
+    assert other.get_or_compute("key", 5, Compute([])) == jobs(5)
+    assert other.stats()["disk_hits"] == 1
+
+def test_cached_result_answers_smaller_requests_only(tmp_path):
+    cache = SearchCache(str(tmp_path / "cache.sqlite3"))
+    cache.set("key", jobs(10), 10)
+    assert cache.get_or_compute("key", 3, Compute([])) == jobs(3)
+    bigger = Compute(jobs(20))
+    assert cache.get_or_compute("key", 20, bigger) == jobs(20)
+    assert bigger.calls == 1
+
+    # A search that ran dry answers any size
+    cache.set("dry", jobs(4), 10)
+    assert cache.get_or_compute("dry", 50, Compute([])) == jobs(4)
+
+def test_uncacheable_and_empty_results_are_not_stored(tmp_path):
+    cache = SearchCache(str(tmp_path / "cache.sqlite3"))
+    cache.get_or_compute("cancelled", 5, Compute(jobs(2), cacheable=False))
+    cache.get_or_compute("empty", 5, Compute([]))
+    assert cache.stats()["misses"] == 2
+    cache.get_or_compute("cancelled", 5, Compute(jobs(2)))
+    cache.get_or_compute("empty", 5, Compute([]))
+    assert cache.stats()["misses"] == 4
+
+def test_stale_entry_is_served_while_it_refreshes(tmp_path):
+    cache = SearchCache(str(tmp_path / "cache.sqlite3"), ttl=0, stale_ttl=60)
+    cache.set("key", jobs(5), 5)
+    refresh = Compute(jobs(5, prefix="Fresh"))
+    assert cache.get_or_compute("key", 5, Compute([]), refresh=refresh) == jobs(5)
+    assert refresh.done.wait(5)
+    assert cache.stats()["stale_hits"] == 1
+    deadline = time.monotonic() + 5
+    while cache._refreshing and time.monotonic() < deadline:
+        time.sleep(0.01)
+    assert cache._memory["key"]["jobs"] == jobs(5, prefix="Fresh")
+
+def test_stale_entry_without_refresh_is_recomputed(tmp_path):
+    cache = SearchCache(str(tmp_path / "cache.sqlite3"), ttl=0, stale_ttl=60)
+    cache.set("key", jobs(5), 5)
+    compute = Compute(jobs(5, prefix="Fresh"))
+    assert cache.get_or_compute("key", 5, compute) == jobs(5, prefix="Fresh")
+    assert compute.calls == 1
+
+def test_both_tiers_are_size_bounded(tmp_path):
+    cache = SearchCache(str(tmp_path / "cache.sqlite3"), max_memory_entries=2, max_disk_entries=3)
+    for i in range(5):
+        cache.set(f"key {i}", jobs(1), 1)
+    assert list(cache._memory) == ["key 3", "key 4"]
+    with cache._connect() as conn:
+        stored = {row[0] for row in conn.execute("SELECT key FROM search_cache")}
+    assert len(stored) == 3
+    assert "key 4" in stored
+
+def test_invalidate(tmp_path):
+    cache = SearchCache(str(tmp_path / "cache.sqlite3"))
+    cache.set("key", jobs(1), 1)
+    cache.invalidate("key")
+    compute = Compute(jobs(1))
+    cache.get_or_compute("key", 1, compute)
+    assert compute.calls == 1
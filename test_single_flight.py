@@ -0,0 +1,121 @@
+import threading
+import time
+import pytest
+from rate_limit import BrowserAdmission
+from single_flight import SingleFlight
+
+class StopListening(Exception):
+    pass
+
+def start_follower(flight, key, received):
+    """Join key's flight from another thread; the outcome lands in received["result"] or ["error"]"""
+    def follow():
+        try:
+            received["result"] = flight.do(key, lambda emit: pytest.fail("a follower must not run the call"),
+                                           received.setdefault("items", []).append)
+        except Exception as e:
+            received["error"] = e
+    thread = threading.Thread(target=follow)
+    thread.start()
+    return thread
+
+def wait_for_listeners(flight, key, count):
+    flight_state = flight._flights[key]
+    for _ in range(500):
+        with flight_state._cond:
+            if flight_state.listeners >= count:
+                return
+        time.sleep(0.01)
+    pytest.fail("follower never joined")
+
+def test_concurrent_callers_share_one_call_and_its_items():
+    flight = SingleFlight()
+    calls = []
+    follower = {}
+    leader_items = []
+
+    def scrape(emit):
+        calls.append(1)
+        emit("job 1")
+        thread = start_follower(flight, "key", follower)
+        wait_for_listeners(flight, "key", 2)
+        emit("job 2")
+        scrape.thread = thread
+        return ["job 1", "job 2"]
+
+    assert flight.do("key", scrape, leader_items.append) == ["job 1", "job 2"]
+    scrape.thread.join(5)
+    assert calls == [1]
+    assert leader_items == ["job 1", "job 2"]
+    # The follower got a replay of "job 1", then "job 2" live
+    assert follower["items"] == ["job 1", "job 2"]
+    assert follower["result"] == ["job 1", "job 2"]
+    assert not flight.in_flight("key")
+
+def test_leader_error_reaches_followers():
+    flight = SingleFlight()
+    follower = {}
+
+    def scrape(emit):
+        thread = start_follower(flight, "key", follower)
+        wait_for_listeners(flight, "key", 2)
+        scrape.thread = thread
+        raise RuntimeError("browser crashed")
+
+    with pytest.raises(RuntimeError):
+        flight.do("key", scrape)
+    scrape.thread.join(5)
+    assert str(follower["error"]) == "browser crashed"
+
+def test_call_is_cancelled_once_nobody_listens():
+    flight = SingleFlight()
+    emitted = []
+
+    def on_item(item):
+        raise StopListening()
+
+    def scrape(emit):
+        for i in range(10):
+            emit(i)
+            emitted.append(i)
+
+    with pytest.raises(StopListening):
+        flight.do("key", scrape, on_item)
+    assert emitted == []
+
+def test_call_continues_while_a_follower_listens():
+    flight = SingleFlight()
+    follower = {}
+    emitted = []
+
+    def on_item(item):
+        raise StopListening()  # The leader's own consumer goes away at once
+
+    def scrape(emit):
+        thread = start_follower(flight, "key", follower)
+        wait_for_listeners(flight, "key", 2)
+        for i in range(3):
+            emit(i)
+            emitted.append(i)
+        scrape.thread = thread
+        return emitted
+
+    assert flight.do("key", scrape, on_item) == [0, 1, 2]
+    scrape.thread.join(5)
+    assert follower["items"] == [0, 1, 2]
+
+def test_later_calls_run_again():
+    flight = SingleFlight()
+    assert flight.do("key", lambda emit: 1) == 1
+    assert flight.do("key", lambda emit: 2) == 2
+
+def test_browser_admission_caps_live_browsers():
+    admission = BrowserAdmission(limit=2, timeout=0.05)
+    assert admission.acquire(5) == 2  # More than the limit takes every slot rather than waiting forever
+    with pytest.raises(TimeoutError):
+        admission.acquire()
+    admission.release(2)
+    with admission.slots(2):
+        with pytest.raises(TimeoutError):
+            admission.acquire()
+    assert admission.acquire() == 1
@@ -0,0 +1,43 @@
+import pytest
+from skills import SkillMatcher, extract_skills, skill_gap
+
+@pytest.mark.parametrize("text, expected", [
+    ("Python3, NODE-JS and node.js services on k8s", ["JavaScript", "Kubernetes", "Node.js", "Python"]),
+    ("CI/CD with GitHub Actions; C++ and C# on .NET Core", ["C#", "C++", "CI/CD", "GitHub Actions", ".NET"]),
+    ("Go developer with Kubernetes", ["Go", "Kubernetes"]),
+    ("We write Go and Rust", ["Go", "Rust"]),
+    ("Senior Swift engineer", ["Swift"]),
+    ("Built apps in React and TypeScript", ["React", "TypeScript"]),
+    ("Experience with ML and Python", ["Machine Learning", "Python"]),
+    ("Spark, Kafka and Airflow", ["Airflow", "Kafka", "Spark"]),
+    ("Internal APIs in Flask", ["Flask"]),
+    ("Java, Spring Boot, SQL", ["Java", "SQL", "Spring"]),
+    ("java developer", ["Java"]),
+    ("Snowflake and dbt", ["Snowflake", "dbt"]),
+    ("pandas and numpy", ["NumPy", "Pandas"]),
+    ("Skills:\nGo, Python", ["Go", "Python"])
+])
+def test_extract_skills_recall(text, expected):
+    assert extract_skills(text) == sorted(expected)
+
+@pytest.mark.parametrize("text", [
+    "Go ahead and apply today. We go to great lengths for our people.",
+    "React quickly to customer escalations; a swift response matters.",
+    "Spark joy in the office. Add 5 ml of water to a flask of tea.",
+    "Rust on the old car and a ruby red door.",
+    "Start with a cup of java, every snowflake is unique, pandas at the zoo.",
+    "Store containers of food, work as a security guard, review analytics."
+])
+def test_extract_skills_ignores_prose(text):
+    assert extract_skills(text) == []
+
+def test_custom_dictionary():
+    matcher = SkillMatcher({"Spanner": ["cloud spanner"]}, ambiguous={"Beam": ("Beam", "context")})
+    assert matcher.extract("Cloud Spanner and Beam pipelines") == ["Beam", "Spanner"]
+    assert matcher.extract("a beam of light") == []
+
+def test_skill_gap():
+    assert skill_gap(["Go", "Python", "SQL"], ["Python", "SQL", "Excel"]) == {
+        "matched": ["Python", "SQL"], "missing": ["Go"], "coverage": 2 / 3
+    }
+    assert skill_gap([], ["Python"])["coverage"] == 1.0
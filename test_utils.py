@@ -0,0 +1,50 @@
+import asyncio
+import hashlib
+import os
+import pytest
+
+pytest.importorskip("fastapi")
+pytest.importorskip("aiofiles")
+import utils
+from utils import UploadTooLarge, format_size, save_uploaded_file
+
+class FakeUpload:
+    """The part of fastapi.UploadFile that save_uploaded_file uses"""
+    def __init__(self, filename, content):
+        self.filename = filename
+        self._content = content
+        self.reads = []
+
+    async def read(self, size):
+        self.reads.append(size)
+        chunk, self._content = self._content[:size], self._content[size:]
+        return chunk
+
+def test_format_size():
+    assert format_size(10 * 1024 * 1024) == "10 MB"
+    assert format_size(1536 * 1024) == "1.5 MB"
+    assert format_size(512 * 1024) == "512 KB"
+    assert format_size(800) == "800 bytes"
+
+def test_upload_is_streamed_into_a_content_addressed_file(tmp_path, monkeypatch):
+    monkeypatch.setattr(utils, "UPLOAD_CHUNK_SIZE", 4)
+    content = b"Python, SQL and Airflow"
+    upload = FakeUpload("My Resume.PDF", content)
+    path = asyncio.run(save_uploaded_file(upload, str(tmp_path)))
+    assert path == os.path.join(str(tmp_path), f"{hashlib.sha256(content).hexdigest()}.pdf")
+    assert open(path, "rb").read() == content
+    assert set(upload.reads) == {4}
+
+    # The same content under another name reuses the stored file
+    assert asyncio.run(save_uploaded_file(FakeUpload("copy.pdf", content), str(tmp_path))) == path
+    assert os.listdir(tmp_path) == [os.path.basename(path)]
+
+def test_odd_extensions_fall_back_to_txt(tmp_path):
+    path = asyncio.run(save_uploaded_file(FakeUpload("resume.../../x y", b"text"), str(tmp_path)))
+    assert path.endswith(".txt")
+
+def test_oversized_upload_is_rejected_and_cleaned_up(tmp_path, monkeypatch):
+    monkeypatch.setattr(utils, "UPLOAD_CHUNK_SIZE", 4)
+    with pytest.raises(UploadTooLarge, match="8 bytes"):
+        asyncio.run(save_uploaded_file(FakeUpload("resume.pdf", b"x" * 20), str(tmp_path), max_bytes=8))
+    assert os.listdir(tmp_path) == []
@@ -0,0 +1,70 @@
+import time
+from work_queue import DONE, LEASED, POISON, QUEUED, WorkQueue
+
+def test_lease_hands_each_item_to_one_worker(tmp_path):
+    work_queue = WorkQueue(str(tmp_path / "queue.sqlite3"))
+    first = work_queue.enqueue({"job_title": "Data Engineer"})
+    second = work_queue.enqueue({"job_title": "ML Engineer"})
+
+    assert work_queue.lease("worker-a") == (first, {"job_title": "Data Engineer"}, 1)
+    assert work_queue.lease("worker-b") == (second, {"job_title": "ML Engineer"}, 1)
+    assert work_queue.lease("worker-c") is None
+    assert work_queue.stats() == {QUEUED: 0, LEASED: 2, DONE: 0, POISON: 0}
+
+    # Only the lease owner can acknowledge an item
+    assert not work_queue.complete(first, "worker-b", {"jobs": 3})
+    assert work_queue.complete(first, "worker-a", {"jobs": 3})
+    assert work_queue.pending() == 1
+
+def test_failed_item_is_retried_then_poisoned(tmp_path):
+    work_queue = WorkQueue(str(tmp_path / "queue.sqlite3"), retry_backoff=0)
+    item_id = work_queue.enqueue({"job_title": "Data Engineer"}, max_attempts=2)
+
+    work_queue.lease("worker-a")
+    assert work_queue.fail(item_id, "worker-a", "TimeoutError: page load") == QUEUED
+    assert work_queue.lease("worker-a")[2] == 2
+    assert work_queue.fail(item_id, "worker-a", "TimeoutError: page load") == POISON
+    assert work_queue.lease("worker-a") is None
+    assert work_queue.poisoned() == [{
+        "id": item_id, "payload": {"job_title": "Data Engineer"}, "attempts": 2, "error": "TimeoutError: page load"
+    }]
+
+    assert work_queue.requeue_poisoned([item_id]) == 1
+    assert work_queue.lease("worker-a") == (item_id, {"job_title": "Data Engineer"}, 1)
+
+def test_failed_item_waits_out_its_backoff(tmp_path):
+    work_queue = WorkQueue(str(tmp_path / "queue.sqlite3"), retry_backoff=60)
+    item_id = work_queue.enqueue({"job_title": "Data Engineer"})
+    work_queue.lease("worker-a")
+    work_queue.fail(item_id, "worker-a", "boom")
+    assert work_queue.lease("worker-a") is None
+    assert work_queue.stats()[QUEUED] == 1
+
+def test_released_item_keeps_its_attempts(tmp_path):
+    work_queue = WorkQueue(str(tmp_path / "queue.sqlite3"))
+    item_id = work_queue.enqueue({"job_title": "Data Engineer"}, max_attempts=1)
+    work_queue.lease("worker-a")
+    assert work_queue.release(item_id, "worker-a")
+    assert work_queue.lease("worker-b") == (item_id, {"job_title": "Data Engineer"}, 1)
+
+def test_expired_lease_goes_to_another_worker(tmp_path):
+    work_queue = WorkQueue(str(tmp_path / "queue.sqlite3"))
+    item_id = work_queue.enqueue({"job_title": "Data Engineer"})
+    work_queue.lease("worker-a", lease_seconds=0.01)
+    time.sleep(0.05)
+
+    assert work_queue.lease("worker-b") == (item_id, {"job_title": "Data Engineer"}, 2)
+    # The crashed worker's lease is gone
+    assert not work_queue.heartbeat(item_id, "worker-a")
+    assert not work_queue.complete(item_id, "worker-a")
+    assert work_queue.heartbeat(item_id, "worker-b")
+
+def test_expired_lease_out_of_attempts_is_poisoned(tmp_path):
+    work_queue = WorkQueue(str(tmp_path / "queue.sqlite3"))
+    work_queue.enqueue({"job_title": "Data Engineer"}, max_attempts=1)
+    work_queue.lease("worker-a", lease_seconds=0.01)
+    time.sleep(0.05)
+
+    assert work_queue.lease("worker-b") is None
+    assert work_queue.stats()[POISON] == 1
+    assert work_queue.poisoned()[0]["error"] == "Lease expired"
@@ -0,0 +1,85 @@
+import asyncio
+import json
+import time
+from sqlalchemy import func, select
+import write_behind
+from ingest import upsert_jobs
+from models import Job
+from write_behind import JobWriter
+
+def job(job_id):
+    return {"title": f"Engineer {job_id}", "company": "Acme", "url": f"https://www.linkedin.com/jobs/view/{job_id}/"}
+
+def stored_count(session_factory):
+    async def count():
+        async with session_factory() as session:
+            return (await session.execute(select(func.count()).select_from(Job))).scalar_one()
+    return asyncio.run(count())
+
+class FlakyUpsert:
+    """upsert_jobs that fails until `healthy` is set"""
+    def __init__(self):
+        self.healthy = False
+
+    async def __call__(self, jobs, session_factory):
+        if not self.healthy:
+            raise ConnectionError("database is down")
+        return await upsert_jobs(jobs, session_factory)
+
+def make_writer(session_factory, tmp_path, **kwargs):
+    options = {"flush_interval": 0.05, "max_retries": 2, "retry_backoff": 0.01,
+               "dead_letter_path": str(tmp_path / "dead_letter.jsonl"), "session_factory": session_factory}
+    return JobWriter(**{**options, **kwargs})
+
+def wait_until(condition, timeout=10):
+    deadline = time.monotonic() + timeout
+    while not condition():
+        assert time.monotonic() < deadline, "timed out"
+        time.sleep(0.02)
+
+def test_queued_jobs_are_written_in_batches(session_factory, tmp_path):
+    with make_writer(session_factory, tmp_path, batch_size=3) as writer:
+        for i in range(7):
+            writer.put(job(3800000000 + i))
+        assert writer.flush(timeout=10)
+        assert stored_count(session_factory) == 7
+        assert writer.stats["inserted"] == 7
+
+def test_failed_batches_are_replayed_once_the_database_is_back(session_factory, tmp_path, monkeypatch):
+    upsert = FlakyUpsert()
+    monkeypatch.setattr(write_behind, "upsert_jobs", upsert)
+    with make_writer(session_factory, tmp_path, replay_interval=0.2) as writer:
+        writer.put(job(3800000001))
+        writer.put(job(3800000002))
+        assert not writer.flush(timeout=10)
+        assert writer.stats["dead_lettered"] == 2
+        with open(tmp_path / "dead_letter.jsonl") as f:
+            assert [json.loads(line)["url"] for line in f] == [job(3800000001)["url"], job(3800000002)["url"]]
+
+        # No restart needed: the next timed replay stores them
+        upsert.healthy = True
+        wait_until(lambda: writer.stats["inserted"] == 2)
+        assert not (tmp_path / "dead_letter.jsonl").exists()
+        assert stored_count(session_factory) == 2
+
+def test_dead_letters_of_a_previous_writer_are_replayed_at_start(session_factory, tmp_path):
+    with open(tmp_path / "dead_letter.jsonl", "w") as f:
+        f.write(json.dumps(job(3800000001)) + "\n")
+    with make_writer(session_factory, tmp_path) as writer:
+        assert writer.flush(timeout=10)
+    assert stored_count(session_factory) == 1
+
+def test_flusher_survives_a_failure_to_dead_letter(session_factory, tmp_path, monkeypatch):
+    upsert = FlakyUpsert()
+    monkeypatch.setattr(write_behind, "upsert_jobs", upsert)
+    # The dead-letter file cannot be written
+    with make_writer(session_factory, tmp_path, max_pending=1,
+                     dead_letter_path=str(tmp_path / "missing" / "dead_letter.jsonl")) as writer:
+        writer.put(job(3800000001))
+        assert not writer.flush(timeout=10)
+        assert writer.stats["lost"] == 1
+
+        upsert.healthy = True
+        writer.put(job(3800000002), timeout=5)  # The slot was released, and the flusher is still running
+        assert writer.flush(timeout=10)
+    assert stored_count(session_factory) == 1
@@ -1,20 +1,61 @@
 import os
+import re
+import hashlib
 import aiofiles
 from fastapi import UploadFile
-from datetime import datetime
 import uuid
 
-async def save_uploaded_file(file: UploadFile, directory: str) -> str:
+# Uploads larger than this are rejected while streaming (override with MAX_UPLOAD_BYTES)
+MAX_UPLOAD_BYTES = int(os.getenv("MAX_UPLOAD_BYTES", str(10 * 1024 * 1024)))
+UPLOAD_CHUNK_SIZE = 64 * 1024
+
+class UploadTooLarge(ValueError):
+    pass
+
+def format_size(num_bytes):
+    """Human-readable size, e.g. 10 MB, 1.5 MB, 512 KB or 800 bytes"""
+    for unit, factor in (("MB", 1024 * 1024), ("KB", 1024)):
+        if num_bytes >= factor:
+            return f"{num_bytes / factor:.1f}".rstrip("0").rstrip(".") + f" {unit}"
+    return f"{num_bytes} bytes"
+
+async def save_uploaded_file(file: UploadFile, directory: str, max_bytes: int = MAX_UPLOAD_BYTES) -> str:
+    """Stream an upload into a content-addressed store and return its path.
+
+    The upload is read in UPLOAD_CHUNK_SIZE chunks into a temp file while
+    its SHA-256 is computed, so memory stays flat whatever its size. It is
+    then renamed to <sha256><ext>; if that content is already stored the
+    temp file is dropped and the existing path returned. Raises
+    UploadTooLarge (a ValueError) once more than max_bytes have been read.
+    """
     os.makedirs(directory, exist_ok=True)
-    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-    unique_id = str(uuid.uuid4())[:8]
-    ext = os.path.splitext(file.filename)[1] if file.filename else ".txt"
-    filename = f"{timestamp}_{unique_id}{ext}"
-    file_path = os.path.join(directory, filename)
-    async with aiofiles.open(file_path, 'wb') as f:
-        content = await file.read()
-        await f.write(content)
-    return file_path
+    ext = os.path.splitext(file.filename or "")[1].lower()
+    ext = ext if re.fullmatch(r"\.[a-z0-9]{1,10}", ext) else ".txt"
+    temp_path = os.path.join(directory, f".upload-{uuid.uuid4().hex}.tmp")
+    digest = hashlib.sha256()
+    size = 0
+    try:
+        async with aiofiles.open(temp_path, 'wb') as f:
+            while True:
+                chunk = await file.read(UPLOAD_CHUNK_SIZE)
+                if not chunk:
+                    break
+                size += len(chunk)
+                if size > max_bytes:
+                    raise UploadTooLarge(f"Upload exceeds the {format_size(max_bytes)} limit")
+                digest.update(chunk)
+                await f.write(chunk)
+        file_path = os.path.join(directory, f"{digest.hexdigest()}{ext}")
+        if os.path.exists(file_path):
+            os.remove(temp_path)
+        else:
+            # Atomic on the same filesystem: readers see the whole file or nothing
+            os.replace(temp_path, file_path)
+        return file_path
+    except BaseException:
+        if os.path.exists(temp_path):
+            os.remove(temp_path)
+        raise
 
 def linkedin_login_stub():
     # This is a stub for LinkedIn login automation
@@ -0,0 +1,181 @@
+import json
+import logging
+import os
+import sqlite3
+import time
+from contextlib import contextmanager
+
+QUEUED, LEASED, DONE, POISON = "queued", "leased", "done", "poison"
+
+class WorkQueue:
+    """Durable work queue in a SQLite file, shared by any number of processes.
+
+    Workers lease an item for lease_seconds (extended with heartbeat())
+    and then complete() or fail() it. A failed item is retried with
+    exponential backoff until it has been attempted max_attempts times,
+    then parked in the poison state for inspection. A lease that expires
+    (the worker crashed or hung) makes the item available again, so
+    nothing queued is lost. Leasing runs in a write transaction
+    (BEGIN IMMEDIATE), so two workers never get the same item.
+    """
+    def __init__(self, path="work_queue.sqlite3", retry_backoff=30.0):
+        self.path = path
+        self.retry_backoff = retry_backoff
+        self.logger = logging.getLogger(__name__)
+        with self._connect() as conn:
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS work_items (
+                    id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    payload TEXT NOT NULL,
+                    status TEXT NOT NULL,
+                    attempts INTEGER NOT NULL DEFAULT 0,
+                    max_attempts INTEGER NOT NULL,
+                    available_at REAL NOT NULL,
+                    lease_owner TEXT,
+                    lease_expires REAL,
+                    last_error TEXT,
+                    result TEXT,
+                    created_at REAL NOT NULL,
+                    updated_at REAL NOT NULL
+                )
+            """)
+            conn.execute("CREATE INDEX IF NOT EXISTS ix_work_items_status ON work_items (status, available_at)")
+
+    @contextmanager
+    def _connect(self):
+        # Autocommit mode: transactions are opened explicitly where they matter
+        conn = sqlite3.connect(self.path, timeout=30, isolation_level=None)
+        try:
+            yield conn
+        finally:
+            conn.close()
+
+    def enqueue(self, payload, max_attempts=3):
+        now = time.time()
+        with self._connect() as conn:
+            cursor = conn.execute(
+                "INSERT INTO work_items (payload, status, max_attempts, available_at, created_at, updated_at) "
+                "VALUES (?, ?, ?, ?, ?, ?)",
+                (json.dumps(payload), QUEUED, max_attempts, now, now, now)
+            )
+            return cursor.lastrowid
+
+    def lease(self, owner, lease_seconds=300):
+        """Take the oldest available item: (id, payload, attempt) or None"""
+        now = time.time()
+        with self._connect() as conn:
+            conn.execute("BEGIN IMMEDIATE")
+            try:
+                # Expired leases of items out of attempts go to the poison queue
+                conn.execute(
+                    "UPDATE work_items SET status = ?, last_error = coalesce(last_error, 'Lease expired'), "
+                    "lease_owner = NULL, updated_at = ? "
+                    "WHERE status = ? AND lease_expires < ? AND attempts >= max_attempts",
+                    (POISON, now, LEASED, now)
+                )
+                row = conn.execute(
+                    "SELECT id, payload, attempts FROM work_items "
+                    "WHERE (status = ? AND available_at <= ?) OR (status = ? AND lease_expires < ?) "
+                    "ORDER BY id LIMIT 1",
+                    (QUEUED, now, LEASED, now)
+                ).fetchone()
+                if row is None:
+                    conn.execute("COMMIT")
+                    return None
+                conn.execute(
+                    "UPDATE work_items SET status = ?, attempts = attempts + 1, lease_owner = ?, "
+                    "lease_expires = ?, updated_at = ? WHERE id = ?",
+                    (LEASED, owner, now + lease_seconds, now, row[0])
+                )
+                conn.execute("COMMIT")
+            except BaseException:
+                conn.execute("ROLLBACK")
+                raise
+        return row[0], json.loads(row[1]), row[2] + 1
+
+    def heartbeat(self, item_id, owner, lease_seconds=300):
+        """Extend a lease; returns False if the lease was lost (expired and taken by another worker)"""
+        with self._connect() as conn:
+            cursor = conn.execute(
+                "UPDATE work_items SET lease_expires = ?, updated_at = ? "
+                "WHERE id = ? AND status = ? AND lease_owner = ?",
+                (time.time() + lease_seconds, time.time(), item_id, LEASED, owner)
+            )
+            return cursor.rowcount == 1
+
+    def complete(self, item_id, owner, result=None):
+        with self._connect() as conn:
+            cursor = conn.execute(
+                "UPDATE work_items SET status = ?, result = ?, lease_owner = NULL, lease_expires = NULL, "
+                "updated_at = ? WHERE id = ? AND status = ? AND lease_owner = ?",
+                (DONE, json.dumps(result), time.time(), item_id, LEASED, owner)
+            )
+            return cursor.rowcount == 1
+
+    def fail(self, item_id, owner, error):
+        """Retry the item later, or move it to the poison queue once out of attempts"""
+        now = time.time()
+        with self._connect() as conn:
+            row = conn.execute(
+                "SELECT attempts, max_attempts FROM work_items WHERE id = ? AND status = ? AND lease_owner = ?",
+                (item_id, LEASED, owner)
+            ).fetchone()
+            if row is None:
+                return None
+            attempts, max_attempts = row
+            if attempts >= max_attempts:
+                status, available_at = POISON, now
+                self.logger.error(f"[Queue] Item {item_id} failed {attempts} times, moved to poison: {error}")
+            else:
+                status, available_at = QUEUED, now + self.retry_backoff * 2 ** (attempts - 1)
+            conn.execute(
+                "UPDATE work_items SET status = ?, available_at = ?, last_error = ?, lease_owner = NULL, "
+                "lease_expires = NULL, updated_at = ? WHERE id = ?",
+                (status, available_at, str(error)[:2000], now, item_id)
+            )
+            return status
+
+    def release(self, item_id, owner, delay=0.0):
+        """Give a leased item back untried (e.g. the site is throttling us); the attempt is not counted"""
+        now = time.time()
+        with self._connect() as conn:
+            cursor = conn.execute(
+                "UPDATE work_items SET status = ?, attempts = max(attempts - 1, 0), available_at = ?, "
+                "lease_owner = NULL, lease_expires = NULL, updated_at = ? WHERE id = ? AND status = ? AND lease_owner = ?",
+                (QUEUED, now + delay, now, item_id, LEASED, owner)
+            )
+            return cursor.rowcount == 1
+
+    def pending(self):
+        """Items still to be worked on (queued or leased)"""
+        with self._connect() as conn:
+            return conn.execute(
+                "SELECT count(*) FROM work_items WHERE status IN (?, ?)", (QUEUED, LEASED)
+            ).fetchone()[0]
+
+    def stats(self):
+        with self._connect() as conn:
+            counts = dict(conn.execute("SELECT status, count(*) FROM work_items GROUP BY status").fetchall())
+        return {status: counts.get(status, 0) for status in (QUEUED, LEASED, DONE, POISON)}
+
+    def poisoned(self, limit=100):
+        with self._connect() as conn:
+            rows = conn.execute(
+                "SELECT id, payload, attempts, last_error FROM work_items WHERE status = ? ORDER BY id LIMIT ?",
+                (POISON, limit)
+            ).fetchall()
+        return [{"id": row[0], "payload": json.loads(row[1]), "attempts": row[2], "error": row[3]} for row in rows]
+
+    def requeue_poisoned(self, item_ids=None):
+        """Give poisoned items (all, or the given ids) a fresh set of attempts"""
+        query = "UPDATE work_items SET status = ?, attempts = 0, available_at = ?, updated_at = ? WHERE status = ?"
+        params = [QUEUED, time.time(), time.time(), POISON]
+        if item_ids:
+            query += f" AND id IN ({', '.join('?' for _ in item_ids)})"
+            params.extend(item_ids)
+        with self._connect() as conn:
+            return conn.execute(query, params).rowcount
+
+def default_queue_path():
+    return os.getenv("WORK_QUEUE_PATH", "work_queue.sqlite3")
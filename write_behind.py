@@ -0,0 +1,218 @@
+import asyncio
+import atexit
+import json
+import logging
+import os
+import queue
+import threading
+from db import create_session_factory
+from ingest import upsert_jobs
+
+_STOP = object()
+
+class _FlushRequest:
+    """Queue marker: set once every job queued before it has been written (or given up on)"""
+    def __init__(self, failed):
+        self.done = threading.Event()
+        self.failed = failed
+
+class JobWriter:
+    """Write-behind queue between scraper callbacks and the jobs table.
+
+    put() is called from scraper threads and returns immediately unless
+    max_pending jobs are already waiting, in which case it blocks
+    (backpressure). A flusher coroutine on its own event loop thread
+    batches jobs by size (batch_size) or time (flush_interval) and
+    bulk-upserts them with ingest.upsert_jobs. Failed batches are retried
+    with exponential backoff; after max_retries they are appended to a
+    dead-letter JSONL file, which is replayed when the writer starts and
+    every replay_interval seconds after that, so jobs are stored once the
+    database is back. flush() waits until everything queued so far is
+    written; close() (also run at exit) flushes everything still queued.
+    """
+    def __init__(self, max_pending=10000, batch_size=200, flush_interval=2.0, max_retries=5,
+                 retry_backoff=1.0, dead_letter_path="ingest_dead_letter.jsonl", session_factory=None,
+                 replay_interval=300.0):
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.max_retries = max_retries
+        self.retry_backoff = retry_backoff
+        self.dead_letter_path = dead_letter_path
+        self.replay_interval = replay_interval
+        self.logger = logging.getLogger(__name__)
+        self.stats = {"queued": 0, "inserted": 0, "updated": 0, "duplicates": 0, "retries": 0, "dead_lettered": 0,
+                      "lost": 0}
+        self._session_factory = session_factory
+        self._slots = threading.BoundedSemaphore(max_pending)
+        self._loop = None
+        self._queue = None
+        self._thread = None
+        self._closed = False
+
+    def start(self):
+        ready = threading.Event()
+        self._thread = threading.Thread(target=asyncio.run, args=(self._run(ready),), name="job-writer", daemon=True)
+        self._thread.start()
+        ready.wait()
+        atexit.register(self.close)
+        return self
+
+    def put(self, job, timeout=None):
+        """Queue a scraped job for writing; blocks only while the queue is full"""
+        if self._closed:
+            raise RuntimeError("JobWriter is closed")
+        if not self._slots.acquire(timeout=timeout):
+            raise queue.Full("Job write queue is full")
+        self.stats["queued"] += 1
+        self._loop.call_soon_threadsafe(self._queue.put_nowait, job)
+
+    def flush(self, timeout=None):
+        """Block until every job queued so far has been written.
+
+        Returns True if they were all stored, False on timeout or if any
+        batch had to be dead-lettered (or was lost) in the meantime.
+        """
+        if self._closed or not self._thread:
+            return False
+        request = _FlushRequest(self._failed())
+        self._loop.call_soon_threadsafe(self._queue.put_nowait, request)
+        return request.done.wait(timeout) and self._failed() == request.failed
+
+    def _failed(self):
+        return self.stats["dead_lettered"] + self.stats["lost"]
+
+    def close(self, timeout=None):
+        """Flush every queued job and stop the flusher"""
+        if self._closed or not self._thread:
+            return
+        self._closed = True
+        self._loop.call_soon_threadsafe(self._queue.put_nowait, _STOP)
+        self._thread.join(timeout)
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc):
+        self.close()
+
+    async def _run(self, ready):
+        self._loop = asyncio.get_running_loop()
+        self._queue = asyncio.Queue()
+        own_engine = self._session_factory is None
+        if own_engine:
+            # The app's engine belongs to the app's event loop; the flusher gets its own
+            self._session_factory = create_session_factory()
+        ready.set()
+        next_replay = self._loop.time()  # Jobs a previous writer could not store go first
+        stopping = False
+        while not stopping:
+            if self._loop.time() >= next_replay:
+                try:
+                    await self._replay_dead_letters()
+                except Exception as e:
+                    self.logger.error(f"[Writer] Replaying dead-lettered jobs failed: {str(e)}")
+                next_replay = self._loop.time() + self.replay_interval
+            batch, stopping, flushes = await self._next_batch(next_replay - self._loop.time())
+            try:
+                if batch:
+                    await self._write(batch)
+            except Exception as e:
+                # E.g. the dead-letter file is not writable. The flusher must outlive it, or put() blocks for good
+                self.stats["lost"] += len(batch)
+                self.logger.error(f"[Writer] Lost {len(batch)} jobs: {str(e)}")
+            finally:
+                for _ in batch:
+                    self._slots.release()
+                for request in flushes:
+                    request.done.set()
+        if own_engine:
+            await self._session_factory.kw["bind"].dispose()
+        self.logger.info(f"[Writer] Stopped: {self.stats}")
+
+    async def _next_batch(self, timeout):
+        """Collect up to batch_size jobs, waiting at most `timeout` for the first and flush_interval after it.
+
+        A flush request ends the batch at once; returns (batch, stopping, flush requests).
+        """
+        batch = []
+        if self._queue.empty():
+            try:
+                item = await asyncio.wait_for(self._queue.get(), max(0.0, timeout))
+            except asyncio.TimeoutError:
+                return batch, False, []  # Time to replay the dead letters
+        else:
+            item = self._queue.get_nowait()
+        if item is _STOP:
+            return batch, True, []
+        if isinstance(item, _FlushRequest):
+            return batch, False, [item]
+        batch.append(item)
+        deadline = self._loop.time() + self.flush_interval
+        while len(batch) < self.batch_size:
+            timeout = deadline - self._loop.time()
+            if timeout <= 0:
+                break
+            try:
+                item = await asyncio.wait_for(self._queue.get(), timeout)
+            except asyncio.TimeoutError:
+                break
+            if item is _STOP:
+                return batch, True, []
+            if isinstance(item, _FlushRequest):
+                return batch, False, [item]
+            batch.append(item)
+        return batch, False, []
+
+    async def _write(self, batch):
+        delay = self.retry_backoff
+        for attempt in range(1, self.max_retries + 1):
+            try:
+                counts = await upsert_jobs(batch, self._session_factory)
+                self.stats["inserted"] += counts["inserted"]
+                self.stats["updated"] += counts["updated"]
+                self.stats["duplicates"] += counts["duplicates"]
+                return True
+            except Exception as e:
+                self.logger.warning(f"[Writer] Writing {len(batch)} jobs failed (attempt {attempt}/{self.max_retries}): {str(e)}")
+                if attempt < self.max_retries:
+                    self.stats["retries"] += 1
+                    await asyncio.sleep(delay)
+                    delay = min(delay * 2, 60)
+        self._dead_letter(batch)
+        return False
+
+    def _dead_letter(self, batch):
+        with open(self.dead_letter_path, "a", encoding="utf-8") as f:
+            for job in batch:
+                f.write(json.dumps(job, default=str) + "\n")
+        self.stats["dead_lettered"] += len(batch)
+        self.logger.error(f"[Writer] Moved {len(batch)} jobs to {self.dead_letter_path}")
+
+    async def _replay_dead_letters(self):
+        """Retry jobs that could not be stored earlier, by this writer or a previous one"""
+        if not self.dead_letter_path:
+            return
+        replay_path = self.dead_letter_path + ".replay"
+        # A replay file left behind means a replay was interrupted: finish that one first
+        if not os.path.exists(replay_path):
+            if not os.path.exists(self.dead_letter_path):
+                return
+            os.replace(self.dead_letter_path, replay_path)
+        with open(replay_path, encoding="utf-8") as f:
+            jobs = [json.loads(line) for line in f if line.strip()]
+        self.logger.info(f"[Writer] Replaying {len(jobs)} dead-lettered jobs")
+        for start in range(0, len(jobs), self.batch_size):
+            # Batches that fail again go back to the dead-letter file
+            await self._write(jobs[start:start + self.batch_size])
+        os.remove(replay_path)
+
+_writer = None
+_writer_lock = threading.Lock()
+
+def get_job_writer():
+    """Process-wide JobWriter, started on first use"""
+    global _writer
+    with _writer_lock:
+        if _writer is None:
+            _writer = JobWriter().start()
+        return _writer